@@ -168,6 +168,7 @@ class WorkbenchConfig:
             #  well with batch operations, rather than having to fix it in real-time when one error is hit.
             'perform_soft_checks': False,
             'update_mode': 'replace',
+            'skip_unchanged_node_updates': False,
             'max_node_title_length': 255,
             'paged_content_from_directories': False,
             'delete_media_with_nodes': True,
@@ -186,6 +187,27 @@ class WorkbenchConfig:
             'user_agent': 'Islandora Workbench',
             'allow_redirects': True,
             'secure_ssl_only': True,
+            'http_pool_connections': 10,
+            'http_pool_maxsize': None,
+            'http_keep_alive': True,
+            'max_read_requests_per_second': None,
+            'read_request_burst': None,
+            'max_write_requests_per_second': None,
+            'write_request_burst': None,
+            'http_retries': 3,
+            'http_retry_status_codes': [429, 502, 503, 504],
+            'http_retry_backoff': 1,
+            'http_retry_max_backoff': 60,
+            'adaptive_concurrency': False,
+            'adaptive_concurrency_min': 1,
+            'adaptive_concurrency_window': 20,
+            'adaptive_concurrency_latency_threshold': 2,
+            'adaptive_concurrency_error_rate_threshold': 0.05,
+            'adaptive_concurrency_decrease_factor': 0.5,
+            'row_timings': False,
+            'row_timings_csv_path': None,
+            'row_timings_slowest_rows': 10,
+            'profile_collapsed_stacks': False,
             'google_sheets_csv_filename': 'google_sheet.csv',
             'google_sheets_gid': '0',
             'excel_worksheet': 'Sheet1',
@@ -197,11 +219,21 @@ class WorkbenchConfig:
             'field_for_remote_filename': False,
             'field_for_media_title': False,
             'delete_tmp_upload': False,
+            'download_chunk_size': 1048576,
+            'download_retries': 3,
+            'upload_chunk_size': 1048576,
+            'prefetch_remote_files': 0,
+            'prefetch_remote_files_max_bytes': 1073741824,
+            'cache_remote_file_metadata': False,
+            'remote_file_metadata_cache_max_age': 3600,
             'list_missing_drupal_fields': False,
             'secondary_tasks': None,
             'sqlite_db_filename': 'workbench_temp_data.db',
+            'cache_field_definitions': False,
             'fixity_algorithm': None,
             'validate_fixity_during_check': False,
+            'cache_file_hashes': False,
+            'hash_read_buffer_size': 4194304,
             'output_csv_include_input_csv': False,
             'timestamp_rollback': False,
             'rollback_dir': None,
@@ -209,6 +241,8 @@ class WorkbenchConfig:
             'http_cache_storage': 'memory',
             'http_cache_storage_expire_after': 1200,
             'validate_terms_exist': True,
+            'preload_vocabularies': False,
+            'pre_resolve_term_ids': False,
             'validate_parent_node_exists': True,
             'media_types': self.get_media_types(),
             'preprocessors': {},
@@ -220,6 +254,9 @@ class WorkbenchConfig:
             'media_fields': self.get_media_fields(),
             'delete_media_by_node_media_use_tids': [],
             'export_csv_term_mode': 'tid',
+            'export_prefetch_terms': False,
+            'view_prefetch_pages': 2,
+            'term_record_cache_size': 10000,
             'export_csv_file_path': None,
             'export_csv_field_list': [],
             'export_file_directory': None,
@@ -239,7 +276,13 @@ class WorkbenchConfig:
             'text_format_id': 'basic_html',
             'ignore_existing_parent_ids': True,
             'query_csv_id_to_node_id_map_for_parents': False,
-            'ignore_duplicate_parent_ids': True
+            'ignore_duplicate_parent_ids': True,
+            'csv_id_to_node_id_map_batch_size': 100,
+            'csv_id_to_node_id_map_flush_interval': 5,
+            'resume_journal': False,
+            'resume_journal_batch_size': 20,
+            'resume_journal_flush_interval': 2,
+            'max_workers': 1
         }
 
     # Tests validity and existence of configuration file path.
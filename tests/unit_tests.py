@@ -5,7 +5,19 @@ import sys
 import os
 from ruamel.yaml import YAML
 import collections
+import csv
 import tempfile
+import shutil
+import sqlite3
+import hashlib
+import json
+import http.server
+import threading
+import time
+import io
+import contextlib
+import pstats
+import requests_cache
 import unittest
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -521,6 +533,1176 @@ class TestSqliteManager(unittest.TestCase):
         os.remove(self.db_file_path)
 
 
+class TestGetHttpSession(unittest.TestCase):
+    def setUp(self):
+        self.config = {'http_pool_connections': 5, 'http_pool_maxsize': 5, 'http_keep_alive': True}
+        workbench_utils.http_sessions.clear()
+
+    def test_sessions_are_reused_per_host(self):
+        first = workbench_utils.get_http_session(self.config, 'https://islandora.example.com/node/1?_format=json')
+        second = workbench_utils.get_http_session(self.config, 'https://islandora.example.com/media/2?_format=json')
+        self.assertIs(first, second)
+
+        other_host = workbench_utils.get_http_session(self.config, 'https://files.example.com/foo.jpg')
+        self.assertIsNot(first, other_host)
+
+    def test_connection_counts(self):
+        workbench_utils.get_http_session(self.config, 'https://islandora.example.com/node/1?_format=json')
+        counts = workbench_utils.get_http_connection_counts()
+        self.assertEqual(counts, {'opened': 0, 'reused': 0})
+
+    def test_pool_maxsize_covers_workers(self):
+        config = {'max_workers': 16, 'view_prefetch_pages': 2, 'prefetch_remote_files': 5, 'http_pool_maxsize': None}
+        self.assertEqual(workbench_utils.get_http_pool_maxsize(config), 20)
+        config['max_workers'] = 1
+        self.assertEqual(workbench_utils.get_http_pool_maxsize(config), 10)
+        self.assertEqual(workbench_utils.get_http_pool_maxsize(self.config), 5)
+
+    def tearDown(self):
+        workbench_utils.http_sessions.clear()
+
+
+class TestBundleSchemaCache(unittest.TestCase):
+    def setUp(self):
+        self.config = {'host': 'https://islandora.example.com', 'content_type': 'islandora_object'}
+        workbench_utils.bundle_schema_cache[(self.config['host'], 'entity_fields', 'node', 'islandora_object')] = ['field_model', 'field_description']
+        workbench_utils.bundle_schema_cache[(self.config['host'], 'field_definitions', 'node', 'islandora_object')] = {'field_model': {'field_type': 'entity_reference'}}
+
+    def test_cached_lookups(self):
+        hits = workbench_utils.bundle_schema_cache_stats['hits']
+        fields = workbench_utils.get_entity_fields(self.config, 'node', 'islandora_object')
+        self.assertEqual(fields, ['field_model', 'field_description'])
+        field_definitions = workbench_utils.get_field_definitions(self.config, 'node')
+        self.assertEqual(field_definitions['field_model']['field_type'], 'entity_reference')
+        self.assertEqual(workbench_utils.bundle_schema_cache_stats['hits'], hits + 2)
+
+        # Callers can modify what they get back without changing the cached copy.
+        field_definitions['field_model']['field_type'] = 'string'
+        fields.append('field_foo')
+        self.assertEqual(workbench_utils.get_field_definitions(self.config, 'node')['field_model']['field_type'], 'entity_reference')
+        self.assertEqual(len(workbench_utils.get_entity_fields(self.config, 'node', 'islandora_object')), 2)
+
+    def tearDown(self):
+        workbench_utils.bundle_schema_cache.clear()
+
+
+class TestFieldDefinitionsCache(unittest.TestCase):
+    def setUp(self):
+        self.config = {'host': 'https://islandora.example.com',
+                       'temp_dir': tempfile.gettempdir(),
+                       'sqlite_db_filename': 'workbench_field_definitions_cache_unit_tests.db'
+                       }
+        self.db_file_path = os.path.join(self.config['temp_dir'], self.config['sqlite_db_filename'])
+        self.field_definitions = {'field_model': {'field_type': 'entity_reference', 'cardinality': 1, 'vocabularies': ['islandora_models']}}
+
+    def test_cache_write_read_and_clear(self):
+        workbench_utils.write_field_definitions_to_cache(self.config, 'node', 'islandora_object', '1.0.0:abc', self.field_definitions)
+        res = workbench_utils.get_field_definitions_from_cache(self.config, 'node', 'islandora_object', '1.0.0:abc')
+        self.assertDictEqual(res, self.field_definitions)
+
+        # A different fingerprint invalidates the cached copy.
+        res = workbench_utils.get_field_definitions_from_cache(self.config, 'node', 'islandora_object', '1.0.1:abc')
+        self.assertFalse(res)
+
+        workbench_utils.clear_field_definitions_cache(self.config)
+        res = workbench_utils.get_field_definitions_from_cache(self.config, 'node', 'islandora_object', '1.0.0:abc')
+        self.assertFalse(res)
+
+    def tearDown(self):
+        os.remove(self.db_file_path)
+
+
+class TestExecuteRowsInDependencyOrder(unittest.TestCase):
+    def setUp(self):
+        self.config = {'id_field': 'id', 'max_workers': 4}
+
+    def test_parents_processed_before_children(self):
+        rows = [
+            {'id': '1', 'parent_id': ''},
+            {'id': '2', 'parent_id': '1'},
+            {'id': '3', 'parent_id': '2'},
+            {'id': '4', 'parent_id': ''},
+            {'id': '5', 'parent_id': '4'},
+            {'id': '6', 'parent_id': '1'},
+            {'id': '7', 'parent_id': 'not_in_csv'}
+        ]
+        processed = []
+        workbench_utils.execute_rows_in_dependency_order(self.config, rows, lambda row: processed.append(row['id']))
+
+        self.assertEqual(sorted(processed), ['1', '2', '3', '4', '5', '6', '7'])
+        self.assertLess(processed.index('1'), processed.index('2'))
+        self.assertLess(processed.index('1'), processed.index('6'))
+        self.assertLess(processed.index('2'), processed.index('3'))
+        self.assertLess(processed.index('4'), processed.index('5'))
+
+    def test_circular_parents_are_processed(self):
+        rows = [
+            {'id': '1', 'parent_id': '2'},
+            {'id': '2', 'parent_id': '1'},
+            {'id': '3', 'parent_id': ''}
+        ]
+        processed = []
+        workbench_utils.execute_rows_in_dependency_order(self.config, rows, lambda row: processed.append(row['id']))
+        self.assertEqual(processed, ['3', '1', '2'])
+
+
+class TestExecuteRowsInOrder(unittest.TestCase):
+    def test_results_in_input_order(self):
+        rows = [{'id': str(i)} for i in range(20)]
+
+        def row_function(row):
+            # Later rows finish first.
+            time.sleep((20 - int(row['id'])) / 1000)
+            return row['id'] + ' done'
+
+        results = []
+        workbench_utils.execute_rows_in_order({'max_workers': 4}, rows, row_function, lambda row, result: results.append((row['id'], result)))
+        self.assertEqual(results, [(str(i), str(i) + ' done') for i in range(20)])
+
+
+class TestRunCsvValidationRules(unittest.TestCase):
+    def setUp(self):
+        self.config = {'id_field': 'id', 'task': 'create', 'subdelimiter': '|', 'perform_soft_checks': False}
+        self.field_definitions = {
+            'field_coordinates': {'field_type': 'geolocation', 'cardinality': -1},
+            'field_link': {'field_type': 'link', 'cardinality': 1},
+            'field_edtf_date': {'field_type': 'edtf', 'cardinality': -1}
+        }
+
+    def test_rules_share_one_pass(self):
+        csv_data = CountingDictReader([
+            {'id': '1', 'field_coordinates': '49.16667,-123.93333', 'field_link': 'http://example.com|http://example.org', 'field_edtf_date': '2020-01'},
+            {'id': '2', 'field_coordinates': '', 'field_link': 'https://example.com', 'field_edtf_date': '1964~'}
+        ])
+        rules = [
+            workbench_utils.GeolocationFieldsRule(self.config, self.field_definitions),
+            workbench_utils.LinkFieldsRule(self.config, self.field_definitions),
+            workbench_utils.EdtfFieldsRule(self.config, self.field_definitions),
+            workbench_utils.FieldCardinalityRule(self.config, self.field_definitions)
+        ]
+        workbench_utils.run_csv_validation_rules(self.config, csv_data, rules)
+        self.assertEqual(csv_data.passes, 1)
+        self.assertTrue(rules[0].geolocation_fields_present)
+        self.assertEqual(len(rules[3].warnings), 1)
+        self.assertIn('"field_link" in record with ID 1', rules[3].warnings[0])
+
+    def test_first_failing_rule_is_reported(self):
+        csv_data = CountingDictReader([
+            {'id': '1', 'field_coordinates': '49.16667,-123.93333', 'field_link': 'example.com', 'field_edtf_date': '2020-01'},
+            {'id': '2', 'field_coordinates': 'foo', 'field_link': 'https://example.com', 'field_edtf_date': 'bar'}
+        ])
+        rules = [
+            workbench_utils.GeolocationFieldsRule(self.config, self.field_definitions),
+            workbench_utils.LinkFieldsRule(self.config, self.field_definitions),
+            workbench_utils.EdtfFieldsRule(self.config, self.field_definitions)
+        ]
+        with self.assertRaises(SystemExit) as exit:
+            workbench_utils.run_csv_validation_rules(self.config, csv_data, rules)
+        self.assertEqual(str(exit.exception), 'Error: Value in field "field_coordinates" in row with ID 2 (foo) is not a valid lat,long pair.')
+        self.assertIsNotNone(rules[1].exit)
+        # The EDTF rule was not fed any rows after the link rule failed on row 1.
+        self.assertIsNone(rules[2].exit)
+
+    def test_warnings_are_printed_in_row_order(self):
+        self.field_definitions['field_description'] = {'field_type': 'string', 'cardinality': 1, 'max_length': 5}
+        csv_data = CountingDictReader([
+            {'id': '1', 'field_link': 'http://example.com|http://example.org', 'field_description': 'Too long'},
+            {'id': '2', 'field_link': 'http://example.com|http://example.org', 'field_description': 'Short'}
+        ])
+        rules = [
+            workbench_utils.CsvColumnCountRule(self.config, 3),
+            workbench_utils.FieldCardinalityRule(self.config, self.field_definitions),
+            workbench_utils.FieldLengthRule(self.config, self.field_definitions)
+        ]
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            workbench_utils.run_csv_validation_rules(self.config, csv_data, rules)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertIn('"field_link" in record with ID 1', lines[0])
+        self.assertIn('"field_description" in record with ID 1', lines[1])
+        self.assertIn('"field_link" in record with ID 2', lines[2])
+        self.assertEqual(lines[3], 'OK, all 2 rows in the CSV file have the same number of columns as there are headers (3).')
+        self.assertEqual(csv_data.passes, 1)
+
+    def test_empty_csv_is_an_error(self):
+        csv_data = CountingDictReader([{'id': '1'}])
+        csv_data.rows = []
+        config = dict(self.config, input_csv='empty.csv')
+        with self.assertRaises(SystemExit) as exit:
+            workbench_utils.run_csv_validation_rules(config, csv_data, [workbench_utils.CsvColumnCountRule(config, 1)])
+        self.assertEqual(str(exit.exception), 'Error: Input CSV file empty.csv has 0 rows.')
+
+
+class CountingDictReader():
+    """Stands in for the csv.DictReader returned by get_csv_data(), counting how many
+       times it is iterated over.
+    """
+    def __init__(self, rows):
+        self.rows = rows
+        self.fieldnames = list(rows[0].keys())
+        self.passes = 0
+
+    def __iter__(self):
+        self.passes += 1
+        return iter(self.rows)
+
+
+class TestTermIndex(unittest.TestCase):
+    def setUp(self):
+        self.config = {'host': 'https://islandora.example.com'}
+        workbench_utils.add_term_to_index('subjects', 10, 'Photographs', 'http://id.loc.gov/authorities/subjects/sh85101206')
+        workbench_utils.add_term_to_index('subjects', 11, 'Maps')
+        workbench_utils.add_term_to_index('subjects', 12, 'maps')
+        workbench_utils.term_index['vocabularies'].add('subjects')
+
+    def test_lookups_served_from_index(self):
+        self.assertEqual(workbench_utils.find_term_in_vocab(self.config, 'subjects', ' photographs '), 10)
+        # The first term with a given name is used.
+        self.assertEqual(workbench_utils.find_term_in_vocab(self.config, 'subjects', 'Maps'), 11)
+        # Vocabulary is loaded, so a missing term doesn't need a request to Drupal.
+        self.assertFalse(workbench_utils.find_term_in_vocab(self.config, 'subjects', 'Postcards'))
+
+        self.assertEqual(workbench_utils.get_term_vocab(self.config, '10'), 'subjects')
+        self.assertEqual(workbench_utils.get_term_name(self.config, 11), 'Maps')
+        self.assertEqual(workbench_utils.get_term_uri(self.config, 10), 'http://id.loc.gov/authorities/subjects/sh85101206')
+        self.assertIsNone(workbench_utils.get_term_uri(self.config, 11))
+        self.assertEqual(workbench_utils.get_term_id_from_uri(self.config, 'http://id.loc.gov/authorities/subjects/sh85101206'), 10)
+
+    def tearDown(self):
+        for index in workbench_utils.term_index.values():
+            index.clear()
+
+
+class TestPreResolveTermIds(unittest.TestCase):
+    def setUp(self):
+        self.config = {'host': 'https://islandora.example.com', 'task': 'create', 'log_term_creation': False, 'subdelimiter': '|', 'max_workers': 2}
+        self.field_definitions = {
+            'field_subject': {'field_type': 'entity_reference', 'target_type': 'taxonomy_term', 'vocabularies': ['subjects']},
+            'field_linked_agent': {'field_type': 'typed_relation', 'target_type': 'taxonomy_term', 'vocabularies': ['subjects']},
+            'field_description': {'field_type': 'string'}
+        }
+        workbench_utils.add_term_to_index('subjects', 10, 'Photographs')
+        workbench_utils.add_term_to_index('subjects', 11, 'Maps')
+        workbench_utils.term_index['vocabularies'].add('subjects')
+
+    def test_distinct_values_resolved(self):
+        csv_data = CountingDictReader([
+            {'id': '1', 'field_subject': 'Maps|Photographs', 'field_linked_agent': 'relators:pht:Maps', 'field_description': 'Maps'},
+            {'id': '2', 'field_subject': ' Maps', 'field_linked_agent': '', 'field_description': ''},
+            {'id': '3', 'field_subject': '25', 'field_linked_agent': 'relators:pht:subjects:Photographs', 'field_description': ''}
+        ])
+        resolved = workbench_utils.pre_resolve_term_ids(self.config, self.field_definitions, csv_data)
+        self.assertEqual(dict(resolved), {
+            ('field_subject', ('subjects',), 'Maps'): 11,
+            ('field_subject', ('subjects',), 'Photographs'): 10,
+            ('field_linked_agent', ('subjects',), 'Maps'): 11,
+            ('field_linked_agent', ('subjects',), 'subjects:Photographs'): 10
+        })
+        with self.assertRaises(TypeError):
+            resolved[('field_subject', ('subjects',), 'Maps')] = 12
+
+        # prepare_term_id() no longer needs the term index (or Drupal) for these values.
+        for index in workbench_utils.term_index.values():
+            index.clear()
+        self.assertEqual(workbench_utils.prepare_term_id(self.config, ['subjects'], 'field_subject', 'Maps '), 11)
+
+    def tearDown(self):
+        for index in workbench_utils.term_index.values():
+            index.clear()
+        workbench_utils.resolved_term_ids.clear()
+
+
+class TestCsvIdToNodeIdMap(unittest.TestCase):
+    def setUp(self):
+        self.config = {'temp_dir': tempfile.gettempdir(),
+                       'csv_id_to_node_id_map_path': os.path.join(tempfile.gettempdir(), 'csv_id_to_node_id_map_unit_tests.db'),
+                       'config_file': 'create.yml',
+                       'csv_id_to_node_id_map_batch_size': 3,
+                       'csv_id_to_node_id_map_flush_interval': 1000
+                       }
+        workbench_utils.prepare_csv_id_to_node_id_map(self.config)
+
+    def count_rows_in_database(self):
+        connection = sqlite3.connect(self.config['csv_id_to_node_id_map_path'])
+        count = connection.execute("SELECT COUNT(*) FROM csv_id_to_node_id_map").fetchone()[0]
+        connection.close()
+        return count
+
+    def test_batched_writes_and_lookups(self):
+        workbench_utils.populate_csv_id_to_node_id_map(self.config, '', '', 'parent', '1')
+        workbench_utils.populate_csv_id_to_node_id_map(self.config, 'parent', '1', 'child', '2')
+        self.assertEqual(self.count_rows_in_database(), 0)
+        # Entries not yet written to the database are still visible to lookups.
+        self.assertEqual(workbench_utils.get_node_ids_from_csv_id_to_node_id_map(self.config, 'parent'), ['1'])
+        self.assertEqual(self.count_rows_in_database(), 2)
+
+        workbench_utils.populate_csv_id_to_node_id_map(self.config, '', '', 'parent', '3')
+        self.assertEqual(workbench_utils.get_node_ids_from_csv_id_to_node_id_map(self.config, 'parent'), ['1', '3'])
+        self.assertEqual(workbench_utils.get_node_ids_from_csv_id_to_node_id_map(self.config, 'parent', latest_only=True), ['3'])
+        self.assertEqual(workbench_utils.get_node_ids_from_csv_id_to_node_id_map(self.config, 'parent', column='parent_csv_id'), ['2'])
+        self.assertEqual(workbench_utils.get_node_ids_from_csv_id_to_node_id_map(self.config, 'foo'), [])
+
+        workbench_utils.close_csv_id_to_node_id_map()
+        self.assertEqual(self.count_rows_in_database(), 3)
+
+    def test_indexes_exist(self):
+        connection = sqlite3.connect(self.config['csv_id_to_node_id_map_path'])
+        indexes = [row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")]
+        connection.close()
+        for column in ['csv_id', 'parent_csv_id', 'config_file']:
+            self.assertIn('csv_id_to_node_id_map_' + column, indexes)
+
+    def tearDown(self):
+        workbench_utils.close_csv_id_to_node_id_map()
+        os.remove(self.config['csv_id_to_node_id_map_path'])
+
+
+class TestResumeJournal(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = {'temp_dir': self.temp_dir, 'config_file': 'create.yml', 'task': 'create', 'id_field': 'id',
+                       'resume_journal': True, 'resume_journal_batch_size': 3, 'resume_journal_flush_interval': 60}
+
+    def test_resume_journal(self):
+        workbench_utils.prepare_resume_journal(self.config)
+        row_key = workbench_utils.get_resume_journal_key(self.config, {'id': '001', 'title': 'Foo'})
+        workbench_utils.record_resume_journal_stage(self.config, row_key, 'node_created', 10)
+        workbench_utils.record_resume_journal_stage(self.config, row_key, 'file_uploaded:file', 20)
+        self.assertEqual(workbench_utils.get_resume_journal_stage(row_key, 'node_created'), '10')
+
+        # Stages are written to the journal in batches.
+        db_path = workbench_utils.get_resume_journal_path(self.config)
+        self.assertEqual(workbench_utils.sqlite_manager(self.config, operation='select', query='SELECT * FROM resume_journal', db_file_path=db_path), [])
+        workbench_utils.record_resume_journal_stage(self.config, row_key, 'media_created:file')
+        self.assertEqual(len(workbench_utils.sqlite_manager(self.config, operation='select', query='SELECT * FROM resume_journal', db_file_path=db_path)), 3)
+
+        workbench_utils.record_resume_journal_stage(self.config, row_key, 'row_completed')
+        workbench_utils.close_resume_journal()
+        self.assertIsNone(workbench_utils.get_resume_journal_stage(row_key, 'node_created'))
+
+        workbench_utils.prepare_resume_journal(self.config, resume=True)
+        self.assertEqual(workbench_utils.get_resume_journal_stage(row_key, 'file_uploaded:file'), '20')
+        self.assertEqual(workbench_utils.get_resume_journal_stage(row_key, 'row_completed'), '')
+
+        # Starting a run without resuming empties the journal.
+        workbench_utils.prepare_resume_journal(self.config)
+        self.assertIsNone(workbench_utils.get_resume_journal_stage(row_key, 'row_completed'))
+
+    def test_row_keys(self):
+        self.assertEqual(workbench_utils.get_resume_journal_key(self.config, {'id': '001', 'title': 'Foo'}), '001')
+        self.config['task'] = 'add_media'
+        self.config['id_field'] = 'node_id'
+        first_key = workbench_utils.get_resume_journal_key(self.config, {'node_id': '5', 'file': 'one.jpg'})
+        second_key = workbench_utils.get_resume_journal_key(self.config, {'node_id': '5', 'file': 'two.jpg'})
+        self.assertNotEqual(first_key, second_key)
+        self.config['resume_journal'] = False
+        self.assertIsNone(workbench_utils.get_resume_journal_key(self.config, {'node_id': '5', 'file': 'one.jpg'}))
+
+    def tearDown(self):
+        workbench_utils.close_resume_journal()
+        shutil.rmtree(self.temp_dir)
+
+
+class TestFileHashes(unittest.TestCase):
+    def setUp(self):
+        self.config = {'temp_dir': tempfile.gettempdir(),
+                       'sqlite_db_filename': 'file_hashes_unit_tests.db',
+                       'cache_file_hashes': False,
+                       'hash_read_buffer_size': 7,
+                       'upload_chunk_size': 1
+                       }
+        self.file_path = os.path.join(tempfile.gettempdir(), 'file_hashes_unit_tests.bin')
+        self.file_contents = b'Islandora Workbench fixity test file contents.' * 10
+        with open(self.file_path, 'wb') as file:
+            file.write(self.file_contents)
+        workbench_utils.file_hash_cache.clear()
+
+    def test_get_file_hashes(self):
+        hashes = workbench_utils.get_file_hashes(self.config, self.file_path, ['md5', 'sha1', 'sha256'])
+        self.assertEqual(hashes['md5'], hashlib.md5(self.file_contents).hexdigest())
+        self.assertEqual(hashes['sha1'], hashlib.sha1(self.file_contents).hexdigest())
+        self.assertEqual(hashes['sha256'], hashlib.sha256(self.file_contents).hexdigest())
+        self.assertEqual(workbench_utils.get_file_hash_from_local(self.config, self.file_path, 'md5'), hashes['md5'])
+        self.assertEqual(len(workbench_utils.file_hash_cache), 3)
+
+    def test_persistent_cache(self):
+        self.config['cache_file_hashes'] = True
+        md5 = workbench_utils.get_file_hash_from_local(self.config, self.file_path, 'md5')
+        # A later session gets the hash from the SQLite database.
+        workbench_utils.file_hash_cache.clear()
+        file_stat = os.stat(self.file_path)
+        file_key = (os.path.abspath(self.file_path), file_stat.st_size, file_stat.st_mtime_ns)
+        self.assertEqual(workbench_utils.get_file_hash_from_cache(self.config, file_key, 'md5'), md5)
+        # Changing the file invalidates its cached hash.
+        with open(self.file_path, 'ab') as file:
+            file.write(b'More contents.')
+        self.assertNotEqual(workbench_utils.get_file_hash_from_local(self.config, self.file_path, 'md5'), md5)
+
+    def test_hashing_file_reader(self):
+        reader = workbench_utils.HashingFileReader(self.config, open(self.file_path, 'rb'), ['md5', 'sha256'])
+        reader.read(10)
+        self.assertFalse(reader.get_hashes())
+        # Seeking back to the start of the file starts the hashes over.
+        reader.seek(0)
+        while reader.read(100):
+            pass
+        hashes = reader.get_hashes()
+        reader.close()
+        self.assertEqual(hashes['md5'], hashlib.md5(self.file_contents).hexdigest())
+        self.assertEqual(hashes['sha256'], hashlib.sha256(self.file_contents).hexdigest())
+
+    def tearDown(self):
+        workbench_utils.file_hash_cache.clear()
+        os.remove(self.file_path)
+        db_path = os.path.join(self.config['temp_dir'], self.config['sqlite_db_filename'])
+        if os.path.exists(db_path):
+            os.remove(db_path)
+
+
+class QuietHTTPRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Request handler for the in-process HTTP servers used in tests; doesn't log requests to stderr.
+    """
+    def log_message(self, format, *args):
+        pass
+
+
+class HttpServerTestCase(unittest.TestCase):
+    """Base class for tests that need an in-process HTTP server.
+    """
+    def start_http_server(self, handler_class, threaded=False):
+        """Starts an HTTP server on a free local port that is shut down when the test finishes.
+        """
+        """Parameters
+            ----------
+            handler_class : QuietHTTPRequestHandler
+                The request handler class.
+            threaded : bool
+                Whether to handle each request in its own thread.
+            Returns
+            -------
+            string
+                The server's base URL, e.g. 'http://127.0.0.1:8000'.
+        """
+        server_class = http.server.ThreadingHTTPServer if threaded else http.server.HTTPServer
+        self.server = server_class(('127.0.0.1', 0), handler_class)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        return f'http://127.0.0.1:{self.server.server_port}'
+
+
+class TestStreamFileToDisk(HttpServerTestCase):
+    """Downloads from a local HTTP server that drops the first connection partway through the file.
+    """
+    def setUp(self):
+        file_contents = os.urandom(100000)
+        range_headers = []
+        self.file_contents = file_contents
+        self.range_headers = range_headers
+
+        class Handler(QuietHTTPRequestHandler):
+            def do_GET(self):
+                range_header = self.headers.get('Range')
+                range_headers.append(range_header)
+                if range_header is None:
+                    self.send_response(200)
+                    self.send_header('Content-Length', str(len(file_contents)))
+                    self.end_headers()
+                    self.wfile.write(file_contents[:40000])
+                    self.close_connection = True
+                else:
+                    start = int(range_header.split('=')[1].rstrip('-'))
+                    self.send_response(206)
+                    self.send_header('Content-Range', f'bytes {start}-{len(file_contents) - 1}/{len(file_contents)}')
+                    self.send_header('Content-Length', str(len(file_contents) - start))
+                    self.end_headers()
+                    self.wfile.write(file_contents[start:])
+
+        self.base_url = self.start_http_server(Handler)
+        self.config = {'secure_ssl_only': False, 'download_chunk_size': 8192, 'download_retries': 2}
+        self.file_path = os.path.join(tempfile.gettempdir(), 'stream_file_to_disk_unit_tests.bin')
+
+    def test_resume_interrupted_download(self):
+        url = self.base_url + '/file.bin'
+        self.assertTrue(workbench_utils.stream_file_to_disk(self.config, url, self.file_path))
+        self.assertEqual(len(self.range_headers), 2)
+        self.assertIsNone(self.range_headers[0])
+        self.assertTrue(self.range_headers[1].startswith('bytes='))
+        with open(self.file_path, 'rb') as f:
+            self.assertEqual(f.read(), self.file_contents)
+        self.assertFalse(os.path.exists(self.file_path + '.part'))
+
+    def tearDown(self):
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)
+
+
+class TestRemoteFilePrefetch(HttpServerTestCase):
+    def setUp(self):
+        requested_paths = []
+        self.requested_paths = requested_paths
+
+        class Handler(QuietHTTPRequestHandler):
+            def do_GET(self):
+                requested_paths.append(self.path)
+                body = self.path.encode() * 100
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_HEAD(self):
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(self.path.encode() * 100)))
+                self.end_headers()
+
+        self.base_url = self.start_http_server(Handler, threaded=True)
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = {'temp_dir': self.temp_dir, 'id_field': 'id', 'nodes_only': False, 'max_workers': 1,
+                       'secure_ssl_only': False, 'prefetch_remote_files': 2, 'prefetch_remote_files_max_bytes': 1000000,
+                       'oembed_providers': [{'remote_video': ['https://www.youtube.com/']}]}
+
+    def test_prefetch(self):
+        base_url = self.base_url
+        rows = [{'id': '1', 'file': base_url + '/one.jpg'},
+                {'id': '2', 'file': 'local.jpg'},
+                {'id': '3', 'file': 'https://www.youtube.com/watch?v=xxx'},
+                {'id': '4', 'file': base_url + '/four.jpg'},
+                {'id': '5', 'file': base_url + '/five.jpg'}]
+        self.assertTrue(workbench_utils.start_remote_file_prefetch(self.config, rows))
+        self.wait_for_downloads(2)
+
+        for row in [rows[0], rows[3]]:
+            path = workbench_utils.claim_prefetched_remote_file(self.config, row['file'], 'file', row)
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), row['file'].replace(base_url, '').encode() * 100)
+        # Files that aren't remote aren't prefetched.
+        self.assertFalse(workbench_utils.claim_prefetched_remote_file(self.config, 'local.jpg', 'file', rows[1]))
+
+        workbench_utils.stop_remote_file_prefetch()
+        # Each file is downloaded once; the oEmbed URL is not downloaded.
+        self.assertEqual(len(self.requested_paths), len(set(self.requested_paths)))
+        self.assertNotIn('/watch?v=xxx', self.requested_paths)
+
+    def test_max_bytes_includes_download_in_progress(self):
+        # Each file is 800 bytes, so the second one doesn't fit while the first is unclaimed.
+        self.config['prefetch_remote_files_max_bytes'] = 1000
+        rows = [{'id': '1', 'file': self.base_url + '/one.jpg'}, {'id': '2', 'file': self.base_url + '/two.jpg'}]
+        workbench_utils.start_remote_file_prefetch(self.config, rows)
+        self.wait_for_downloads(1)
+        time.sleep(0.2)
+        self.assertEqual(self.requested_paths, ['/one.jpg'])
+        self.assertEqual(workbench_utils.remote_file_prefetch['unclaimed_bytes'], 800)
+
+        self.assertTrue(workbench_utils.claim_prefetched_remote_file(self.config, rows[0]['file'], 'file', rows[0]))
+        self.wait_for_downloads(2)
+        self.assertEqual(self.requested_paths, ['/one.jpg', '/two.jpg'])
+        self.assertEqual(workbench_utils.remote_file_prefetch['unclaimed_bytes'], 800)
+
+    def test_stop_waits_for_download(self):
+        rows = [{'id': '1', 'file': self.base_url + '/one.jpg'}]
+        workbench_utils.start_remote_file_prefetch(self.config, rows)
+        thread = workbench_utils.remote_file_prefetch['thread']
+        workbench_utils.stop_remote_file_prefetch()
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(os.path.exists(workbench_utils.remote_file_prefetch['directory']))
+
+    def wait_for_downloads(self, count):
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            with workbench_utils.remote_file_prefetch['condition']:
+                entries = workbench_utils.remote_file_prefetch['entries'].values()
+                if len([entry for entry in entries if entry['status'] != 'downloading']) >= count:
+                    return
+            time.sleep(0.01)
+        self.fail(f'{count} prefetched files were not downloaded.')
+
+    def tearDown(self):
+        workbench_utils.stop_remote_file_prefetch()
+        shutil.rmtree(self.temp_dir)
+
+
+class TestRemoteFileMetadataCache(HttpServerTestCase):
+    def setUp(self):
+        head_requests = []
+        self.head_requests = head_requests
+
+        class Handler(QuietHTTPRequestHandler):
+            def do_HEAD(self):
+                head_requests.append(self.path)
+                self.send_response(200)
+                self.send_header('Content-Type', 'image/jpeg; charset=binary')
+                self.send_header('Content-Length', '1234')
+                self.send_header('ETag', '"abc"')
+                self.end_headers()
+
+        self.base_url = self.start_http_server(Handler)
+        self.config = {'temp_dir': tempfile.gettempdir(), 'sqlite_db_filename': 'remote_file_metadata_unit_tests.db',
+                       'secure_ssl_only': False, 'cache_remote_file_metadata': False, 'mimetype_extensions': {}}
+        self.url = self.base_url + '/datastream/OBJ/download'
+        workbench_utils.remote_file_metadata_cache.clear()
+
+    def test_one_request_per_url(self):
+        self.assertEqual(workbench_utils.ping_remote_file(self.config, self.url), 200)
+        self.assertEqual(workbench_utils.ping_remote_file(self.config, self.url), 200)
+        self.assertTrue(workbench_utils.check_file_exists(self.config, self.url))
+        self.assertEqual(workbench_utils.get_remote_file_extension(self.config, self.url), '.jpg')
+        self.assertEqual(len(self.head_requests), 1)
+        metadata = workbench_utils.get_remote_file_metadata(self.config, self.url)
+        self.assertEqual(metadata['content_length'], 1234)
+        self.assertEqual(metadata['etag'], '"abc"')
+
+    def test_persistent_cache(self):
+        self.config['cache_remote_file_metadata'] = True
+        workbench_utils.get_remote_file_metadata(self.config, self.url)
+        # A later session gets the metadata from the SQLite database.
+        workbench_utils.remote_file_metadata_cache.clear()
+        self.assertEqual(workbench_utils.get_remote_file_metadata(self.config, self.url)['status_code'], 200)
+        self.assertEqual(len(self.head_requests), 1)
+
+    def tearDown(self):
+        workbench_utils.remote_file_metadata_cache.clear()
+        db_path = os.path.join(self.config['temp_dir'], self.config['sqlite_db_filename'])
+        if os.path.exists(db_path):
+            os.remove(db_path)
+
+
+class TestFileUploads(HttpServerTestCase):
+    def setUp(self):
+        received = dict()
+        self.received = received
+
+        class Handler(QuietHTTPRequestHandler):
+            def do_POST(self):
+                received['body'] = self.rfile.read(int(self.headers['Content-Length']))
+                self.send_response(201)
+                self.end_headers()
+                self.wfile.write(b'{}')
+
+        self.base_url = self.start_http_server(Handler)
+        self.config = {'host': self.base_url, 'username': 'admin', 'password': 'password',
+                       'check': False, 'user_agent': 'Islandora Workbench', 'allow_redirects': True, 'secure_ssl_only': False,
+                       'log_request_url': False, 'log_headers': False, 'log_json': False, 'log_response_status_code': False,
+                       'log_response_body': False, 'log_response_time': False, 'log_response_time_sample': False,
+                       'upload_chunk_size': 65536}
+        self.file_path = os.path.join(tempfile.gettempdir(), 'file_uploads_unit_tests.bin')
+        self.file_contents = os.urandom(300000)
+        with open(self.file_path, 'wb') as file:
+            file.write(self.file_contents)
+        requests_cache.install_cache(backend='memory')
+
+    def test_upload_is_streamed_and_hashed(self):
+        read_sizes = []
+        binary_data = workbench_utils.HashingFileReader(self.config, open(self.file_path, 'rb'), ['md5'])
+        original_read = binary_data.file.read
+
+        def read(size=-1):
+            read_sizes.append(size)
+            return original_read(size)
+
+        binary_data.file.read = read
+        with binary_data:
+            response = workbench_utils.issue_request(self.config, 'POST', '/file/upload', {'Content-Type': 'application/octet-stream'}, '', binary_data)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.received['body'], self.file_contents)
+        self.assertTrue(binary_data.file.closed)
+        # The HTTP cache didn't read the whole file at once, and the file was read in upload_chunk_size chunks.
+        self.assertNotIn(-1, read_sizes)
+        self.assertEqual(read_sizes[0], 65536)
+        self.assertEqual(binary_data.get_hashes()['md5'], hashlib.md5(self.file_contents).hexdigest())
+
+    def tearDown(self):
+        requests_cache.uninstall_cache()
+        workbench_utils.file_hash_cache.clear()
+        workbench_utils.http_sessions.clear()
+        os.remove(self.file_path)
+
+
+class TestDownloadFileFromDrupal(HttpServerTestCase):
+    def setUp(self):
+        class Handler(QuietHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.startswith('/node/'):
+                    base_url = f'http://127.0.0.1:{self.server.server_port}'
+                    filename = 'missing.jpg' if self.path.startswith('/node/2/') else 'image.jpg'
+                    body = json.dumps([{'field_media_image': [{'url': base_url + '/files/' + filename}],
+                                        'field_media_use': [{'target_id': 17}]}]).encode()
+                elif self.path == '/files/image.jpg':
+                    body = b'image'
+                else:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.base_url = self.start_http_server(Handler, threaded=True)
+        self.export_dir = tempfile.mkdtemp()
+        self.config = {'host': self.base_url, 'username': 'admin', 'password': 'password',
+                       'check': False, 'user_agent': 'Islandora Workbench', 'allow_redirects': True, 'secure_ssl_only': False,
+                       'log_request_url': False, 'log_headers': False, 'log_json': False, 'log_response_status_code': False,
+                       'log_response_body': False, 'log_response_time': False, 'log_response_time_sample': False,
+                       'export_file_directory': self.export_dir, 'export_file_media_use_term_id': 17, 'download_retries': 0}
+
+    def test_existing_file_is_not_overwritten(self):
+        with open(os.path.join(self.export_dir, 'image.jpg'), 'w') as f:
+            f.write('existing')
+        self.assertEqual(workbench_utils.download_file_from_drupal(self.config, 1), os.path.join(self.export_dir, 'image_1.jpg'))
+        self.assertEqual(workbench_utils.download_file_from_drupal(self.config, 1), os.path.join(self.export_dir, 'image_2.jpg'))
+        with open(os.path.join(self.export_dir, 'image.jpg')) as f:
+            self.assertEqual(f.read(), 'existing')
+
+    def test_failed_download_leaves_no_file(self):
+        self.assertFalse(workbench_utils.download_file_from_drupal(self.config, 2))
+        self.assertEqual(os.listdir(self.export_dir), [])
+
+    def tearDown(self):
+        workbench_utils.http_sessions.clear()
+        shutil.rmtree(self.export_dir)
+
+
+class TestGetChangedNodeFields(unittest.TestCase):
+    def setUp(self):
+        self.node_field_values = {
+            'type': [{'target_id': 'islandora_object', 'target_type': 'node_type'}],
+            'title': [{'value': 'Test node'}],
+            'status': [{'value': True}],
+            'field_subject': [{'target_id': 10, 'target_type': 'taxonomy_term', 'target_uuid': 'abc', 'url': '/taxonomy/term/10'}],
+            'field_description': [{'value': 'A description.', 'format': 'basic_html', 'processed': '<p>A description.</p>'}]
+        }
+
+    def test_unchanged(self):
+        node = {
+            'type': [{'target_id': 'islandora_object'}],
+            'title': [{'value': 'Test node'}],
+            'status': [{'value': '1'}],
+            'field_subject': [{'target_id': '10', 'target_type': 'taxonomy_term'}],
+            'field_description': [{'value': 'A description.', 'format': 'basic_html'}]
+        }
+        self.assertEqual(workbench_utils.get_changed_node_fields(node, self.node_field_values), {})
+
+    def test_changed(self):
+        node = {
+            'type': [{'target_id': 'islandora_object'}],
+            'title': [{'value': 'Test node'}],
+            'status': [{'value': '0'}],
+            'field_subject': [{'target_id': '10', 'target_type': 'taxonomy_term'}, {'target_id': '11', 'target_type': 'taxonomy_term'}],
+            'field_description': []
+        }
+        changed_fields = workbench_utils.get_changed_node_fields(node, self.node_field_values)
+        self.assertEqual(sorted(changed_fields.keys()), ['field_description', 'field_subject', 'status'])
+
+    def test_whitespace_only_change(self):
+        node = {
+            'type': [{'target_id': 'islandora_object'}],
+            'title': [{'value': 'Test node '}],
+            'field_description': [{'value': 'A  description.', 'format': 'basic_html'}]
+        }
+        changed_fields = workbench_utils.get_changed_node_fields(node, self.node_field_values)
+        self.assertEqual(sorted(changed_fields.keys()), ['field_description', 'title'])
+
+
+class TestTermRecordCache(HttpServerTestCase):
+    def setUp(self):
+        requested_paths = []
+        self.requested_paths = requested_paths
+
+        class Handler(QuietHTTPRequestHandler):
+            def do_GET(self):
+                requested_paths.append(self.path)
+                term_id = self.path.split('/')[-1].split('?')[0]
+                if term_id == '99':
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = json.dumps({'tid': [{'value': int(term_id)}], 'vid': [{'target_id': 'subjects'}], 'name': [{'value': 'Term ' + term_id}],
+                                   'field_external_uri': [{'uri': 'http://example.com/' + term_id}]}).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.base_url = self.start_http_server(Handler, threaded=True)
+        self.config = {'host': self.base_url, 'username': 'admin', 'password': 'password',
+                       'check': False, 'user_agent': 'Islandora Workbench', 'allow_redirects': True, 'secure_ssl_only': False,
+                       'log_request_url': False, 'log_headers': False, 'log_json': False, 'log_response_status_code': False,
+                       'log_response_body': False, 'log_response_time': False, 'log_response_time_sample': False,
+                       'term_record_cache_size': 3, 'max_workers': 3}
+        workbench_utils.term_record_cache.clear()
+
+    def test_one_request_per_term(self):
+        self.assertTrue(workbench_utils.ping_term(self.config, 1))
+        self.assertEqual(workbench_utils.get_term_vocab(self.config, 1), 'subjects')
+        self.assertEqual(workbench_utils.get_term_name(self.config, '1'), 'Term 1')
+        self.assertEqual(workbench_utils.get_term_uri(self.config, 1), 'http://example.com/1')
+        self.assertFalse(workbench_utils.ping_term(self.config, 99))
+        self.assertFalse(workbench_utils.get_term_name(self.config, 99))
+        self.assertEqual(len(self.requested_paths), 2)
+
+    def test_lru_eviction_and_prefetch(self):
+        workbench_utils.prefetch_term_records(self.config, [1, 2, 3])
+        self.assertEqual(len(self.requested_paths), 3)
+        # Prefetched terms are cached in the order their requests complete.
+        for term_id in [2, 3, 1, 4]:
+            workbench_utils.get_term_name(self.config, term_id)
+        self.assertEqual(len(self.requested_paths), 4)
+        # Term 2 was the least recently used.
+        self.assertEqual(list(workbench_utils.term_record_cache.keys()), ['3', '1', '4'])
+
+    def test_prefetch_reuses_executor(self):
+        workbench_utils.prefetch_term_records(self.config, [1])
+        executor = workbench_utils.term_prefetch_executor['executor']
+        workbench_utils.prefetch_term_records(self.config, [1, 2])
+        self.assertIs(workbench_utils.term_prefetch_executor['executor'], executor)
+        self.assertEqual(len(self.requested_paths), 2)
+
+    def test_prefetch_inline_with_one_worker(self):
+        self.config['max_workers'] = 1
+        workbench_utils.term_prefetch_executor['executor'] = None
+        workbench_utils.prefetch_term_records(self.config, [3, 1, 2])
+        self.assertIsNone(workbench_utils.term_prefetch_executor['executor'])
+        self.assertEqual(sorted(workbench_utils.term_record_cache.keys()), ['1', '2', '3'])
+
+    def tearDown(self):
+        workbench_utils.term_record_cache.clear()
+
+
+class TestGetViewPages(HttpServerTestCase):
+    def setUp(self):
+        requested_pages = []
+        self.requested_pages = requested_pages
+
+        class Handler(QuietHTTPRequestHandler):
+            def do_GET(self):
+                page = int(self.path.split('page=')[1].split('&')[0])
+                requested_pages.append(page)
+                if page == 1:
+                    self.send_response(500)
+                    self.end_headers()
+                    return
+                nodes = [{'nid': [{'value': page * 10 + i}]} for i in range(2)] if page < 3 else []
+                body = json.dumps(nodes).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.base_url = self.start_http_server(Handler, threaded=True)
+        self.config = {'host': self.base_url, 'username': 'admin', 'password': 'password',
+                       'check': False, 'user_agent': 'Islandora Workbench', 'allow_redirects': True, 'secure_ssl_only': False,
+                       'log_request_url': False, 'log_headers': False, 'log_json': False, 'log_response_status_code': False,
+                       'log_response_body': False, 'log_response_time': False, 'log_response_time_sample': False}
+        self.view_url = self.config['host'] + '/export?page='
+
+    def test_pages_in_order(self):
+        for prefetch_pages in [0, 4]:
+            self.config['view_prefetch_pages'] = prefetch_pages
+            pages = [(page, response.status_code, nodes) for page, response, nodes in workbench_utils.get_view_pages(self.config, self.view_url, '_format=json')]
+            self.assertEqual([page[0] for page in pages], [0, 1, 2])
+            self.assertEqual(pages[1][1:], (500, None))
+            self.assertEqual([node['nid'][0]['value'] for node in pages[2][2]], [20, 21])
+        # Without prefetching, no pages after the first empty one are requested.
+        self.assertEqual(self.requested_pages[:4], [0, 1, 2, 3])
+
+
+class TestIssueRequestRetries(HttpServerTestCase):
+    def setUp(self):
+        requests_received = []
+        self.requests_received = requests_received
+
+        class Handler(QuietHTTPRequestHandler):
+            def respond(self):
+                requests_received.append((self.command, self.path))
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                attempts = len([request for request in requests_received if request == (self.command, self.path)])
+                if self.path.startswith('/unavailable') and attempts < 3:
+                    self.send_response(503)
+                    self.send_header('Retry-After', '0')
+                elif self.path.startswith('/throttled') and attempts < 2:
+                    self.send_response(429)
+                elif self.path.startswith('/gateway'):
+                    self.send_response(504)
+                else:
+                    self.send_response(200)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            do_GET = respond
+            do_POST = respond
+
+        self.base_url = self.start_http_server(Handler, threaded=True)
+        self.config = {'host': self.base_url, 'username': 'admin', 'password': 'password',
+                       'check': False, 'user_agent': 'Islandora Workbench', 'allow_redirects': True, 'secure_ssl_only': False,
+                       'log_request_url': False, 'log_headers': False, 'log_json': False, 'log_response_status_code': False,
+                       'log_response_body': False, 'log_response_time': False, 'log_response_time_sample': False,
+                       'http_retries': 3, 'http_retry_status_codes': [429, 502, 503, 504], 'http_retry_backoff': 0.01, 'http_retry_max_backoff': 0.05}
+        workbench_utils.http_request_counters.clear()
+
+    def test_retries(self):
+        self.assertEqual(workbench_utils.issue_request(self.config, 'GET', '/unavailable').status_code, 200)
+        self.assertEqual(len(self.requests_received), 3)
+        # POST requests are not retried after a 503, only after a 429.
+        self.assertEqual(workbench_utils.issue_request(self.config, 'POST', '/unavailable', json={}).status_code, 503)
+        self.assertEqual(workbench_utils.issue_request(self.config, 'POST', '/throttled', json={}).status_code, 200)
+        self.assertEqual(workbench_utils.issue_request(self.config, 'GET', '/gateway').status_code, 504)
+        counters = workbench_utils.get_http_request_counters()
+        self.assertEqual(counters['requests'], 10)
+        self.assertEqual(counters['retries'], 6)
+        self.assertEqual(counters['retried_503_responses'], 2)
+        self.assertEqual(counters['failed_after_retries'], 1)
+
+    def test_token_bucket(self):
+        bucket = workbench_utils.TokenBucket(rate=50, burst=2)
+        start = time.monotonic()
+        for i in range(7):
+            bucket.acquire()
+        # The first two requests use the burst; the other five wait 1/50th of a second each.
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+        bucket.pause(0.05)
+        self.assertGreater(bucket.acquire(), 0.03)
+
+    def test_retry_after(self):
+        response = workbench_utils.requests.models.Response()
+        response.headers['Retry-After'] = '120'
+        self.assertEqual(workbench_utils.get_retry_after_seconds(response), 120)
+        response.headers['Retry-After'] = 'Wed, 21 Oct 2015 07:28:00 GMT'
+        self.assertEqual(workbench_utils.get_retry_after_seconds(response), 0)
+        del response.headers['Retry-After']
+        self.assertIsNone(workbench_utils.get_retry_after_seconds(response))
+
+    def tearDown(self):
+        workbench_utils.http_request_counters.clear()
+
+
+class TestConcurrencyController(unittest.TestCase):
+    def test_aimd(self):
+        controller = workbench_utils.ConcurrencyController(1, 8, window=10)
+
+        def run_window(response_time, status_code=200):
+            for i in range(10):
+                controller.acquire()
+                controller.release(response_time, status_code)
+
+        for i in range(3):
+            run_window(0.1)
+        self.assertEqual(int(controller.limit), 4)
+        # Latency well above the baseline cuts the limit in half.
+        run_window(0.5)
+        self.assertEqual(int(controller.limit), 2)
+        run_window(0.1)
+        self.assertEqual(int(controller.limit), 3)
+        # So does a high 5xx rate.
+        run_window(0.1, 503)
+        self.assertEqual(int(controller.limit), 1)
+        # Cached responses aren't counted.
+        for i in range(20):
+            controller.acquire()
+            controller.release(None, 200)
+        self.assertEqual(int(controller.limit), 1)
+
+    def test_mixed_latencies(self):
+        # Three fast node requests for every slow media request, in windows of 20.
+        for endpoint_classes in [('GET node', 'POST media'), (None, None)]:
+            controller = workbench_utils.ConcurrencyController(1, 8, window=20)
+            for i in range(10 * 20):
+                controller.acquire()
+                if i % 4 == 3:
+                    controller.release(0.5, 200, endpoint_classes[1])
+                else:
+                    controller.release(0.05, 200, endpoint_classes[0])
+            self.assertEqual(int(controller.limit), 8)
+
+        # Each endpoint class has its own baseline.
+        controller = workbench_utils.ConcurrencyController(1, 8, window=20)
+        for response_time in [0.05, 0.05, 0.2]:
+            for i in range(20):
+                controller.acquire()
+                controller.release(0.5 if i % 4 == 3 else response_time, 200, 'POST media' if i % 4 == 3 else 'GET node')
+        # Raised to 3, then cut in half when node requests slow down, even though they're faster than media requests.
+        self.assertEqual(int(controller.limit), 1)
+
+    def test_acquire_waits_for_limit(self):
+        controller = workbench_utils.ConcurrencyController(1, 2)
+        acquired = threading.Event()
+        controller.acquire()
+
+        def acquire():
+            controller.acquire()
+            acquired.set()
+
+        threading.Thread(target=acquire, daemon=True).start()
+        self.assertFalse(acquired.wait(0.1))
+        controller.release(0.1, 200)
+        self.assertTrue(acquired.wait(1))
+
+
+class TestHttpLatencyHistograms(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        workbench_utils.http_latency_histograms.clear()
+
+    def test_histogram(self):
+        histogram = workbench_utils.LatencyHistogram()
+        for i in range(1, 101):
+            histogram.record(i / 100)
+        summary = histogram.summary()
+        self.assertEqual(summary['count'], 100)
+        self.assertEqual(summary['max'], 1.0)
+        # Percentiles are accurate to within 10%.
+        self.assertAlmostEqual(summary['p50'], 0.5, delta=0.05)
+        self.assertAlmostEqual(summary['p95'], 0.95, delta=0.095)
+        self.assertLessEqual(summary['p99'], 1.0)
+        self.assertIsNone(workbench_utils.LatencyHistogram().percentile(50))
+
+    def test_endpoint_classes(self):
+        host = 'https://islandora.dev'
+        self.assertEqual(workbench_utils.get_endpoint_class('POST', host + '/node?_format=json'), 'node')
+        self.assertEqual(workbench_utils.get_endpoint_class('POST', host + '/file/upload/media/image/field_media_image?_format=json'), 'file_upload')
+        self.assertEqual(workbench_utils.get_endpoint_class('POST', host + '/entity/media?_format=json'), 'media')
+        self.assertEqual(workbench_utils.get_endpoint_class('GET', host + '/node/5/media?_format=json'), 'media')
+        self.assertEqual(workbench_utils.get_endpoint_class('GET', host + '/term_from_term_name?vocab=tags&name=foo&_format=json'), 'term')
+        self.assertEqual(workbench_utils.get_endpoint_class('GET', host + '/export?page=3&_format=json'), 'view_page')
+        self.assertEqual(workbench_utils.get_endpoint_class('HEAD', host + '/node/5?_format=json'), 'ping')
+
+    def test_summary_file(self):
+        config = {'temp_dir': self.temp_dir, 'config_file': 'create.yml', 'task': 'create'}
+        self.assertIsNone(workbench_utils.write_http_latency_summary(config))
+        workbench_utils.record_http_latency('POST', 'https://islandora.dev/node?_format=json', 0.25)
+        workbench_utils.record_http_latency('GET', 'https://islandora.dev/taxonomy/term/1?_format=json', 0.05)
+        summary_path = workbench_utils.write_http_latency_summary(config)
+        with open(summary_path) as summary_file:
+            summary = json.load(summary_file)
+        self.assertEqual(list(summary['latency'].keys()), ['GET term', 'POST node'])
+        self.assertEqual(summary['latency']['POST node']['max'], 0.25)
+
+    def tearDown(self):
+        workbench_utils.http_latency_histograms.clear()
+        shutil.rmtree(self.temp_dir)
+
+
+class TestRowTimings(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = {'temp_dir': self.temp_dir, 'config_file': 'create.yml', 'task': 'create', 'row_timings': True, 'row_timings_slowest_rows': 1}
+        self.reset_row_timings()
+
+    def reset_row_timings(self):
+        workbench_utils.row_timings.update({'start': None, 'num_rows': 0, 'num_child_rows': 0, 'bytes_uploaded': 0,
+                                            'stage_totals': collections.Counter(), 'slowest': [], 'csv_path': None})
+
+    def test_row_timings(self):
+        for row in workbench_utils.time_rows(self.config, [{'id': '001'}, {'id': '002'}], 'id'):
+            workbench_utils.add_row_stage_time('node', 0.5)
+            workbench_utils.add_row_bytes_uploaded(2000000)
+            if row['id'] == '002':
+                with workbench_utils.time_row_stage('fixity'):
+                    # Requests made within an explicitly timed stage count only toward that stage.
+                    workbench_utils.add_row_stage_time('other_requests', 5)
+                    time.sleep(0.05)
+                for page in workbench_utils.time_rows(self.config, ['page1.tif']):
+                    workbench_utils.add_row_stage_time('file_upload', 1)
+
+        with open(workbench_utils.get_row_timings_csv_path(self.config)) as csv_file:
+            timings = list(csv.DictReader(csv_file))
+        self.assertEqual([timing['row_id'] for timing in timings], ['001', 'page1.tif', '002'])
+        self.assertEqual(timings[1]['parent_row_id'], '002')
+        self.assertEqual(timings[2]['other_requests'], '0.000')
+        self.assertGreaterEqual(float(timings[2]['fixity']), 0.05)
+        self.assertEqual(timings[2]['child_rows'], timings[1]['total'])
+
+        report = workbench_utils.write_row_timing_report(self.config)
+        self.assertEqual(report['rows'], 2)
+        self.assertEqual(report['child_rows'], 1)
+        self.assertEqual(report['megabytes_uploaded'], 4)
+        self.assertEqual(report['stage_totals']['node'], 1)
+        self.assertEqual(report['stage_totals']['file_upload'], 1)
+        self.assertEqual([slow_row['row_id'] for slow_row in report['slowest_rows']], ['002'])
+
+    def test_rows_with_same_id_and_time(self):
+        class FixedClock():
+            def monotonic(self):
+                return 100.0
+
+            def __getattr__(self, name):
+                return getattr(time, name)
+
+        self.config['row_timings_slowest_rows'] = 3
+        workbench_utils.time = FixedClock()
+        try:
+            for seconds in [0.5, 0.25, 0.75, 1]:
+                for row in workbench_utils.time_rows(self.config, [{'id': '001'}], 'id'):
+                    workbench_utils.add_row_stage_time('node', seconds)
+        finally:
+            workbench_utils.time = time
+        self.assertEqual(len(workbench_utils.row_timings['slowest']), 3)
+
+    def test_row_timings_disabled(self):
+        self.config['row_timings'] = False
+        for row in workbench_utils.time_rows(self.config, [{'id': '001'}], 'id'):
+            workbench_utils.add_row_stage_time('node', 0.5)
+        self.assertIsNone(workbench_utils.write_row_timing_report(self.config))
+
+    def tearDown(self):
+        self.reset_row_timings()
+        shutil.rmtree(self.temp_dir)
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = {'config_file': 'profile_test.yml', 'task': 'create', 'check': False,
+                       'temp_dir': self.temp_dir, 'profile_collapsed_stacks': False}
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_cprofile_stats_file(self):
+        profiler = workbench_utils.start_profiling(self.config)
+        sorted(range(1000), reverse=True)
+        path = workbench_utils.stop_profiling(self.config, profiler)
+        self.assertEqual(os.path.join(self.temp_dir, 'profile_test.create.pstats'), path)
+        stats = pstats.Stats(path)
+        self.assertTrue(any(function[2] == "<built-in method builtins.sorted>" for function in stats.stats))
+
+    def test_cprofile_threads(self):
+        results = []
+
+        def prefetch_worker():
+            results.append(sorted(range(1000)))
+
+        profiler = workbench_utils.start_profiling(self.config)
+        thread = threading.Thread(target=prefetch_worker)
+        thread.start()
+        thread.join(5)
+        path = workbench_utils.stop_profiling(self.config, profiler)
+        self.assertEqual(len(results), 1)
+        stats = pstats.Stats(path)
+        self.assertTrue(any(function[2] == 'prefetch_worker' for function in stats.stats))
+
+    def test_collapsed_stacks(self):
+        self.config['profile_collapsed_stacks'] = True
+        self.config['check'] = True
+
+        def wait_for_drupal():
+            time.sleep(0.05)
+
+        profiler = workbench_utils.start_profiling(self.config)
+        wait_for_drupal()
+        path = workbench_utils.stop_profiling(self.config, profiler)
+        self.assertEqual(os.path.join(self.temp_dir, 'profile_test.check.collapsed'), path)
+        with open(path) as collapsed_file:
+            lines = collapsed_file.read().splitlines()
+        wait_lines = [line for line in lines if 'wait_for_drupal;time:sleep;[wait]' in line]
+        self.assertEqual(1, len(wait_lines))
+        self.assertGreaterEqual(int(wait_lines[0].split(' ')[-1]), 40000)
+
+
 class TestDrupalCoreVersionNumbers(unittest.TestCase):
     def test_version_numbers(self):
         minimum_core_version = tuple([8, 6])
@@ -689,6 +1871,52 @@ class TestCleanCsvValues(unittest.TestCase):
         self.assertEqual(clean_csv_record, csv_record)
 
 
+class TestGetCsvDataCaching(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = {'task': 'create',
+                       'input_dir': self.temp_dir,
+                       'temp_dir': self.temp_dir,
+                       'input_csv': 'cached.csv',
+                       'id_field': 'id',
+                       'delimiter': ',',
+                       'subdelimiter': '|',
+                       'csv_headers': 'names',
+                       'csv_start_row': 0,
+                       'csv_stop_row': None,
+                       'ignore_csv_columns': [],
+                       'clean_csv_values_skip': []
+                       }
+        self.input_csv_path = os.path.join(self.temp_dir, 'cached.csv')
+        self.preprocessed_csv_path = self.input_csv_path + '.preprocessed'
+        with open(self.input_csv_path, 'w') as input_csv:
+            input_csv.write("id,title\n001,  Title one\n002,Title two\n")
+
+    def test_preprocessed_csv_is_reused(self):
+        rows = list(workbench_utils.get_csv_data(self.config))
+        self.assertEqual(rows[0]['title'], 'Title one')
+        preprocessed_mtime = os.stat(self.preprocessed_csv_path).st_mtime_ns
+
+        rows = list(workbench_utils.get_csv_data(self.config))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(os.stat(self.preprocessed_csv_path).st_mtime_ns, preprocessed_mtime)
+
+        # Changing a relevant configuration setting regenerates the preprocessed file.
+        self.config['csv_stop_row'] = 1
+        rows = list(workbench_utils.get_csv_data(self.config))
+        self.assertEqual(len(rows), 1)
+
+        # So does changing the input CSV.
+        self.config['csv_stop_row'] = None
+        with open(self.input_csv_path, 'a') as input_csv:
+            input_csv.write("003,Title three\n")
+        rows = list(workbench_utils.get_csv_data(self.config))
+        self.assertEqual(len(rows), 3)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+
 class TestGetPageTitleFromTemplate(unittest.TestCase):
     def test_get_page_title_from_template(self):
         fixtures = [{'config': {'page_title_template': '$parent_title, page $weight'}, 'parent_title': 'Test parent title', 'weight': 2, 'control': 'Test parent title, page 2'},
@@ -14,20 +14,35 @@ import copy
 import logging
 import datetime
 import requests
+import requests_cache
 import subprocess
 import hashlib
 import mimetypes
 import collections
 import urllib.parse
 from pathlib import Path
+from types import MappingProxyType
 from ruamel.yaml import YAML, YAMLError
 from unidecode import unidecode
 from progress_bar import InitBar
 import edtf_validate.valid_edtf
 import shutil
+import tempfile
 import itertools
+import heapq
+import contextlib
+import math
+import random
+import email.utils
 import http.client
+import http.cookiejar
 import sqlite3
+import threading
+import concurrent.futures
+import atexit
+import io
+import cProfile
+import pstats
 
 from rich.traceback import install
 install()
@@ -39,10 +54,76 @@ EXECUTION_START_TIME = datetime.datetime.now()
 INTEGRATION_MODULE_MIN_VERSION = '1.0'
 # Workaround for https://github.com/mjordan/islandora_workbench/issues/360.
 http.client._MAXHEADERS = 10000
-http_response_times = []
-# Global lists of terms to reduce queries to Drupal.
-checked_terms = list()
-newly_created_terms = list()
+# The most recent 20 response times, used by calculate_response_time_trend().
+http_response_times = collections.deque(maxlen=20)
+# Fixed-size histograms of response times, keyed by HTTP method and endpoint class
+# (e.g. 'POST node', 'POST file_upload', 'GET term'). See record_http_latency().
+http_latency_histograms = dict()
+http_latency_histograms_lock = threading.Lock()
+# Per-row, per-stage timings, if 'row_timings' is true. Each thread has a stack of the rows it is
+# timing (pages created from directories are timed inside their parent's row). See start_row_timing().
+row_timings = {'local': threading.local(), 'lock': threading.Lock(), 'start': None, 'num_rows': 0, 'num_child_rows': 0,
+               'bytes_uploaded': 0, 'stage_totals': collections.Counter(), 'slowest': [], 'sequence': itertools.count(), 'csv_path': None}
+# The stages reported for each row, and the stages that requests to each endpoint class are added to.
+ROW_TIMING_STAGES = ['node', 'file_upload', 'media', 'term', 'alias', 'fixity', 'download', 'scripts', 'other_requests', 'child_rows', 'other']
+ROW_TIMING_REQUEST_STAGES = {'node': 'node', 'file_upload': 'file_upload', 'media': 'media', 'file': 'media', 'term': 'term', 'alias': 'alias'}
+# Pooled, keep-alive HTTP sessions, one per scheme + host. See get_http_session().
+http_sessions = dict()
+http_sessions_lock = threading.Lock()
+# Token buckets that limit the rate of read (GET, HEAD) and write requests, keyed by the kind
+# of request and the bucket's settings, and counts of requests, retries, and time spent waiting
+# for rate limits. See get_rate_limiter() and issue_request().
+rate_limiters = dict()
+rate_limiters_lock = threading.Lock()
+http_request_counters = collections.Counter()
+http_request_counters_lock = threading.Lock()
+# Controller that adjusts the number of concurrent requests to Drupal based on response times
+# and 5xx rates, if 'adaptive_concurrency' is true. See get_concurrency_controller().
+concurrency_controller = {'controller': None, 'lock': threading.Lock()}
+# Global registries of terms to reduce queries to Drupal, keyed by vocabulary ID and lower-cased term name.
+checked_terms = dict()
+newly_created_terms = dict()
+# In-memory index of the terms in vocabularies loaded by preload_vocabularies(). 'names' maps
+# (vocabulary ID, lower-cased term name) to term ID, 'uris' maps URIs to term IDs, and 'tids' maps
+# term IDs (as strings) to dicts containing the term's vocabulary ID, name, and URI.
+term_index = {'vocabularies': set(), 'names': dict(), 'uris': dict(), 'tids': dict()}
+# Term IDs for the distinct taxonomy values in the input CSV, resolved by pre_resolve_term_ids()
+# before any rows are processed. Keyed by field name, the field's vocabulary IDs, and the CSV value.
+resolved_term_ids = dict()
+# Least-recently-used cache of the vocabulary ID, name, and URI of terms fetched from Drupal by
+# term ID, or False for terms that don't exist. See get_term_record().
+term_record_cache = collections.OrderedDict()
+term_record_cache_lock = threading.Lock()
+# Thread pool used by prefetch_term_records(), created on first use and reused for the rest of the run.
+term_prefetch_executor = {'executor': None, 'lock': threading.Lock()}
+# Per-run cache of bundle schema lookups (the results of get_entity_fields() and
+# get_field_definitions()), keyed by host, lookup, entity type, and bundle.
+bundle_schema_cache = dict()
+bundle_schema_cache_stats = {'hits': 0, 'misses': 0}
+# Preprocessed CSV files written by get_csv_data() during this run, keyed by the
+# preprocessed file's path, and content hashes of input CSV files, keyed by their path.
+preprocessed_csv_files = dict()
+csv_file_content_hashes = dict()
+# Hashes of local files computed during this run, keyed by the file's absolute path, size,
+# modification time, and the hash algorithm. See get_file_hashes().
+file_hash_cache = dict()
+# Locks used when CSV rows are processed concurrently (i.e., 'max_workers' is greater than 1).
+# output_lock serializes writes to the rollback files, output CSV, and CSV ID to node ID map;
+# term_creation_lock prevents two rows from creating the same taxonomy term.
+output_lock = threading.RLock()
+term_creation_lock = threading.RLock()
+# Long-lived connection to the CSV ID to node ID map database, inserts waiting to be written
+# to it, and an in-memory view of its contents. See get_csv_id_to_node_id_map_connection().
+csv_id_to_node_id_map_store = {'path': None, 'connection': None, 'pending': [], 'last_flush': None, 'view': None}
+# Connection to the current task's resume journal, stages waiting to be written to it, and the
+# stages completed for each CSV row, both in previous runs and this one. See prepare_resume_journal().
+resume_journal_store = {'path': None, 'connection': None, 'pending': [], 'last_flush': None, 'stages': dict()}
+# Status codes and headers from HEAD requests for remote files, keyed by URL. See get_remote_file_metadata().
+remote_file_metadata_cache = dict()
+# Remote files downloaded in the background for upcoming CSV rows, keyed by CSV ID, file
+# field, and URL, and the limits on how far ahead the download runs. See start_remote_file_prefetch().
+remote_file_prefetch = {'condition': threading.Condition(), 'entries': dict(), 'positions': dict(), 'claimed_position': -1,
+                        'unclaimed_count': 0, 'unclaimed_bytes': 0, 'directory': None, 'thread': None, 'stopped': False}
 # These are the Drupal field names on the standard types of media.
 file_fields = [
     'field_media_file',
@@ -233,10 +314,6 @@ def issue_request(
         logging.error(message)
         sys.exit("Error: " + message)
 
-    if config['check'] is False:
-        if 'pause' in config and method in ['POST', 'PUT', 'PATCH', 'DELETE'] and value_is_numeric(config['pause']):
-            time.sleep(int(config['pause']))
-
     if headers is None:
         headers = dict()
 
@@ -259,79 +336,150 @@ def issue_request(
     if config['log_request_url'] is True:
         logging.info(method + ' ' + url)
 
-    if method == 'GET':
-        if config['log_headers'] is True:
-            logging.info(headers)
-        response = requests.get(
-            url,
-            allow_redirects=config['allow_redirects'],
-            verify=config['secure_ssl_only'],
-            auth=(config['username'], config['password']),
-            params=query,
-            headers=headers
-        )
-    if method == 'HEAD':
-        if config['log_headers'] is True:
-            logging.info(headers)
-        response = requests.head(
-            url,
-            allow_redirects=config['allow_redirects'],
-            verify=config['secure_ssl_only'],
-            auth=(config['username'], config['password']),
-            headers=headers
-        )
-    if method == 'POST':
-        if config['log_headers'] is True:
-            logging.info(headers)
-        if config['log_json'] is True:
-            logging.info(json)
-        response = requests.post(
-            url,
-            allow_redirects=config['allow_redirects'],
-            verify=config['secure_ssl_only'],
-            auth=(config['username'], config['password']),
-            headers=headers,
-            json=json,
-            data=data
-        )
-    if method == 'PUT':
-        if config['log_headers'] is True:
-            logging.info(headers)
-        if config['log_json'] is True:
-            logging.info(json)
-        response = requests.put(
-            url,
-            allow_redirects=config['allow_redirects'],
-            verify=config['secure_ssl_only'],
-            auth=(config['username'], config['password']),
-            headers=headers,
-            json=json,
-            data=data
-        )
-    if method == 'PATCH':
-        if config['log_headers'] is True:
-            logging.info(headers)
-        if config['log_json'] is True:
-            logging.info(json)
-        response = requests.patch(
-            url,
-            allow_redirects=config['allow_redirects'],
-            verify=config['secure_ssl_only'],
-            auth=(config['username'], config['password']),
-            headers=headers,
-            json=json,
-            data=data
-        )
-    if method == 'DELETE':
-        if config['log_headers'] is True:
-            logging.info(headers)
-        response = requests.delete(
-            url,
-            allow_redirects=config['allow_redirects'],
-            verify=config['secure_ssl_only'],
-            auth=(config['username'], config['password']),
-            headers=headers
-        )
+    # File uploads bypass the HTTP cache so the files are streamed, not read into memory.
+    session = get_http_session(config, url, cache=hasattr(data, 'read') is False)
+
+    # Requests are throttled by the read or write token bucket. Idempotent requests are retried, after
+    # a jittered exponential backoff, if the connection fails or Drupal responds with one of the
+    # status codes in config['http_retry_status_codes']; other requests are retried only after a 429
+    # response, since Drupal hasn't processed them. Request bodies read from files are not retried.
+    request_kind = 'read' if method in ['GET', 'HEAD'] else 'write'
+    rate_limiter = get_rate_limiter(config, request_kind)
+    controller = get_concurrency_controller(config)
+    request_is_retryable = hasattr(data, 'read') is False
+    max_retries = int(config.get('http_retries', 3))
+    retry_status_codes = config.get('http_retry_status_codes', [429, 502, 503, 504])
+    retry_attempt = 0
+    request_start_time = time.monotonic()
+    while True:
+        waited = rate_limiter.acquire()
+        increment_http_request_counter('requests')
+        if waited > 0:
+            increment_http_request_counter('rate_limit_wait_seconds', waited)
+
+        if controller is not None:
+            controller.acquire()
+        response = None
+        try:
+            if method == 'GET':
+                if config['log_headers'] is True:
+                    logging.info(headers)
+                response = session.get(
+                    url,
+                    allow_redirects=config['allow_redirects'],
+                    verify=config['secure_ssl_only'],
+                    auth=(config['username'], config['password']),
+                    params=query,
+                    headers=headers
+                )
+            if method == 'HEAD':
+                if config['log_headers'] is True:
+                    logging.info(headers)
+                response = session.head(
+                    url,
+                    allow_redirects=config['allow_redirects'],
+                    verify=config['secure_ssl_only'],
+                    auth=(config['username'], config['password']),
+                    headers=headers
+                )
+            if method == 'POST':
+                if config['log_headers'] is True:
+                    logging.info(headers)
+                if config['log_json'] is True:
+                    logging.info(json)
+                response = session.post(
+                    url,
+                    allow_redirects=config['allow_redirects'],
+                    verify=config['secure_ssl_only'],
+                    auth=(config['username'], config['password']),
+                    headers=headers,
+                    json=json,
+                    data=data
+                )
+            if method == 'PUT':
+                if config['log_headers'] is True:
+                    logging.info(headers)
+                if config['log_json'] is True:
+                    logging.info(json)
+                response = session.put(
+                    url,
+                    allow_redirects=config['allow_redirects'],
+                    verify=config['secure_ssl_only'],
+                    auth=(config['username'], config['password']),
+                    headers=headers,
+                    json=json,
+                    data=data
+                )
+            if method == 'PATCH':
+                if config['log_headers'] is True:
+                    logging.info(headers)
+                if config['log_json'] is True:
+                    logging.info(json)
+                response = session.patch(
+                    url,
+                    allow_redirects=config['allow_redirects'],
+                    verify=config['secure_ssl_only'],
+                    auth=(config['username'], config['password']),
+                    headers=headers,
+                    json=json,
+                    data=data
+                )
+            if method == 'DELETE':
+                if config['log_headers'] is True:
+                    logging.info(headers)
+                response = session.delete(
+                    url,
+                    allow_redirects=config['allow_redirects'],
+                    verify=config['secure_ssl_only'],
+                    auth=(config['username'], config['password']),
+                    headers=headers
+                )
+        except requests.exceptions.ConnectionError as e:
+            if request_is_retryable is False or method not in ['GET', 'HEAD', 'PUT', 'DELETE'] or retry_attempt >= max_retries:
+                increment_http_request_counter('connection_errors')
+                raise
+            retry_delay = get_retry_delay(config, retry_attempt)
+            logging.warning(f"{method} request to {url} failed ({e}); retrying in {retry_delay:.2f} seconds.")
+            increment_http_request_counter('connection_errors')
+            increment_http_request_counter('retries')
+            time.sleep(retry_delay)
+            retry_attempt += 1
+            continue
+        finally:
+            if response is not None and getattr(response, 'from_cache', False) is False:
+                record_http_latency(method, url, response.elapsed.total_seconds())
+            if controller is not None:
+                if response is None:
+                    controller.release()
+                elif getattr(response, 'from_cache', False) is True or request_is_retryable is False:
+                    # Cached responses and file uploads don't reflect how busy Drupal is.
+                    controller.release(None, response.status_code)
+                else:
+                    controller.release(response.elapsed.total_seconds(), response.status_code, method + ' ' + get_endpoint_class(method, url))
+
+        if request_is_retryable is True and retry_attempt < max_retries and response.status_code in retry_status_codes and \
+                (method in ['GET', 'HEAD', 'PUT', 'DELETE'] or response.status_code == 429):
+            retry_after = get_retry_after_seconds(response)
+            if retry_after is not None:
+                # Retry-After applies to all requests, not only this one.
+                rate_limiter.pause(retry_after)
+                get_rate_limiter(config, 'write' if request_kind == 'read' else 'read').pause(retry_after)
+                retry_delay = 0
+            else:
+                retry_delay = get_retry_delay(config, retry_attempt)
+            logging.warning(f"{method} request to {url} returned a {response.status_code} status; retrying in " +
+                            f"{retry_after if retry_after is not None else retry_delay:.2f} seconds (retry {retry_attempt + 1} of {max_retries}).")
+            increment_http_request_counter('retries')
+            increment_http_request_counter(f"retried_{response.status_code}_responses")
+            response.close()
+            time.sleep(retry_delay)
+            retry_attempt += 1
+            continue
+        if retry_attempt > 0 and response.status_code in retry_status_codes:
+            increment_http_request_counter('failed_after_retries')
+        break
+
+    add_row_stage_time(ROW_TIMING_REQUEST_STAGES.get(get_endpoint_class(method, url), 'other_requests'), time.monotonic() - request_start_time)
 
     if config['log_response_status_code'] is True:
         logging.info(response.status_code)
@@ -349,7 +497,9 @@ def issue_request(
         if average_response_time is not None and (response_time - int(config['adaptive_pause'])) > (average_response_time * int(config['adaptive_pause_threshold'])):
             message = "HTTP requests paused for " + str(config['adaptive_pause']) + " seconds because request in next log entry " + \
                 "exceeded adaptive threshold of " + str(config['adaptive_pause_threshold']) + "."
-            time.sleep(int(config['adaptive_pause']))
+            # Pausing the token buckets pauses requests made by all threads, not just this one.
+            get_rate_limiter(config, 'read').pause(int(config['adaptive_pause']))
+            get_rate_limiter(config, 'write').pause(int(config['adaptive_pause']))
             logging.info(message)
             # Enable response time logging if we surpass the adaptive pause threashold.
             config['log_response_time'] = True
@@ -370,6 +520,803 @@ def issue_request(
     return response
 
 
+class TokenBucket():
+    """Limits the rate at which requests are issued, allowing short bursts. Tokens are added
+       to the bucket at 'rate' per second, up to 'burst' tokens, and each request takes one;
+       requests that find the bucket empty wait for their token. The bucket can also be
+       paused, e.g. when Drupal responds with a Retry-After header. Safe to share between threads.
+    """
+    def __init__(self, rate=None, burst=None):
+        """Parameters
+           ----------
+            rate : float|None
+                The number of requests allowed per second, or None for no limit.
+            burst : int|None
+                The number of requests that can be issued at once after the bucket has been
+                idle. Defaults to the number of requests allowed per second (at least 1).
+        """
+        self.rate = float(rate) if rate is not None else None
+        if burst is None:
+            burst = max(1, int(self.rate)) if self.rate is not None else 1
+        self.burst = max(1, int(burst))
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Takes a token from the bucket, waiting until one is available and the bucket isn't paused.
+           Returns the number of seconds waited.
+        """
+        with self.lock:
+            now = time.monotonic()
+            wait = max(self.paused_until - now, 0)
+            if self.rate is not None:
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                # Tokens can go negative; each waiting request reserves the next token to be added.
+                self.tokens -= 1
+                if self.tokens < 0:
+                    wait = max(wait, -self.tokens / self.rate)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds):
+        """Prevents tokens from being taken from the bucket for the next 'seconds' seconds.
+        """
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + float(seconds))
+
+
+class ConcurrencyController():
+    """Limits the number of requests to Drupal in flight at once, adjusting the limit using additive
+       increase, multiplicative decrease (AIMD). After every 'window' requests, if the 95th percentile
+       response time of those requests stays within 'latency_threshold' times the baseline (the lowest
+       95th percentile seen so far) and their 5xx rate stays below 'error_rate_threshold', the limit is
+       raised by one; otherwise, it is multiplied by 'decrease_factor'. Response times are compared per
+       method and endpoint class (see get_endpoint_class()), so that slow but healthy requests, such as
+       media creation, don't look like congestion next to fast ones. Safe to share between threads.
+    """
+    def __init__(self, min_limit, max_limit, window=20, latency_threshold=2, error_rate_threshold=0.05, decrease_factor=0.5):
+        """Parameters
+           ----------
+            min_limit : int
+                The lowest the limit can go, and its initial value.
+            max_limit : int
+                The highest the limit can go, usually config['max_workers'].
+            window : int
+                The number of requests used to evaluate the limit.
+            latency_threshold : float
+                How many times the baseline response time the 95th percentile can be before the limit is cut.
+            error_rate_threshold : float
+                The proportion of requests that can return 5xx responses (or fail) before the limit is cut.
+            decrease_factor : float
+                The number the limit is multiplied by when it is cut.
+        """
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self.limit = float(self.min_limit)
+        self.window = max(1, int(window))
+        self.latency_threshold = float(latency_threshold)
+        self.error_rate_threshold = float(error_rate_threshold)
+        self.decrease_factor = float(decrease_factor)
+        self.baselines = dict()
+        self.in_flight = 0
+        self.samples = []
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        """Waits until fewer than the current limit of requests are in flight.
+        """
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self, response_time=None, status_code=None, endpoint_class=None):
+        """Records the outcome of a request started after acquire().
+
+           Parameters
+           ----------
+            response_time : float|None
+                The request's response time, in seconds, or None if it shouldn't be used to adjust the
+                limit (e.g. it was served from the HTTP cache or uploaded a file).
+            status_code : int|None
+                The response's HTTP status code, or None if the request failed without a response.
+            endpoint_class : string|None
+                The request's method and endpoint class, e.g. 'POST node'.
+        """
+        with self.condition:
+            self.in_flight -= 1
+            if response_time is not None or status_code is None:
+                self.samples.append((response_time, status_code, endpoint_class))
+                if len(self.samples) >= self.window:
+                    self.adjust_limit()
+            self.condition.notify_all()
+
+    def adjust_limit(self):
+        """Applies AIMD to the limit using the current window of samples. Called with the condition held.
+        """
+        response_times = dict()
+        for response_time, status_code, endpoint_class in self.samples:
+            if response_time is not None:
+                response_times.setdefault(endpoint_class, []).append(response_time)
+        num_errors = len([sample for sample in self.samples if sample[1] is None or sample[1] >= 500])
+        error_rate = num_errors / len(self.samples)
+        self.samples = []
+
+        slow_endpoint_classes = []
+        for endpoint_class, endpoint_response_times in response_times.items():
+            endpoint_response_times.sort()
+            p95 = endpoint_response_times[min(len(endpoint_response_times) - 1, int(len(endpoint_response_times) * 0.95))]
+            if endpoint_class not in self.baselines or p95 < self.baselines[endpoint_class]:
+                self.baselines[endpoint_class] = p95
+            if p95 > self.baselines[endpoint_class] * self.latency_threshold:
+                slow_endpoint_classes.append(f"{endpoint_class or 'all'} 95th percentile {p95:.3f} seconds, baseline {self.baselines[endpoint_class]:.3f} seconds")
+
+        old_limit = self.limit
+        if error_rate > self.error_rate_threshold or len(slow_endpoint_classes) > 0:
+            self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+        else:
+            self.limit = min(float(self.max_limit), self.limit + 1)
+
+        if int(self.limit) != int(old_limit):
+            latency_message = '; '.join(slow_endpoint_classes) if len(slow_endpoint_classes) > 0 else 'response times within their baselines'
+            logging.info(f"Adaptive concurrency: limit on concurrent requests changed from {int(old_limit)} to {int(self.limit)} " +
+                         f"({latency_message}, 5xx rate {error_rate:.2%}).")
+
+
+def get_concurrency_controller(config):
+    """Get the controller that limits the number of concurrent requests to Drupal, creating it on first use.
+       Returns None if the 'adaptive_concurrency' configuration setting is false or 'max_workers' is less than 2.
+    """
+    if config.get('adaptive_concurrency', False) is False or int(config.get('max_workers', 1)) < 2:
+        return None
+    with concurrency_controller['lock']:
+        if concurrency_controller['controller'] is None:
+            concurrency_controller['controller'] = ConcurrencyController(
+                config['adaptive_concurrency_min'],
+                config['max_workers'],
+                window=config['adaptive_concurrency_window'],
+                latency_threshold=config['adaptive_concurrency_latency_threshold'],
+                error_rate_threshold=config['adaptive_concurrency_error_rate_threshold'],
+                decrease_factor=config['adaptive_concurrency_decrease_factor'])
+            logging.info(f"Adaptive concurrency enabled: between {config['adaptive_concurrency_min']} and {config['max_workers']} concurrent requests.")
+        return concurrency_controller['controller']
+
+
+def get_rate_limiter(config, request_kind):
+    """Get the token bucket that limits the rate of read (GET and HEAD) or write requests.
+       The rates and bursts are set by the 'max_read_requests_per_second', 'read_request_burst',
+       'max_write_requests_per_second', and 'write_request_burst' configuration settings. If
+       'max_write_requests_per_second' isn't set, the 'pause' setting is converted to a rate
+       of one write request every 'pause' seconds.
+
+       Parameters
+       ----------
+       config : dict
+           The configuration settings defined by workbench_config.get_config().
+       request_kind : str
+           Either 'read' or 'write'.
+       Returns
+       -------
+       TokenBucket
+    """
+    rate = config.get(f"max_{request_kind}_requests_per_second")
+    burst = config.get(f"{request_kind}_request_burst")
+    if request_kind == 'write' and rate is None and config['check'] is False and 'pause' in config and value_is_numeric(config['pause']) and float(config['pause']) > 0:
+        rate = 1 / float(config['pause'])
+        burst = 1
+    limiter_key = (request_kind, rate, burst)
+    with rate_limiters_lock:
+        if limiter_key not in rate_limiters:
+            rate_limiters[limiter_key] = TokenBucket(rate, burst)
+        return rate_limiters[limiter_key]
+
+
+def get_retry_delay(config, retry_attempt):
+    """Get the number of seconds to wait before retrying a request, using exponential backoff
+       with "full jitter": a random delay between 0 and config['http_retry_backoff'] * 2 ** retry_attempt
+       seconds, but no longer than config['http_retry_max_backoff'] seconds.
+    """
+    return random.uniform(0, min(float(config.get('http_retry_max_backoff', 60)), float(config.get('http_retry_backoff', 1)) * 2 ** retry_attempt))
+
+
+def get_retry_after_seconds(response):
+    """Get the number of seconds a response's Retry-After header asks clients to wait,
+       or None if the response doesn't have a valid Retry-After header.
+    """
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is None:
+        return None
+    retry_after = retry_after.strip()
+    if retry_after.isdigit():
+        return int(retry_after)
+    try:
+        retry_after_date = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_after_date - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0)
+
+
+def increment_http_request_counter(counter, amount=1):
+    """Adds to one of the counters in http_request_counters.
+    """
+    with http_request_counters_lock:
+        http_request_counters[counter] += amount
+
+
+def get_http_request_counters():
+    """Get a copy of the HTTP request counters, e.g. {'requests': 1200, 'retries': 3,
+       'retried_503_responses': 3, 'rate_limit_wait_seconds': 12.5}.
+    """
+    with http_request_counters_lock:
+        return dict(http_request_counters)
+
+
+class LatencyHistogram():
+    """Fixed-memory histogram of response times. Buckets grow geometrically by 10% from one
+       millisecond, so percentiles are accurate to within 10% however many times are recorded.
+    """
+    smallest_bucket = 0.001
+    growth_factor = 1.1
+    num_buckets = 200
+
+    def __init__(self):
+        self.counts = [0] * (self.num_buckets + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        if seconds <= self.smallest_bucket:
+            bucket = 0
+        else:
+            bucket = min(self.num_buckets, math.ceil(math.log(seconds / self.smallest_bucket, self.growth_factor)))
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percent):
+        """Returns the upper bound of the bucket containing the given percentile
+           (no higher than the longest time recorded), or None if no times have been recorded.
+        """
+        if self.count == 0:
+            return None
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for bucket, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(self.smallest_bucket * self.growth_factor ** bucket, self.max)
+        return self.max
+
+    def summary(self):
+        return {'count': self.count, 'mean': self.total / self.count if self.count else None, 'p50': self.percentile(50),
+                'p95': self.percentile(95), 'p99': self.percentile(99), 'max': self.max}
+
+
+def get_endpoint_class(method, url):
+    """Classifies a request to Drupal for the latency histograms and row timings, e.g. 'node',
+       'file_upload', 'media', 'term', 'alias', 'view_page', or 'ping'.
+    """
+    """Parameters
+        ----------
+        method : str
+            The HTTP method, e.g. 'POST'.
+        url : str
+            The request's URL.
+        Returns
+        -------
+        str
+            The endpoint class, or 'other'.
+    """
+    parsed_url = urllib.parse.urlparse(url)
+    path = parsed_url.path
+    if method == 'HEAD' or path == '/islandora_workbench_integration/version':
+        return 'ping'
+    if path.startswith('/file/upload/'):
+        return 'file_upload'
+    if path.startswith('/entity/file/'):
+        return 'file'
+    if path == '/entity/media' or path.startswith('/media/') or (path.startswith('/node/') and path.endswith('/media')):
+        return 'media'
+    if path.startswith('/taxonomy/term') or path.startswith('/term_from_'):
+        return 'term'
+    if path == '/node' or path.startswith('/node/'):
+        return 'node'
+    if path.startswith('/entity/path_alias'):
+        return 'alias'
+    if path.startswith('/entity/') or path.startswith('/taxonomy/vocabulary'):
+        return 'schema'
+    if 'page' in urllib.parse.parse_qs(parsed_url.query):
+        return 'view_page'
+    return 'other'
+
+
+def record_http_latency(method, url, seconds):
+    """Adds a response time to the histogram for the request's method and endpoint class.
+    """
+    key = method + ' ' + get_endpoint_class(method, url)
+    with http_latency_histograms_lock:
+        if key not in http_latency_histograms:
+            http_latency_histograms[key] = LatencyHistogram()
+        http_latency_histograms[key].record(seconds)
+
+
+def get_http_latency_summary():
+    """Get the count, mean, 50th, 95th, and 99th percentile, and maximum response time, in seconds,
+       for each method and endpoint class, e.g. {'POST node': {'count': 10, 'p50': 0.21, ...}}.
+    """
+    with http_latency_histograms_lock:
+        return {key: histogram.summary() for key, histogram in sorted(http_latency_histograms.items())}
+
+
+def write_http_latency_summary(config):
+    """Logs the response time summary from get_http_latency_summary() and writes it, along with the
+       counters from get_http_request_counters(), to a JSON file in config['temp_dir'].
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        Returns
+        -------
+        string|None
+            The path to the JSON file, or None if no requests were recorded.
+    """
+    latency_summary = get_http_latency_summary()
+    if len(latency_summary) == 0:
+        return None
+    for key, summary in latency_summary.items():
+        logging.info(f"HTTP response times for {key} requests: count {summary['count']}, p50 {summary['p50']:.3f}s, " +
+                     f"p95 {summary['p95']:.3f}s, p99 {summary['p99']:.3f}s, max {summary['max']:.3f}s.")
+
+    config_file_name = os.path.splitext(os.path.basename(config['config_file']))[0]
+    summary_path = os.path.join(config['temp_dir'], f"{config_file_name}.{config['task']}.http_latency.json")
+    summary = {
+        'task': config['task'],
+        'config_file': config['config_file'],
+        'generated': datetime.datetime.now().isoformat(timespec='seconds'),
+        'latency': latency_summary,
+        'counters': get_http_request_counters()
+    }
+    with open(summary_path, 'w') as summary_file:
+        json.dump(summary, summary_file, indent=2)
+    logging.info(f"HTTP response time summary written to {summary_path}.")
+    return summary_path
+
+
+def start_row_timing(config, row_id):
+    """Starts timing the stages of the work done for a CSV row (or a page created from a directory)
+       in the current thread, if the 'row_timings' configuration setting is true.
+    """
+    if config.get('row_timings', False) is False:
+        return
+    local = row_timings['local']
+    if not hasattr(local, 'stack'):
+        local.stack = []
+    with row_timings['lock']:
+        if row_timings['start'] is None:
+            row_timings['start'] = time.monotonic()
+    local.stack.append({'row_id': str(row_id), 'start': time.monotonic(), 'stages': collections.Counter(), 'bytes_uploaded': 0, 'explicit_stages': 0})
+
+
+def get_current_row_timing():
+    """Returns the row being timed by the current thread, or None.
+    """
+    stack = getattr(row_timings['local'], 'stack', None)
+    if not stack:
+        return None
+    return stack[-1]
+
+
+def add_row_stage_time(stage, seconds):
+    """Adds time to a stage of the row being timed by the current thread, if any. Time spent in
+       requests made within a stage timed by time_row_stage() is counted in that stage only.
+    """
+    current_row = get_current_row_timing()
+    if current_row is None or current_row['explicit_stages'] > 0:
+        return
+    current_row['stages'][stage] += seconds
+
+
+@contextlib.contextmanager
+def time_row_stage(stage):
+    """Context manager that adds the time spent in its block to a stage of the row being timed
+       by the current thread, e.g. "with time_row_stage('fixity'):".
+    """
+    current_row = get_current_row_timing()
+    if current_row is None:
+        yield
+        return
+    stage_start_time = time.monotonic()
+    current_row['explicit_stages'] += 1
+    try:
+        yield
+    finally:
+        current_row['explicit_stages'] -= 1
+        if current_row['explicit_stages'] == 0:
+            current_row['stages'][stage] += time.monotonic() - stage_start_time
+
+
+def add_row_bytes_uploaded(num_bytes):
+    """Adds to the number of bytes uploaded for the row being timed by the current thread.
+    """
+    current_row = get_current_row_timing()
+    if current_row is not None:
+        current_row['bytes_uploaded'] += num_bytes
+
+
+def finish_row_timing(config):
+    """Finishes timing the current thread's row, adds it to the run's totals, and writes its
+       stage timings to the row timings CSV file.
+    """
+    current_row = get_current_row_timing()
+    if current_row is None:
+        return
+    row_timings['local'].stack.pop()
+    total = time.monotonic() - current_row['start']
+    stages = current_row['stages']
+    stages['other'] = max(total - sum(stages.values()), 0)
+    parent_row = get_current_row_timing()
+    if parent_row is not None:
+        # Child rows' time is reported as a stage of their parent, and their bytes count toward it.
+        parent_row['stages']['child_rows'] += total
+        parent_row['bytes_uploaded'] += current_row['bytes_uploaded']
+
+    with row_timings['lock']:
+        if parent_row is None:
+            row_timings['num_rows'] += 1
+            row_timings['bytes_uploaded'] += current_row['bytes_uploaded']
+            for stage, seconds in stages.items():
+                if stage != 'child_rows':
+                    row_timings['stage_totals'][stage] += seconds
+            # Keep the slowest rows in a min-heap of fixed size. The sequence number breaks ties between
+            # rows with the same time and ID (e.g. repeated IDs), since their stages can't be compared.
+            entry = (total, current_row['row_id'], next(row_timings['sequence']), dict(stages))
+            if len(row_timings['slowest']) < int(config['row_timings_slowest_rows']):
+                heapq.heappush(row_timings['slowest'], entry)
+            elif len(row_timings['slowest']) > 0 and total > row_timings['slowest'][0][0]:
+                heapq.heapreplace(row_timings['slowest'], entry)
+        else:
+            row_timings['num_child_rows'] += 1
+            for stage, seconds in stages.items():
+                row_timings['stage_totals'][stage] += seconds
+
+    with output_lock:
+        csv_path = get_row_timings_csv_path(config)
+        new_file = row_timings['csv_path'] != csv_path
+        with open(csv_path, 'w' if new_file else 'a', newline='') as csv_file:
+            writer = csv.writer(csv_file)
+            if new_file:
+                writer.writerow(['row_id', 'parent_row_id', 'total', 'bytes_uploaded'] + ROW_TIMING_STAGES)
+                row_timings['csv_path'] = csv_path
+            writer.writerow([current_row['row_id'], parent_row['row_id'] if parent_row is not None else '', f"{total:.3f}", current_row['bytes_uploaded']] +
+                            [f"{stages.get(stage, 0):.3f}" for stage in ROW_TIMING_STAGES])
+
+
+def get_row_timings_csv_path(config):
+    """Returns the path to the CSV file that row timings are written to: the 'row_timings_csv_path'
+       configuration setting, or a file named after the configuration file and task in config['temp_dir'].
+    """
+    if config.get('row_timings_csv_path') is not None:
+        return config['row_timings_csv_path']
+    config_file_name = os.path.splitext(os.path.basename(config['config_file']))[0]
+    return os.path.join(config['temp_dir'], f"{config_file_name}.{config['task']}.row_timings.csv")
+
+
+def time_rows(config, rows, id_field=None):
+    """Generator that times the work done for each row in 'rows' while the caller's loop
+       processes it (i.e., until the caller asks for the next row or leaves the loop).
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        rows : iterable
+            The CSV rows, or other items, e.g. the files of pages created from a directory.
+        id_field : string|None
+            The field containing each row's ID, or None if the items themselves are their IDs.
+        Yields
+        ------
+        The items in 'rows'.
+    """
+    for row in rows:
+        start_row_timing(config, row[id_field] if id_field is not None else row)
+        try:
+            yield row
+        finally:
+            finish_row_timing(config)
+
+
+def write_row_timing_report(config):
+    """Prints and logs the number of rows processed per second, the number of megabytes uploaded per
+       second, the total time spent in each stage, and the slowest rows.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        Returns
+        -------
+        dict|None
+            The figures in the report, or None if no rows were timed.
+    """
+    if row_timings['start'] is None:
+        return None
+    with row_timings['lock']:
+        elapsed = max(time.monotonic() - row_timings['start'], 0.001)
+        report = {
+            'rows': row_timings['num_rows'],
+            'child_rows': row_timings['num_child_rows'],
+            'seconds': elapsed,
+            'rows_per_second': row_timings['num_rows'] / elapsed,
+            'megabytes_uploaded': row_timings['bytes_uploaded'] / 1000000,
+            'megabytes_per_second': row_timings['bytes_uploaded'] / 1000000 / elapsed,
+            'stage_totals': {stage: row_timings['stage_totals'].get(stage, 0) for stage in ROW_TIMING_STAGES if stage != 'child_rows'},
+            'slowest_rows': [{'row_id': row_id, 'seconds': total, 'stages': stages} for total, row_id, sequence, stages in sorted(row_timings['slowest'], reverse=True)]
+        }
+
+    messages = [f"Processed {report['rows']} rows in {elapsed:.1f} seconds ({report['rows_per_second']:.2f} rows/sec); " +
+                f"uploaded {report['megabytes_uploaded']:.1f} MB ({report['megabytes_per_second']:.2f} MB/sec)."]
+    messages.append('Time per stage: ' + ', '.join(f"{stage} {seconds:.1f}s" for stage, seconds in report['stage_totals'].items() if seconds > 0) + '.')
+    for slow_row in report['slowest_rows']:
+        slowest_stage = max(slow_row['stages'].items(), key=lambda stage: stage[1])
+        messages.append(f"Slow row {slow_row['row_id']}: {slow_row['seconds']:.1f}s ({slowest_stage[0]} {slowest_stage[1]:.1f}s).")
+    messages.append(f"Per-row stage timings are in {row_timings['csv_path']}.")
+    for message in messages:
+        print(message)
+        logging.info(message)
+    return report
+
+
+class StackProfiler():
+    """Deterministic profiler that records the time spent in each distinct call stack, in every
+       thread, for collapsed-stack ("folded") output that flame graph tools can read. Both wall-clock
+       and CPU time are recorded, so time spent waiting (e.g. for Drupal to respond) can be reported
+       separately from time spent running Python.
+    """
+    # Frames from these modules mean the thread is waiting on an HTTP request.
+    http_modules = ('requests', 'urllib3', 'http.client', 'socket', 'ssl')
+
+    def __init__(self):
+        self.local = threading.local()
+        self.thread_stacks = []
+        self.lock = threading.Lock()
+
+    def start(self):
+        threading.setprofile(self.profile)
+        sys.setprofile(self.profile)
+
+    def stop(self):
+        sys.setprofile(None)
+        threading.setprofile(None)
+
+    def profile(self, frame, event, arg):
+        now = time.perf_counter()
+        cpu_now = time.thread_time()
+        local = self.local
+        if not hasattr(local, 'stack'):
+            local.stack = ()
+            local.times = dict()
+            with self.lock:
+                self.thread_stacks.append(local.times)
+        elif len(local.stack) > 0:
+            times = local.times.get(local.stack)
+            if times is None:
+                times = local.times[local.stack] = [0.0, 0.0]
+            times[0] += now - local.last_time
+            times[1] += cpu_now - local.last_cpu_time
+
+        if event == 'call':
+            local.stack = local.stack + (frame.f_globals.get('__name__', '?') + ':' + frame.f_code.co_name,)
+        elif event == 'c_call':
+            local.stack = local.stack + ((getattr(arg, '__module__', None) or 'builtins') + ':' + getattr(arg, '__qualname__', repr(arg)),)
+        elif event in ['return', 'c_return', 'c_exception'] and len(local.stack) > 0:
+            local.stack = local.stack[:-1]
+        # Don't count the time spent in this method.
+        local.last_time = time.perf_counter()
+        local.last_cpu_time = time.thread_time()
+
+    def write_collapsed_stacks(self, path):
+        """Writes one line per call stack, with frames separated by semicolons, followed by the number
+           of microseconds of CPU time spent in the stack. Time the stack spent waiting is written on a
+           separate line, with an '[HTTP wait]' or '[wait]' frame appended to the stack.
+        """
+        totals = collections.defaultdict(float)
+        with self.lock:
+            for thread_times in self.thread_stacks:
+                for stack, (wall_time, cpu_time) in list(thread_times.items()):
+                    folded_stack = ';'.join(stack)
+                    totals[folded_stack] += cpu_time
+                    if wall_time - cpu_time > 0:
+                        is_http = any(frame.split(':')[0].split('.')[0] in self.http_modules or frame.startswith('http.client:') for frame in stack)
+                        totals[folded_stack + (';[HTTP wait]' if is_http else ';[wait]')] += wall_time - cpu_time
+        with open(path, 'w') as collapsed_file:
+            for folded_stack, seconds in sorted(totals.items()):
+                if int(seconds * 1000000) > 0:
+                    collapsed_file.write(f"{folded_stack} {int(seconds * 1000000)}\n")
+
+
+def start_profiling(config):
+    """Starts profiling Workbench (for the --profile option). cProfile is used in the main thread and
+       in threads started after profiling begins; if 'profile_collapsed_stacks' is true, StackProfiler
+       is used instead, since only one profiler can be active in a thread. From Python 3.12, cProfile
+       uses sys.monitoring, so a single profiler covers every thread and no others can be started.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        Returns
+        -------
+        list|StackProfiler
+            The cProfile.Profile objects for each profiled thread, or the StackProfiler.
+    """
+    if config['profile_collapsed_stacks'] is True:
+        profiler = StackProfiler()
+        profiler.start()
+        return profiler
+
+    profilers = [cProfile.Profile()]
+
+    def enable_thread_profiler(frame, event, arg):
+        # Replaces this function as the thread's profiler.
+        thread_profiler = cProfile.Profile()
+        with output_lock:
+            profilers.append(thread_profiler)
+        thread_profiler.enable()
+
+    if sys.version_info < (3, 12):
+        threading.setprofile(enable_thread_profiler)
+    profilers[0].enable()
+    return profilers
+
+
+def stop_profiling(config, profiler):
+    """Stops profiling and writes the results to config['temp_dir']: a pstats file for cProfile
+       (with the 25 functions with the highest cumulative time also logged), or a collapsed-stack
+       file for StackProfiler.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        profiler : list|StackProfiler
+            The value returned by start_profiling().
+        Returns
+        -------
+        string
+            The path to the file the results were written to.
+    """
+    config_file_name = os.path.splitext(os.path.basename(config['config_file']))[0]
+    profile_name = 'check' if config['check'] is True else config['task']
+    if isinstance(profiler, StackProfiler):
+        profiler.stop()
+        profile_path = os.path.join(config['temp_dir'], f"{config_file_name}.{profile_name}.collapsed")
+        profiler.write_collapsed_stacks(profile_path)
+        message = f"Collapsed call stacks (for use with flame graph tools) written to {profile_path}."
+    else:
+        profiler[0].disable()
+        threading.setprofile(None)
+        with output_lock:
+            stats = pstats.Stats(*profiler)
+        profile_path = os.path.join(config['temp_dir'], f"{config_file_name}.{profile_name}.pstats")
+        stats.dump_stats(profile_path)
+        stats_output = io.StringIO()
+        stats.stream = stats_output
+        stats.sort_stats('cumulative').print_stats(25)
+        logging.info("Functions with the highest cumulative time:\n" + stats_output.getvalue())
+        message = f"Profile statistics written to {profile_path}; view them with \"python -m pstats {profile_path}\"."
+    print(message)
+    logging.info(message)
+    return profile_path
+
+
+def get_http_session(config, url, cache=True):
+    """Get the pooled HTTP session used for requests to the host in the URL. Sessions
+       are created on first use and reused for the rest of the run, so connections
+       (and their TLS handshakes) are kept alive and shared across requests.
+
+       Parameters
+       ----------
+       config : dict
+           The configuration settings defined by workbench_config.get_config().
+       url : str
+           The URL that will be requested using the session.
+       cache : bool
+           Whether the session should use the HTTP cache, if it is installed. Requests
+           whose bodies are files should not, since requests_cache reads the entire
+           body into memory to generate the request's cache key.
+       Returns
+       -------
+       requests.Session
+    """
+    sections = urllib.parse.urlparse(url)
+    session_key = sections.scheme + '://' + sections.netloc
+    if cache is True:
+        session_class = requests.Session
+    else:
+        session_key = session_key + ' (uncached)'
+        session_class = requests_cache.OriginalSession
+    # Worker threads may request the same host for the first time at once.
+    with http_sessions_lock:
+        session = http_sessions.get(session_key)
+
+        # requests_cache.install_cache() replaces requests.Session with a caching subclass,
+        # so sessions created before the cache was installed (or after it was uninstalled)
+        # need to be replaced.
+        if session is None or type(session) is not session_class:
+            session = session_class()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=int(config.get('http_pool_connections', 10)),
+                pool_maxsize=get_http_pool_maxsize(config))
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            if config.get('http_keep_alive', True) is False:
+                session.headers['Connection'] = 'close'
+            # Don't persist cookies across requests, since the module-level requests
+            # functions we used previously didn't either (e.g., files downloaded from
+            # Drupal need to be requested anonymously).
+            session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+            http_sessions[session_key] = session
+
+    return session
+
+
+def get_http_pool_maxsize(config):
+    """Get the maximum number of connections kept open to each host. If 'http_pool_maxsize'
+       is not set, this is enough for every thread that can make requests at the same time
+       (the 'max_workers' worker threads, the View page prefetch threads, and the remote file
+       prefetch thread), and at least 10. urllib3 discards connections beyond this number
+       once they are released, so a pool smaller than the number of threads would open
+       new connections instead of reusing them.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        Returns
+        -------
+        int
+    """
+    if config.get('http_pool_maxsize') is not None:
+        return int(config['http_pool_maxsize'])
+    num_threads = max(int(config.get('max_workers', 1)), 1)
+    num_threads += max(int(config.get('view_prefetch_pages', 0)), 0) + 1
+    if config.get('prefetch_remote_files'):
+        num_threads += 1
+    return max(num_threads, 10)
+
+
+def get_http_connection_counts():
+    """Get the number of HTTP connections opened and the number of requests that reused
+       an already open connection, across all of the pooled sessions.
+
+       Returns
+       -------
+       dict
+           A dictionary with the keys 'opened' and 'reused'.
+    """
+    counts = {'opened': 0, 'reused': 0}
+    with http_sessions_lock:
+        sessions = list(http_sessions.values())
+    for session in sessions:
+        adapters = set(session.adapters.values())
+        for adapter in adapters:
+            pools = adapter.poolmanager.pools
+            for pool_key in pools.keys():
+                pool = pools.get(pool_key)
+                if pool is None:
+                    continue
+                counts['opened'] += pool.num_connections
+                counts['reused'] += max(pool.num_requests - pool.num_connections, 0)
+    return counts
+
+
 def convert_semver_to_number(version_string):
     """Convert a Semantic Version number (e.g. Drupal's) string to a number. We only need the major
        and minor numbers (e.g. 9.2).
@@ -586,14 +1533,10 @@ def ping_term(config, term_id):
        boolean
            Returns Ture if HTTP status code returned is 200, if not False is returned.
     """
-
-    url = config['host'] + '/taxonomy/term/' + str(term_id).strip() + '?_format=json'
-    response = issue_request(config, 'GET', url)
-    if response.status_code == 200:
-        return True
-    else:
-        logging.warning("Term ping (GET) on %s returned a %s status code.", url, response.status_code)
+    if get_term_record(config, term_id) is False:
         return False
+    else:
+        return True
 
 
 def ping_islandora(config, print_message=True):
@@ -669,6 +1612,54 @@ def ping_content_type(config):
     return issue_request(config, 'GET', url).status_code
 
 
+def get_view_pages(config, view_url, view_parameters):
+    """Generator that yields the pages of a View's REST export display, in order, stopping at
+       the first empty page. While the caller processes a page, up to config['view_prefetch_pages']
+       of the following pages are requested in the background. Pages are not stored in the HTTP
+       cache since each one is only requested once.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        view_url : string
+            The View's URL, ending in '?page='.
+        view_parameters : string
+            Query string parameters to append to the View's URL.
+        Yields
+        ------
+        tuple
+            The page number, the requests.Response for the page, and the list of nodes on
+            the page (None if the request did not return a 200 status code).
+    """
+    def get_page(page):
+        url = view_url + str(page) + '&' + view_parameters
+        return issue_request(config, 'GET', url, headers={'Cache-Control': 'no-store'})
+
+    num_prefetch_pages = max(int(config.get('view_prefetch_pages', 0)), 0)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=num_prefetch_pages + 1)
+    pending = collections.deque()
+    next_page = 0
+    try:
+        while True:
+            while len(pending) < num_prefetch_pages + 1:
+                pending.append((next_page, executor.submit(get_page, next_page)))
+                next_page += 1
+            page, future = pending.popleft()
+            response = future.result()
+            if response.status_code == 200:
+                nodes = json.loads(response.text)
+                if len(nodes) == 0:
+                    return
+            else:
+                nodes = None
+            yield page, response, nodes
+    finally:
+        for page, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
 def ping_view_endpoint(config, view_url):
     """Verifies that the View REST endpoint is accessible.
 
@@ -827,8 +1818,7 @@ def ping_remote_file(config, url):
 
     sections = urllib.parse.urlparse(url)
     try:
-        response = requests.head(url, allow_redirects=True, verify=config['secure_ssl_only'])
-        return response.status_code
+        return get_remote_file_metadata(config, url)['status_code']
     except requests.exceptions.Timeout as err_timeout:
         message = 'Workbench timed out trying to reach ' + \
             sections.netloc + ' while connecting to ' + url + '. Please verify that URL and check your network connection.'
@@ -843,6 +1833,91 @@ def ping_remote_file(config, url):
         sys.exit('Error: ' + message)
 
 
+def get_remote_file_metadata(config, url):
+    """Get the HTTP status code and selected headers of a remote file from a HEAD request. The
+       results are cached for the rest of the run so that each remote file is only requested
+       once, no matter how many times it is checked. If config['cache_remote_file_metadata']
+       is True, they are also cached in the SQLite database in config['temp_dir'] for
+       config['remote_file_metadata_cache_max_age'] seconds, so the requests made during --check
+       don't need to be repeated when the task is run. Requests errors are not caught here.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        url : string
+            The URL of the remote file.
+        Returns
+        -------
+        dict
+            A dictionary with the keys 'status_code', 'content_type', 'content_length',
+            'etag', and 'url' (the URL after any redirects). The header values are None
+            if the server did not send them.
+    """
+    if url in remote_file_metadata_cache:
+        return remote_file_metadata_cache[url]
+
+    if config.get('cache_remote_file_metadata') is True:
+        metadata = get_remote_file_metadata_from_cache(config, url)
+        if metadata is not False:
+            remote_file_metadata_cache[url] = metadata
+            return metadata
+
+    session = get_http_session(config, url)
+    response = session.head(url, allow_redirects=True, verify=config['secure_ssl_only'])
+    content_length = response.headers.get('Content-Length')
+    metadata = {
+        'status_code': response.status_code,
+        'content_type': response.headers.get('Content-Type'),
+        'content_length': int(content_length) if value_is_numeric(content_length) else None,
+        'etag': response.headers.get('ETag'),
+        'url': response.url
+    }
+
+    # Don't hang on to server errors, which are often temporary.
+    if response.status_code < 500:
+        remote_file_metadata_cache[url] = metadata
+        if config.get('cache_remote_file_metadata') is True:
+            prepare_remote_file_metadata_cache(config)
+            query = "INSERT OR REPLACE INTO remote_file_metadata_cache (url, retrieved, metadata) VALUES (?, ?, ?)"
+            sqlite_manager(config, operation='insert', query=query, values=(url, time.time(), json.dumps(metadata)), db_file_path=config['sqlite_db_filename'])
+
+    return metadata
+
+
+def prepare_remote_file_metadata_cache(config):
+    """Creates the table in the SQLite database in config['temp_dir'] used to cache
+       remote file metadata across Workbench sessions.
+    """
+    create_table_sql = "CREATE TABLE remote_file_metadata_cache (url TEXT PRIMARY KEY, retrieved REAL, metadata TEXT)"
+    sqlite_manager(config, operation='create_table', table_name='remote_file_metadata_cache', query=create_table_sql, db_file_path=config['sqlite_db_filename'])
+
+
+def get_remote_file_metadata_from_cache(config, url):
+    """Get a remote file's metadata cached in a previous Workbench session.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        url : string
+            The URL of the remote file.
+        Returns
+        -------
+        dict|bool
+            The metadata as returned by get_remote_file_metadata(), or False if it
+            is not cached or is older than config['remote_file_metadata_cache_max_age'].
+    """
+    prepare_remote_file_metadata_cache(config)
+    query = "select retrieved, metadata from remote_file_metadata_cache where url = ?"
+    res = sqlite_manager(config, operation='select', query=query, values=(url,), db_file_path=config['sqlite_db_filename'])
+    if len(res) == 0:
+        return False
+    if time.time() - res[0]['retrieved'] > int(config.get('remote_file_metadata_cache_max_age', 3600)):
+        return False
+    return json.loads(res[0]['metadata'])
+
+
 def get_nid_from_url_alias(config, url_alias):
     """Gets a node ID from a URL alias. This function also works
        canonical URLs, e.g. http://localhost:8000/node/1648.
@@ -936,6 +2011,22 @@ def get_field_definitions(config, entity_type, bundle_type=None):
            A dictionary with field names as keys and values arrays containing
            field config data. Config data varies slightly by entity type.
     """
+    if entity_type == 'node':
+        cache_key = (config['host'], 'field_definitions', entity_type, config['content_type'])
+    else:
+        cache_key = (config['host'], 'field_definitions', entity_type, bundle_type)
+    if cache_key in bundle_schema_cache:
+        bundle_schema_cache_stats['hits'] += 1
+        return copy.deepcopy(bundle_schema_cache[cache_key])
+    bundle_schema_cache_stats['misses'] += 1
+
+    if config['cache_field_definitions'] is True:
+        fingerprint = get_field_definitions_cache_fingerprint(config, entity_type, cache_key[3])
+        cached_field_definitions = get_field_definitions_from_cache(config, entity_type, cache_key[3], fingerprint)
+        if cached_field_definitions is not False:
+            bundle_schema_cache[cache_key] = copy.deepcopy(cached_field_definitions)
+            return cached_field_definitions
+
     ping_islandora(config, print_message=False)
     field_definitions = {}
 
@@ -1184,6 +2275,9 @@ def get_field_definitions(config, entity_type, bundle_type=None):
             else:
                 field_definitions[fieldname]['formatted_text'] = False
 
+    bundle_schema_cache[cache_key] = copy.deepcopy(field_definitions)
+    if config['cache_field_definitions'] is True:
+        write_field_definitions_to_cache(config, entity_type, cache_key[3], fingerprint, field_definitions)
     return field_definitions
 
 
@@ -1205,6 +2299,12 @@ def get_entity_fields(config, entity_type, bundle_type):
            A list with field names, e.g. ['field_name1', 'field_name2'].
 
     """
+    cache_key = (config['host'], 'entity_fields', entity_type, bundle_type)
+    if cache_key in bundle_schema_cache:
+        bundle_schema_cache_stats['hits'] += 1
+        return list(bundle_schema_cache[cache_key])
+    bundle_schema_cache_stats['misses'] += 1
+
     if ping_content_type(config) == 404:
         message = f"Content type '{config['content_type']}' does not exist on {config['host']}."
         logging.error(message)
@@ -1220,6 +2320,7 @@ def get_entity_fields(config, entity_type, bundle_type):
         # If this request confirms the vocabulary exists, its OK to make some assumptions
         # about what fields it has.
         if fallback_bundle_type_response.status_code == 200:
+            bundle_schema_cache[cache_key] = []
             return []
 
     fields = []
@@ -1244,6 +2345,7 @@ def get_entity_fields(config, entity_type, bundle_type):
         logging.error(message + message_detail + " HTTP response code was " + str(bundle_type_response.status_code) + '.')
         sys.exit('Error: ' + message + ' See the log for more information.')
 
+    bundle_schema_cache[cache_key] = list(fields)
     return fields
 
 
@@ -1305,33 +2407,138 @@ def get_entity_field_storage(config, fieldname, entity_type):
         sys.exit('Error: ' + message)
 
 
-def get_fieldname_map(config, entity_type, bundle_type, keys, die=True):
-    """Get a mapping of field machine names to labels, or labels to machine names.
+def prepare_field_definitions_cache(config):
+    """Creates the table in the SQLite database in config['temp_dir'] used to cache
+       field definitions across Workbench sessions.
+    """
+    create_table_sql = "CREATE TABLE field_definitions_cache (timestamp TIMESTAMP DEFAULT (datetime('now','localtime')) NOT NULL, " + \
+        "host TEXT, entity_type TEXT, bundle TEXT, fingerprint TEXT, field_definitions TEXT, PRIMARY KEY (host, entity_type, bundle))"
+    sqlite_manager(config, operation='create_table', table_name='field_definitions_cache', query=create_table_sql, db_file_path=config['sqlite_db_filename'])
 
-       Note: does not account for multilingual configurations.
 
-        Parameters
+def get_field_definitions_cache_fingerprint(config, entity_type, bundle_type):
+    """Get a fingerprint of the bundle's configuration that changes when its fields change,
+       used to invalidate field definitions cached by write_field_definitions_to_cache().
+    """
+    """Parameters
         ----------
         config : dict
             The configuration settings defined by workbench_config.get_config().
         entity_type : string
             One of 'node', 'media', 'taxonomy_term', or 'paragraph'.
         bundle_type : string
-            The node content type, the vocabulary name, or the media type
-            (image', 'document', 'audio', 'video', 'file', etc.).
-        keys: string
-            One of 'labels' or 'names'. 'labels' returns a dictionary where the field labels are
-            the keys, 'names' returns a dictionary where the field machine names are the keys.
-        die: bool
-            Whether or not to exit if there is a problem generating the map.
+            The node content type, the vocabulary name, the media type, or paragraph type.
+        Returns
+        -------
+        string
+            The Islandora Workbench Integration module's version number and a hash of the
+            bundle's form display configuration, separated by a ':'.
+    """
+    integration_module_version = get_integration_module_version(config)
+    form_display_url = config['host'] + '/entity/entity_form_display/' + entity_type + '.' + bundle_type + '.default?_format=json'
+    form_display_response = issue_request(config, 'GET', form_display_url)
+    if form_display_response.status_code == 200:
+        form_display_hash = hashlib.md5(form_display_response.text.encode()).hexdigest()
+    else:
+        form_display_hash = str(form_display_response.status_code)
+    return f"{integration_module_version}:{form_display_hash}"
+
+
+def get_field_definitions_from_cache(config, entity_type, bundle_type, fingerprint):
+    """Get field definitions cached in a previous Workbench session.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        entity_type : string
+            One of 'node', 'media', 'taxonomy_term', or 'paragraph'.
+        bundle_type : string
+            The node content type, the vocabulary name, the media type, or paragraph type.
+        fingerprint : string
+            The bundle's current fingerprint, from get_field_definitions_cache_fingerprint().
         Returns
         -------
         dict|bool
-            A dictionary with either field labels or machine names as the keys.
-            Returns False if the field labels are not unique.
+            The cached field definitions, or False if they are not cached or if
+            the cached copy's fingerprint doesn't match the current one.
     """
-    # We delete the cached map in check_input() and in Workbench's create(), update(), and
-    # create_terms() functions so the cache is always fresh.
+    prepare_field_definitions_cache(config)
+    query = "select fingerprint, field_definitions from field_definitions_cache where host = ? and entity_type = ? and bundle = ?"
+    res = sqlite_manager(config, operation='select', query=query, values=(config['host'], entity_type, bundle_type), db_file_path=config['sqlite_db_filename'])
+    if len(res) == 0:
+        return False
+    if res[0]['fingerprint'] != fingerprint:
+        logging.info(f'Cached field definitions for {entity_type} "{bundle_type}" are out of date and will be refreshed.')
+        return False
+    return json.loads(res[0]['field_definitions'])
+
+
+def write_field_definitions_to_cache(config, entity_type, bundle_type, fingerprint, field_definitions):
+    """Cache field definitions so they can be used in subsequent Workbench sessions.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        entity_type : string
+            One of 'node', 'media', 'taxonomy_term', or 'paragraph'.
+        bundle_type : string
+            The node content type, the vocabulary name, the media type, or paragraph type.
+        fingerprint : string
+            The bundle's current fingerprint, from get_field_definitions_cache_fingerprint().
+        field_definitions : dict
+            The field definitions, as returned by get_field_definitions().
+        Returns
+        -------
+        None
+    """
+    prepare_field_definitions_cache(config)
+    query = "INSERT OR REPLACE INTO field_definitions_cache (host, entity_type, bundle, fingerprint, field_definitions) VALUES (?, ?, ?, ?, ?)"
+    sqlite_manager(config, operation='insert', query=query,
+                   values=(config['host'], entity_type, bundle_type, fingerprint, json.dumps(field_definitions)),
+                   db_file_path=config['sqlite_db_filename'])
+
+
+def clear_field_definitions_cache(config):
+    """Deletes all field definitions cached for config['host'], so they are
+       retrieved from Drupal the next time they are needed.
+    """
+    prepare_field_definitions_cache(config)
+    sqlite_manager(config, operation='delete', query="delete from field_definitions_cache where host = ?", values=(config['host'],), db_file_path=config['sqlite_db_filename'])
+    for cache_key in list(bundle_schema_cache.keys()):
+        if cache_key[0] == config['host'] and cache_key[1] == 'field_definitions':
+            del bundle_schema_cache[cache_key]
+    logging.info(f"Cached field definitions for {config['host']} deleted.")
+
+
+def get_fieldname_map(config, entity_type, bundle_type, keys, die=True):
+    """Get a mapping of field machine names to labels, or labels to machine names.
+
+       Note: does not account for multilingual configurations.
+
+        Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        entity_type : string
+            One of 'node', 'media', 'taxonomy_term', or 'paragraph'.
+        bundle_type : string
+            The node content type, the vocabulary name, or the media type
+            (image', 'document', 'audio', 'video', 'file', etc.).
+        keys: string
+            One of 'labels' or 'names'. 'labels' returns a dictionary where the field labels are
+            the keys, 'names' returns a dictionary where the field machine names are the keys.
+        die: bool
+            Whether or not to exit if there is a problem generating the map.
+        Returns
+        -------
+        dict|bool
+            A dictionary with either field labels or machine names as the keys.
+            Returns False if the field labels are not unique.
+    """
+    # We delete the cached map in check_input() and in Workbench's create(), update(), and
+    # create_terms() functions so the cache is always fresh.
     fieldname_map_cache_path = os.path.join(config['temp_dir'], f"{entity_type}-{bundle_type}-{keys}.fieldname_map")
     if os.path.exists(fieldname_map_cache_path):
         cache_file = open(fieldname_map_cache_path, 'r')
@@ -1660,7 +2867,8 @@ def check_input(config, args):
 
     check_csv_file_exists(config, 'node_fields')
 
-    # Check column headers in CSV file.
+    # Check column headers in CSV file. The checks on the CSV's rows are registered in 'validation_rules'
+    # as the headers are checked, then all of them are applied during a single pass over 'csv_data'.
     csv_data = get_csv_data(config)
     if config['csv_headers'] == 'labels' and config['task'] in ['create', 'update', 'create_terms', 'update_terms']:
         if config['task'] == 'create_terms' or config['task'] == 'update_terms':
@@ -1669,40 +2877,13 @@ def check_input(config, args):
             fieldname_map_cache_path = os.path.join(config['temp_dir'], f"node-{config['content_type']}-labels.fieldname_map")
         if os.path.exists(fieldname_map_cache_path):
             os.remove(fieldname_map_cache_path)
-        csv_column_headers = replace_field_labels_with_names(config, csv_data.fieldnames)
+        csv_column_headers = list(replace_field_labels_with_names(config, csv_data.fieldnames))
     else:
-        csv_column_headers = csv_data.fieldnames
+        # A copy, since headers are removed from this list below and csv_data still needs them.
+        csv_column_headers = list(csv_data.fieldnames)
 
     # Check whether each row contains the same number of columns as there are headers.
-    row_count = 0
-    for row_count, row in enumerate(csv_data, start=1):
-        extra_headers = False
-        field_count = 0
-        for field in row:
-            # 'stringtopopulateextrafields' is added by get_csv_data() if there are extra headers.
-            if row[field] == 'stringtopopulateextrafields':
-                extra_headers = True
-            else:
-                field_count += 1
-        if extra_headers is True:
-            message = "Row " + str(row_count) + " (ID " + row[config['id_field']] + ") of the CSV file has fewer columns " +  \
-                "than there are headers (" + str(len(csv_column_headers)) + ")."
-            logging.error(message)
-            sys.exit('Error: ' + message)
-        # Note: this message is also generated in get_csv_data() since CSV Writer thows an exception if the row has form fields than headers.
-        if len(csv_column_headers) < field_count:
-            message = "Row " + str(row_count) + " (ID " + row[config['id_field']] + ") of the CSV file has more columns (" +  \
-                str(field_count) + ") than there are headers (" + str(len(csv_column_headers)) + ")."
-            logging.error(message)
-            sys.exit('Error: ' + message)
-    if row_count == 0:
-        message = "Input CSV file " + config['input_csv'] + " has 0 rows."
-        logging.error(message)
-        sys.exit('Error: ' + message)
-    else:
-        message = "OK, all " + str(row_count) + " rows in the CSV file have the same number of columns as there are headers (" + str(len(csv_column_headers)) + ")."
-        print(message)
-        logging.info(message)
+    validation_rules = [CsvColumnCountRule(config, len(csv_column_headers))]
 
     # Task-specific CSV checks.
     langcode_was_present = False
@@ -1726,8 +2907,7 @@ def check_input(config, args):
                 print(message)
                 logging.info(message)
         if 'url_alias' in csv_column_headers:
-            validate_url_aliases_csv_data = get_csv_data(config)
-            validate_url_aliases(config, validate_url_aliases_csv_data)
+            validation_rules.append(UrlAliasesRule(config))
 
         # We populate the ISLANDORA_WORKBENCH_PRIMARY_TASK_EXECUTION_START_TIME environment variable here so secondary
         # tasks can access it during in validate_parent_ids_in_csv_id_to_node_id_map().
@@ -1736,12 +2916,10 @@ def check_input(config, args):
         if config['secondary_tasks'] is not None:
             os.environ["ISLANDORA_WORKBENCH_PRIMARY_TASK_EXECUTION_START_TIME"] = workbench_execution_start_time
         if 'parent_id' in csv_column_headers:
-            validate_parent_ids_precede_children_csv_data = get_csv_data(config)
-            validate_parent_ids_precede_children(config, validate_parent_ids_precede_children_csv_data)
+            validation_rules.append(ParentIdsPrecedeChildrenRule(config))
             prepare_csv_id_to_node_id_map(config)
             if config['query_csv_id_to_node_id_map_for_parents'] is True:
-                validate_parent_ids_in_csv_id_to_node_id_map_csv_data = get_csv_data(config)
-                validate_parent_ids_in_csv_id_to_node_id_map(config, validate_parent_ids_in_csv_id_to_node_id_map_csv_data)
+                validation_rules.append(ParentIdsInCsvIdToNodeIdMapRule(config))
             else:
                 message = "Only node IDs for parents created during this session will be used (not using the CSV ID to node ID map)."
                 print(message)
@@ -1862,20 +3040,14 @@ def check_input(config, args):
         print(message)
         logging.info(message)
 
-        validate_required_fields_have_values_csv_data = get_csv_data(config)
         # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_required_fields_have_values(config, required_drupal_fields_node, validate_required_fields_have_values_csv_data)
-
+        validation_rules.append(RequiredFieldsHaveValuesRule(config, required_drupal_fields_node))
         # Validate dates in 'created' field, if present.
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
         if 'created' in csv_column_headers:
-            validate_node_created_csv_data = get_csv_data(config)
-            validate_node_created_date(config, validate_node_created_csv_data)
+            validation_rules.append(NodeCreatedDateRule(config))
         # Validate user IDs in 'uid' field, if present.
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
         if 'uid' in csv_column_headers:
-            validate_node_uid_csv_data = get_csv_data(config)
-            validate_node_uid(config, validate_node_uid_csv_data)
+            validation_rules.append(NodeUidRule(config))
 
     if config['task'] == 'update':
         if 'node_id' not in csv_column_headers:
@@ -1884,8 +3056,7 @@ def check_input(config, args):
             sys.exit('Error: ' + message)
         if 'url_alias' in csv_column_headers:
             # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-            validate_url_aliases_csv_data = get_csv_data(config)
-            validate_url_aliases(config, validate_url_aliases_csv_data)
+            validation_rules.append(UrlAliasesRule(config))
         field_definitions = get_field_definitions(config, 'node')
         drupal_fieldnames = []
         for drupal_fieldname in field_definitions:
@@ -1923,23 +3094,13 @@ def check_input(config, args):
 
     # If the task is update media, check if all media_id values are valid.
     if config['task'] == 'update_media':
-        csv_data = get_csv_data(config)
-        row_number = 1
-        for row in csv_data:
-            media_id = extract_media_id(config, row)  # Extract the media ID from the CSV row.
-            if media_id is None:  # If the media ID is invalid, this is an error and we stop.
-                message = 'Error: Invalid media ID in row ' + str(row_number) + ' of the CSV file.'
-                logging.error(message)
-                sys.exit(message)
-            row_number += 1
+        validation_rules.append(MediaIdsRule(config))
 
     if config['task'] == 'add_media' or config['task'] == 'create' and config['nodes_only'] is False:
         # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
         validate_media_use_tid(config)
         # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_media_use_tid_values_csv_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_media_use_tids_in_csv(config, validate_media_use_tid_values_csv_data)
+        validation_rules.append(MediaUseTidsRule(config))
 
         if config['fixity_algorithm'] is not None:
             allowed_algorithms = ['md5', 'sha1', 'sha256']
@@ -1952,31 +3113,7 @@ def check_input(config, args):
             print("Performing local checksum validation. This might take some time.")
             if 'file' in csv_column_headers and 'checksum' in csv_column_headers:
                 # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-                validate_checksums_csv_data = get_csv_data(config)
-                if config['task'] == 'add_media':
-                    row_id = 'node_id'
-                else:
-                    row_id = config['id_field']
-                checksum_validation_all_ok = True
-                for checksum_validation_row_count, checksum_validation_row in enumerate(validate_checksums_csv_data, start=1):
-                    file_path = checksum_validation_row['file']
-                    hash_from_local = get_file_hash_from_local(config, file_path, config['fixity_algorithm'])
-                    if 'checksum' in checksum_validation_row:
-                        if hash_from_local == checksum_validation_row['checksum'].strip():
-                            logging.info('Local %s checksum and value in the CSV "checksum" field for file "%s" (%s) match.', config['fixity_algorithm'], file_path, hash_from_local)
-                        else:
-                            checksum_validation_all_ok = False
-                            logging.warning('Local %s checksum and value in the CSV "checksum" field for file "%s" (named in CSV row "%s") do not match (local: %s, CSV: %s).',
-                                            config['fixity_algorithm'], file_path, checksum_validation_row[row_id], hash_from_local, checksum_validation_row['checksum'])
-
-                if checksum_validation_all_ok is True:
-                    checksum_validation_message = "OK, checksum validation during complete. All checks pass."
-                    logging.info(checksum_validation_message)
-                    print(checksum_validation_message + " See the log for more detail.")
-                else:
-                    checksum_validation_message = "Not all checksum validation passed."
-                    logging.warning(checksum_validation_message)
-                    print("Warning: " + checksum_validation_message + " See the log for more detail.")
+                validation_rules.append(ChecksumsRule(config))
 
     if config['task'] == 'create_terms':
         # Check that all required fields are present in the CSV.
@@ -1985,10 +3122,9 @@ def check_input(config, args):
         # Check here that all required fields are present in the CSV.
         required_fields = get_required_bundle_fields(config, 'taxonomy_term', config['vocab_id'])
         required_fields.insert(0, 'term_name')
-        required_fields_check_csv_data = get_csv_data(config)
         missing_fields = []
         for required_field in required_fields:
-            if required_field not in required_fields_check_csv_data.fieldnames:
+            if required_field not in csv_data.fieldnames:
                 missing_fields.append(required_field)
         if len(missing_fields) > 0:
             message = 'Required columns missing from input CSV file: ' + joiner.join(missing_fields) + '.'
@@ -1997,12 +3133,7 @@ def check_input(config, args):
 
         # Validate length of 'term_name'.
         # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_term_name_csv_data = get_csv_data(config)
-        for count, row in enumerate(validate_term_name_csv_data, start=1):
-            if 'term_name' in row and len(row['term_name']) > 255:
-                message = "The 'term_name' column in row for term '" + row['term_name'] + "' of your CSV file exceeds Drupal's maximum length of 255 characters."
-                logging.error(message)
-                sys.exit('Error: ' + message)
+        validation_rules.append(TermNameLengthRule(config))
 
     if config['task'] == 'update_terms':
         if 'term_id' not in csv_column_headers:
@@ -2034,115 +3165,50 @@ def check_input(config, args):
 
         # Validate length of 'term_name'.
         # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_term_name_csv_data = get_csv_data(config)
-        for count, row in enumerate(validate_term_name_csv_data, start=1):
-            if 'term_name' in row and len(row['term_name']) > 255:
-                message = "The 'term_name' column in row for term '" + row['term_name'] + "' of your CSV file exceeds Drupal's maximum length of 255 characters."
-                logging.error(message)
-                sys.exit('Error: ' + message)
+        validation_rules.append(TermNameLengthRule(config))
 
     if config['task'] == 'create_terms' or config['task'] == 'update_terms':
         # Check that all required fields are present in the CSV.
         field_definitions = get_field_definitions(config, 'taxonomy_term', config['vocab_id'])
-        validate_geolocation_values_csv_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_geolocation_fields(config, field_definitions, validate_geolocation_values_csv_data)
-
-        validate_link_values_csv_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_link_fields(config, field_definitions, validate_link_values_csv_data)
-
-        validate_authority_link_values_csv_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_authority_link_fields(config, field_definitions, validate_authority_link_values_csv_data)
-
-        validate_edtf_values_csv_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_edtf_fields(config, field_definitions, validate_edtf_values_csv_data)
-
-        validate_csv_field_cardinality_csv_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_csv_field_cardinality(config, field_definitions, validate_csv_field_cardinality_csv_data)
-
-        validate_csv_field_length_csv_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_csv_field_length(config, field_definitions, validate_csv_field_length_csv_data)
-
-        validate_taxonomy_field_csv_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        warn_user_about_taxo_terms = validate_taxonomy_field_values(config, field_definitions, validate_taxonomy_field_csv_data)
-        if warn_user_about_taxo_terms is True:
-            print('Warning: Issues detected with validating taxonomy field values in the CSV file. See the log for more detail.')
-
-        validate_typed_relation_csv_data = get_csv_data(config)
+        # All of these rules are applied during a single pass over the CSV data.
         # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        warn_user_about_typed_relation_terms = validate_typed_relation_field_values(config, field_definitions, validate_typed_relation_csv_data)
-        if warn_user_about_typed_relation_terms is True:
-            print('Warning: Issues detected with validating typed relation field values in the CSV file. See the log for more detail.')
+        validation_rules.extend([
+            GeolocationFieldsRule(config, field_definitions),
+            LinkFieldsRule(config, field_definitions),
+            AuthorityLinkFieldsRule(config, field_definitions),
+            EdtfFieldsRule(config, field_definitions),
+            FieldCardinalityRule(config, field_definitions),
+            FieldLengthRule(config, field_definitions),
+            TaxonomyFieldValuesRule(config, field_definitions),
+            TypedRelationFieldValuesRule(config, field_definitions)
+        ])
+        if config['preload_vocabularies'] is True:
+            preload_vocabularies(config, field_definitions, csv_data.fieldnames)
 
     if config['task'] == 'update' or config['task'] == 'create':
         field_definitions = get_field_definitions(config, 'node')
-        validate_geolocation_values_csv_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_geolocation_fields(config, field_definitions, validate_geolocation_values_csv_data)
-
-        validate_link_values_csv_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_link_fields(config, field_definitions, validate_link_values_csv_data)
-
-        validate_authority_link_values_csv_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_authority_link_fields(config, field_definitions, validate_authority_link_values_csv_data)
-
-        validate_edtf_values_csv_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_edtf_fields(config, field_definitions, validate_edtf_values_csv_data)
-
-        validate_csv_field_cardinality_csv_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_csv_field_cardinality(config, field_definitions, validate_csv_field_cardinality_csv_data)
-
-        validate_csv_field_length_csv_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_csv_field_length(config, field_definitions, validate_csv_field_length_csv_data)
-
-        validate_text_list_fields_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_text_list_fields(config, field_definitions, validate_text_list_fields_data)
-
-        validate_taxonomy_field_csv_data = get_csv_data(config)
+        # All of these rules are applied during a single pass over the CSV data.
         # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        warn_user_about_taxo_terms = validate_taxonomy_field_values(config, field_definitions, validate_taxonomy_field_csv_data)
-        if warn_user_about_taxo_terms is True:
-            print('Warning: Issues detected with validating taxonomy field values in the CSV file. See the log for more detail.')
-
-        validate_typed_relation_csv_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        warn_user_about_typed_relation_terms = validate_typed_relation_field_values(config, field_definitions, validate_typed_relation_csv_data)
-        if warn_user_about_typed_relation_terms is True:
-            print('Warning: Issues detected with validating typed relation field values in the CSV file. See the log for more detail.')
-
-        validate_media_track_csv_data = get_csv_data(config)
-        # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
-        validate_media_track_fields(config, validate_media_track_csv_data)
-
-        # Validate existence of nodes specified in 'field_member_of'. This could be generalized out to validate node IDs in other fields.
-        # See https://github.com/mjordan/islandora_workbench/issues/90.
+        validation_rules.extend([
+            GeolocationFieldsRule(config, field_definitions),
+            LinkFieldsRule(config, field_definitions),
+            AuthorityLinkFieldsRule(config, field_definitions),
+            EdtfFieldsRule(config, field_definitions),
+            FieldCardinalityRule(config, field_definitions),
+            FieldLengthRule(config, field_definitions),
+            TextListFieldsRule(config, field_definitions),
+            TaxonomyFieldValuesRule(config, field_definitions),
+            TypedRelationFieldValuesRule(config, field_definitions),
+            MediaTrackFieldsRule(config)
+        ])
+        if config['preload_vocabularies'] is True:
+            preload_vocabularies(config, field_definitions, csv_data.fieldnames)
+
+        # Validate existence of nodes specified in 'field_member_of'.
         # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
         if config['validate_parent_node_exists'] is True:
-            validate_field_member_of_csv_data = get_csv_data(config)
-            for count, row in enumerate(validate_field_member_of_csv_data, start=1):
-                if 'field_member_of' in csv_column_headers:
-                    parent_nids = row['field_member_of'].split(config['subdelimiter'])
-                    for parent_nid in parent_nids:
-                        if len(parent_nid) > 0:
-                            parent_node_exists = ping_node(config, parent_nid)
-                            if parent_node_exists is False:
-                                message = "The 'field_member_of' field in row with ID '" + row[config['id_field']] + \
-                                    "' of your CSV file contains a node ID (" + parent_nid + ") that " + \
-                                    "doesn't exist or is not accessible. See the workbench log for more information."
-                                logging.error(message)
-                                sys.exit('Error: ' + message)
+            if 'field_member_of' in csv_column_headers:
+                validation_rules.append(FieldMemberOfRule(config))
         else:
             message = '"validate_parent_node_exists" is set to false. Node IDs in "field_member_of" that do not exist or are not accessible ' + \
                 'will result in 422 errors in "create" and "update" tasks.'
@@ -2151,13 +3217,7 @@ def check_input(config, args):
         # Validate 'langcode' values if that field exists in the CSV.
         # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
         if langcode_was_present:
-            validate_langcode_csv_data = get_csv_data(config)
-            for count, row in enumerate(validate_langcode_csv_data, start=1):
-                langcode_valid = validate_language_code(row['langcode'])
-                if not langcode_valid:
-                    message = "Row with ID " + row[config['id_field']] + " of your CSV file contains an invalid Drupal language code (" + row['langcode'] + ") in its 'langcode' column."
-                    logging.error(message)
-                    sys.exit('Error: ' + message)
+            validation_rules.append(LangcodeRule(config))
 
     if config['task'] == 'delete':
         if 'node_id' not in csv_column_headers:
@@ -2197,108 +3257,19 @@ def check_input(config, args):
                 config['id_field'] = 'node_id'
             if config['task'] == 'update_media':
                 config['id_field'] = 'media_id'
-            file_check_csv_data = get_csv_data(config)
             # It is not a requirement that the 'file' column be present in the CSV file if the task is update_media.
-            for count, file_check_row in enumerate(file_check_csv_data, start=1):
-                file_check_row['file'] = file_check_row['file'].strip()
-                # Check for empty 'file' values.
-                if len(file_check_row['file']) == 0:
-                    message = 'CSV row with ID ' + file_check_row[config['id_field']] + ' contains an empty "file" value.'
-                    if config['perform_soft_checks'] is False and config['allow_missing_files'] is False:
-                        logging.error(message)
-                        sys.exit('Error: ' + message)
-                    else:
-                        if file_check_row[config['id_field']] not in rows_with_missing_files:
-                            rows_with_missing_files.append(file_check_row[config['id_field']])
-                            logging.warning(message)
-                # Check for URLs.
-                elif file_check_row['file'].startswith('http'):
-                    http_response_code = ping_remote_file(config, file_check_row['file'])
-                    if http_response_code != 200 or ping_remote_file(config, file_check_row['file']) is False:
-                        message = 'Remote file "' + file_check_row['file'] + '" identified in CSV "file" column for record with ID "' \
-                            + file_check_row[config['id_field']] + '" not found or not accessible (HTTP response code ' + str(http_response_code) + ').'
-                        if config['perform_soft_checks'] is False and config['allow_missing_files'] is False:
-                            logging.error(message)
-                            sys.exit('Error: ' + message)
-                        else:
-                            if file_check_row[config['id_field']] not in rows_with_missing_files:
-                                rows_with_missing_files.append(file_check_row[config['id_field']])
-                                logging.error(message)
-                # Check for files that cannot be found.
-                else:
-                    if os.path.isabs(file_check_row['file']):
-                        file_path = file_check_row['file']
-                    else:
-                        file_path = os.path.join(config['input_dir'], file_check_row['file'])
-                    if not os.path.exists(file_path) or not os.path.isfile(file_path):
-                        message = 'File "' + file_path + '" identified in CSV "file" column for record with ID field value "' \
-                            + file_check_row[config['id_field']] + '" not found.'
-                        if config['perform_soft_checks'] is False:
-                            logging.error(message)
-                            sys.exit('Error: ' + message)
-                        else:
-                            if file_check_row[config['id_field']] not in rows_with_missing_files:
-                                rows_with_missing_files.append(file_check_row[config['id_field']])
-                                logging.error(message)
-
-            # @todo for issue 268: All accumulator variables like 'rows_with_missing_files' should be checked at end of
-            # check_input() (to work with perform_soft_checks: True) in addition to at place of check (to work wit perform_soft_checks: False).
-            if len(rows_with_missing_files) > 0:
-                if config['allow_missing_files'] is True:
-                    message = 'OK, missing or empty CSV "file" column values detected, but the "allow_missing_files" configuration setting is enabled.'
-                    print(message + " See the log for more information.")
-                    logging.info(message + " Details are logged above.")
-            else:
-                message = 'OK, files named in the CSV "file" column are all present.'
-                print(message)
-                logging.info(message)
+            validation_rules.append(FilesRule(config, rows_with_missing_files))
 
             # Verify that all media bundles/types exist.
             if config['nodes_only'] is False:
-                media_type_check_csv_data = get_csv_data(config)
-                for count, file_check_row in enumerate(media_type_check_csv_data, start=1):
-                    filename_fields_to_check = ['file']
-                    for filename_field in filename_fields_to_check:
-                        if len(file_check_row[filename_field]) != 0:
-                            media_type = set_media_type(config, file_check_row[filename_field], filename_field, file_check_row)
-                            media_bundle_response_code = ping_media_bundle(config, media_type)
-                            if media_bundle_response_code == 404:
-                                message = 'File "' + file_check_row[filename_field] + '" identified in CSV row ' + file_check_row[config['id_field']] + \
-                                    ' will create a media of type (' + media_type + '), but that media type is not configured in the destination Drupal.' + \
-                                    ' Please make sure your media type configuration matches your Drupal configuration.'
-                                logging.error(message)
-                                sys.exit('Error: ' + message)
-
-                            # Check that each file's extension is allowed for the current media type. 'file' is the only
-                            # CSV field to check here. Files added using the 'additional_files' setting are checked below.
-                            if file_check_row['file'].startswith('http'):
-                                # First check to see if the file has an extension.
-                                extension = os.path.splitext(file_check_row['file'])[1]
-                                if len(extension) > 0:
-                                    extension = extension.lstrip('.')
-                                    extension = extension.lstrip('.')
-                                else:
-                                    extension = get_remote_file_extension(config, file_check_row['file'])
-                                    extension = extension.lstrip('.')
-                            else:
-                                extension = os.path.splitext(file_check_row['file'])[1]
-                                extension = extension.lstrip('.').lower()
-                            media_type_file_field = config['media_type_file_fields'][media_type]
-                            registered_extensions = get_registered_media_extensions(config, media_type, media_type_file_field)
-                            if isinstance(extension, str) and isinstance(registered_extensions, dict) and extension not in registered_extensions[media_type_file_field]:
-                                message = 'File "' + file_check_row[filename_field] + '" in CSV row "' + file_check_row[config['id_field']] + \
-                                    '" has an extension (' + str(extension) + ') that is not allowed in the "' + media_type_file_field + '" field of the "' + media_type + '" media type.'
-                                logging.error(message)
-                                if config['perform_soft_checks'] is False:
-                                    sys.exit('Error: ' + message)
+                validation_rules.append(MediaTypesRule(config))
 
     # Check existence of fields identified in 'additional_files' config setting.
     if (config['task'] == 'create' or config['task'] == 'add_media') and config['nodes_only'] is False and config['paged_content_from_directories'] is False:
         if 'additional_files' in config and len(config['additional_files']) > 0:
             additional_files_entries = get_additional_files_config(config)
-            additional_files_check_csv_data = get_csv_data(config)
             additional_files_fields = additional_files_entries.keys()
-            additional_files_fields_csv_headers = additional_files_check_csv_data.fieldnames
+            additional_files_fields_csv_headers = csv_data.fieldnames
             if config['nodes_only'] is False:
                 for additional_file_field in additional_files_fields:
                     if additional_file_field not in additional_files_fields_csv_headers:
@@ -2311,116 +3282,27 @@ def check_input(config, args):
                 for additional_files_media_use_field, additional_files_media_use_tid in additional_files_entries.items():
                     validate_media_use_tid_in_additional_files_setting(config, additional_files_media_use_tid, additional_files_media_use_field)
 
-            missing_additional_files = False
-            for count, file_check_row in enumerate(additional_files_check_csv_data, start=1):
-                for additional_file_field in additional_files_fields:
-                    file_check_row[additional_file_field] = file_check_row[additional_file_field].strip()
-                    if len(file_check_row[additional_file_field]) == 0:
-                        missing_additional_files = True
-                        message = 'CVS row ' + file_check_row[config['id_field']] + ' contains an empty "' + additional_file_field + '" value.'
-                        if config['allow_missing_files'] is False:
-                            logging.error(message)
-                            sys.exit('Error: ' + message)
-                        else:
-                            logging.warning(message)
-
-                    if file_check_row[additional_file_field].startswith('http'):
-                        http_response_code = ping_remote_file(config, file_check_row[additional_file_field])
-                        if http_response_code != 200 or ping_remote_file(config, file_check_row[additional_file_field]) is False:
-                            message = 'Remote file ' + file_check_row[additional_file_field] + ' identified in CSV "' + additional_file_field + '" column for record with ID ' \
-                                + file_check_row[config['id_field']] + ' not found or not accessible (HTTP response code ' + str(http_response_code) + ').'
-                            if config['allow_missing_files'] is False:
-                                logging.error(message)
-                                sys.exit('Error: ' + message)
-                            else:
-                                logging.warning(message)
-                    else:
-                        if len(file_check_row[additional_file_field]) > 0:
-                            if check_file_exists(config, file_check_row[additional_file_field]) is False:
-                                message = 'File "' + file_check_row[additional_file_field] + '" in column "' + additional_file_field + '" in CVS row ' + \
-                                    file_check_row[config['id_field']] + ' not found.'
-                                logging.warning(message)
-
-            if missing_additional_files is True:
-                message = 'Some files in fields configured as "additional_file_fields" are missing. Please see the log for more information.'
-                print(message)
-                if config['allow_missing_files'] is False:
-                    sys.exit('Error ' + message)
-            else:
-                message = 'OK, files in fields configured as "additional_file_fields" are all present.'
-                logging.info(message)
-                print(message)
+            validation_rules.append(AdditionalFilesRule(config))
 
         # @todo: add the 'rows_with_missing_files' method of accumulating invalid values (issue 268).
         if 'additional_files' in config and len(config['additional_files']) > 0 and config['nodes_only'] is False:
-            additional_files_check_extensions_csv_data = get_csv_data(config)
             # Check media types for files registered in 'additional_files'.
-            for count, file_check_row in enumerate(additional_files_check_extensions_csv_data, start=1):
-                for additional_file_field in additional_files_fields:
-                    if len(file_check_row[additional_file_field].strip()) > 0:
-                        media_type = set_media_type(config, file_check_row[additional_file_field], additional_file_field, file_check_row)
-                        media_bundle_response_code = ping_media_bundle(config, media_type)
-                        if media_bundle_response_code == 404:
-                            message = 'File "' + file_check_row[additional_file_field] + '" identified in CSV row ' + file_check_row[config['id_field']] + \
-                                ' will create a media of type (' + media_type + '), but that media type is not configured in the destination Drupal.' + \
-                                ' Please make sure your media type configuration matches your Drupal configuration.'
-                            logging.error(message)
-                            sys.exit('Error: ' + message)
-
-                        # Check that each file's extension is allowed for the current media type.
-                        additional_filenames = file_check_row[additional_file_field].split(config['subdelimiter'])
-                        media_type_file_field = config['media_type_file_fields'][media_type]
-                        for additional_filename in additional_filenames:
-                            if additional_filename.startswith('http'):
-                                # First check to see if the file has an extension.
-                                extension = os.path.splitext(additional_filename)[1]
-                                if len(extension) > 0:
-                                    extension = extension.lstrip('.')
-                                    extension = extension.lstrip('.')
-                                else:
-                                    extension = get_remote_file_extension(config, additional_filename)
-                                    extension = extension.lstrip('.')
-                            else:
-                                if check_file_exists(config, additional_filename):
-                                    extension = os.path.splitext(additional_filename)
-                                    extension = extension[1].lstrip('.').lower()
-                                else:
-                                    additional_file_not_found_message = f'File "{additional_filename}" in column "{additional_file_field}" in CVS row "' + \
-                                        file_check_row[config['id_field']] + '" not found.'
-                                    logging.warning(additional_file_not_found_message)
-                                    continue
-
-                            registered_extensions = get_registered_media_extensions(config, media_type, media_type_file_field)
-                            if extension not in registered_extensions[media_type_file_field]:
-                                message = 'File "' + additional_filename + '" in the "' + additional_file_field + '" field of row "' + file_check_row[config['id_field']] + \
-                                    '" has an extension (' + str(extension) + ') that is allowed in the "' + media_type_file_field + '" field of the "' + media_type + '" media type.'
-                                logging.error(message)
-                                sys.exit('Error: ' + message)
+            validation_rules.append(AdditionalFilesMediaTypesRule(config))
 
     if config['task'] == 'create' and config['paged_content_from_directories'] is True:
         if 'paged_content_page_model_tid' not in config:
             message = 'If you are creating paged content, you must include "paged_content_page_model_tid" in your configuration.'
             logging.error('Configuration requires "paged_content_page_model_tid" setting when creating paged content.')
             sys.exit('Error: ' + message)
-        paged_content_from_directories_csv_data = get_csv_data(config)
-        for count, file_check_row in enumerate(paged_content_from_directories_csv_data, start=1):
-            dir_path = os.path.join(config['input_dir'], file_check_row[config['id_field']])
-            if not os.path.exists(dir_path) or os.path.isfile(dir_path):
-                message = 'Page directory ' + dir_path + ' for CSV record with ID "' + file_check_row[config['id_field']] + '"" not found.'
-                logging.error(message)
-                sys.exit('Error: ' + message)
-            page_files = os.listdir(dir_path)
-            if len(page_files) == 0:
-                message = 'Page directory ' + dir_path + ' is empty.'
-                print("Warning: " + message)
-                logging.warning(message)
-            for page_file_name in page_files:
-                if config['paged_content_sequence_separator'] not in page_file_name:
-                    message = 'Page file ' + os.path.join(dir_path, page_file_name) + ' does not contain a sequence separator (' + config['paged_content_sequence_separator'] + ').'
-                    logging.error(message)
-                    sys.exit('Error: ' + message)
+        validation_rules.append(PagedContentDirectoriesRule(config))
 
-        print('OK, page directories are all present.')
+    # All of the checks on the CSV's rows are applied during a single pass over the CSV data.
+    run_csv_validation_rules(config, csv_data, validation_rules)
+    for validation_rule in validation_rules:
+        if isinstance(validation_rule, TaxonomyFieldValuesRule) and validation_rule.vocab_validation_issues is True:
+            print('Warning: Issues detected with validating taxonomy field values in the CSV file. See the log for more detail.')
+        if isinstance(validation_rule, TypedRelationFieldValuesRule) and validation_rule.vocab_validation_issues is True:
+            print('Warning: Issues detected with validating typed relation field values in the CSV file. See the log for more detail.')
 
     # Check for bootstrap scripts, if any are configured.
     bootsrap_scripts_present = False
@@ -2799,6 +3681,71 @@ def get_target_ids(node_field_values):
     return target_ids
 
 
+def get_changed_node_fields(node, node_field_values):
+    """Compares the fields in a node dictionary assembled for a PATCH request (e.g. by the
+       field classes' update() methods) with the node's current values, and returns the fields
+       whose values would change. Only the properties Workbench sets on each field value
+       (e.g. 'target_id' and 'target_type', but not 'url' or 'target_uuid') are compared.
+    """
+    """Parameters
+        ----------
+        node : dict
+            The node's fields, as they will be sent in the PATCH request.
+        node_field_values : dict
+            The node's current fields, as returned by Drupal.
+        Returns
+        -------
+        dict
+            The fields in node whose values differ from the node's current values.
+    """
+    changed_fields = dict()
+    for field_name, field_values in node.items():
+        # The content type can't be changed in a PATCH request and needs to be included in it.
+        if field_name == 'type':
+            continue
+        if field_values_match(field_values, node_field_values.get(field_name, [])) is False:
+            changed_fields[field_name] = field_values
+    return changed_fields
+
+
+def field_values_match(new_field_values, existing_field_values):
+    """Tests whether field values assembled by Workbench are the same as existing field values
+       from Drupal, comparing only the properties present in Workbench's values.
+    """
+    """Parameters
+        ----------
+        new_field_values : list
+            Field values assembled by Workbench, e.g. [{'target_id': '10', 'target_type': 'taxonomy_term'}].
+        existing_field_values : list
+            The field's values as returned by Drupal.
+        Returns
+        -------
+        bool
+            True if the values match, False if not.
+    """
+    if len(new_field_values) != len(existing_field_values):
+        return False
+
+    def normalize(value):
+        # Drupal returns booleans, integers, and floats where Workbench uses strings. Other
+        # values are compared as they are, so changes to whitespace alone are still sent.
+        if isinstance(value, bool):
+            return '1' if value else '0'
+        if value is None:
+            return ''
+        return str(value)
+
+    for new_value, existing_value in zip(new_field_values, existing_field_values):
+        if not isinstance(new_value, dict) or not isinstance(existing_value, dict):
+            if new_value != existing_value:
+                return False
+            continue
+        for property_name, property_value in new_value.items():
+            if normalize(property_value) != normalize(existing_value.get(property_name)):
+                return False
+    return True
+
+
 def get_additional_files_config(config):
     """Converts values in 'additional_files' config setting to a simple
        dictionary for easy access.
@@ -3103,17 +4050,7 @@ def validate_media_use_tid(config, media_use_tid_value_from_csv=None, csv_row_id
 def validate_media_use_tids_in_csv(config, csv_data):
     """Validate 'media_use_tid' values in CSV if they exist.
     """
-    if config['task'] == 'add_media':
-        csv_id_field = 'node_id'
-    else:
-        csv_id_field = config['id_field']
-
-    for count, row in enumerate(csv_data, start=1):
-        if 'media_use_tid' in row:
-            delimited_field_values = row['media_use_tid'].split(config['subdelimiter'])
-            for field_value in delimited_field_values:
-                if len(field_value.strip()) > 0:
-                    validate_media_use_tid(config, field_value, row[csv_id_field])
+    run_csv_validation_rules(config, csv_data, [MediaUseTidsRule(config)])
 
 
 def preprocess_field_data(subdelimiter, field_value, path_to_script):
@@ -3148,8 +4085,9 @@ def execute_shutdown_script(path_to_script, path_to_config_file):
 def execute_entity_post_task_script(path_to_script, path_to_config_file, http_response_code, entity_json=''):
     """Executes a entity-level post-task script and returns its output and exit status code.
     """
-    cmd = subprocess.Popen([path_to_script, path_to_config_file, str(http_response_code), entity_json], stdout=subprocess.PIPE)
-    result, stderrdata = cmd.communicate()
+    with time_row_stage('scripts'):
+        cmd = subprocess.Popen([path_to_script, path_to_config_file, str(http_response_code), entity_json], stdout=subprocess.PIPE)
+        result, stderrdata = cmd.communicate()
 
     return result, cmd.returncode
 
@@ -3239,7 +4177,8 @@ def create_file(config, filename, file_fieldname, node_csv_row, node_id):
             return False
 
         filename_parts = urllib.parse.urlparse(filename)
-        file_path = download_remote_file(config, filename, file_fieldname, node_csv_row, node_id)
+        with time_row_stage('download'):
+            file_path = download_remote_file(config, filename, file_fieldname, node_csv_row, node_id)
         if file_path is False:
             return False
         filename = file_path.split("/")[-1]
@@ -3280,19 +4219,32 @@ def create_file(config, filename, file_fieldname, node_csv_row, node_id):
         'Content-Disposition': 'file; filename="' + filename + '"'
     }
 
-    binary_data = open(file_path, 'rb')
+    # Hash the file as it is uploaded so it doesn't need to be read again to validate its fixity.
+    upload_hash_algorithms = []
+    if config['fixity_algorithm'] is not None and file_fieldname == 'file':
+        upload_hash_algorithms.append(config['fixity_algorithm'])
+    binary_data = HashingFileReader(config, open(file_path, 'rb'), upload_hash_algorithms)
+    file_size = os.fstat(binary_data.fileno()).st_size
 
     try:
         file_response = issue_request(config, 'POST', file_endpoint_path, file_headers, '', binary_data)
+        # Close the file before it is (potentially) deleted below.
+        binary_data.close()
         if file_response.status_code == 201:
+            add_row_bytes_uploaded(file_size)
             file_json = json.loads(file_response.text)
             file_id = file_json['fid'][0]['value']
             # For now, we can only validate checksums for files named in the 'file' CSV column.
             # See https://github.com/mjordan/islandora_workbench/issues/307.
             if config['fixity_algorithm'] is not None and file_fieldname == 'file':
                 file_uuid = file_json['uuid'][0]['value']
-                hash_from_drupal = get_file_hash_from_drupal(config, file_uuid, config['fixity_algorithm'])
-                hash_from_local = get_file_hash_from_local(config, file_path, config['fixity_algorithm'])
+                with time_row_stage('fixity'):
+                    hash_from_drupal = get_file_hash_from_drupal(config, file_uuid, config['fixity_algorithm'])
+                    hashes_from_upload = binary_data.get_hashes()
+                    if hashes_from_upload is not False:
+                        hash_from_local = hashes_from_upload[config['fixity_algorithm']]
+                    else:
+                        hash_from_local = get_file_hash_from_local(config, file_path, config['fixity_algorithm'])
                 if hash_from_drupal == hash_from_local:
                     logging.info('Local and Drupal %s checksums for file "%s" (%s) match.', config['fixity_algorithm'], file_path, hash_from_local)
                 else:
@@ -3322,9 +4274,11 @@ def create_file(config, filename, file_fieldname, node_csv_row, node_id):
     except requests.exceptions.RequestException as e:
         logging.error(e)
         return False
+    finally:
+        binary_data.close()
 
 
-def create_media(config, filename, file_fieldname, node_id, csv_row, media_use_tid=None):
+def create_media(config, filename, file_fieldname, node_id, csv_row, media_use_tid=None, journal_key=None):
     """Creates a media in Drupal.
 
            Parameters
@@ -3343,6 +4297,10 @@ def create_media(config, filename, file_fieldname, node_id, csv_row, media_use_t
                 media (e.g. during 'add_media' tasks).
             media_use_tid : int|str
                 A valid term ID (or a subdelimited list of IDs) from the Islandora Media Use vocabulary.
+            journal_key : string
+                The CSV row's key in the resume journal, from get_resume_journal_key(). If present, media
+                created for the same row and field in a previous run are not created again, and a file
+                uploaded in a previous run is used instead of uploading it again.
             Returns
             -------
             int|False
@@ -3353,6 +4311,10 @@ def create_media(config, filename, file_fieldname, node_id, csv_row, media_use_t
     if config['nodes_only'] is True:
         return
 
+    if get_resume_journal_stage(journal_key, 'media_created:' + file_fieldname) is not None:
+        logging.info(f'Media for "{filename}" was created in a previous run, not creating it again.')
+        return 201
+
     # Importing the workbench_fields module at the top of this module with the
     # rest of the imports causes a circular import exception, so we do it here.
     import workbench_fields
@@ -3366,8 +4328,13 @@ def create_media(config, filename, file_fieldname, node_id, csv_row, media_use_t
     if media_type in get_oembed_media_types(config):
         # file_result must be an integer.
         file_result = -1
+    elif get_resume_journal_stage(journal_key, 'file_uploaded:' + file_fieldname) is not None:
+        file_result = int(get_resume_journal_stage(journal_key, 'file_uploaded:' + file_fieldname))
+        logging.info(f'Using file {file_result} uploaded for "{filename}" in a previous run.')
     else:
         file_result = create_file(config, filename, file_fieldname, csv_row, node_id)
+        if isinstance(file_result, int) and file_result > 0:
+            record_resume_journal_stage(config, journal_key, 'file_uploaded:' + file_fieldname, file_result)
 
     if filename.startswith('http'):
         if file_result > 0:
@@ -3643,6 +4610,8 @@ def create_media(config, filename, file_fieldname, node_id, csv_row, media_use_t
                 logging.error('Media not created, POST request to "%s" returned an HTTP status code of "%s" and a response body of %s.',
                               media_endpoint_path, media_response.status_code, media_response.content)
                 logging.error('JSON request body used in previous POST to "%s" was %s.', media_endpoint_path, media_json)
+            else:
+                record_resume_journal_stage(config, journal_key, 'media_created:' + file_fieldname)
 
             if len(media_use_tids) > 1:
                 media_response_body = json.loads(media_response.text)
@@ -3881,14 +4850,18 @@ def get_csv_data(config, csv_file_target='node_fields', file_path=None):
         input_csv_path = file_path
     elif file_path.startswith('http') is True:
         input_csv_path = get_extracted_csv_file_path(config)
-        if os.path.exists(input_csv_path):
-            os.remove(input_csv_path)
-        get_csv_from_google_sheet(config)
+        # Only download the Google Sheet once per run.
+        if input_csv_path not in csv_file_content_hashes or not os.path.exists(input_csv_path):
+            if os.path.exists(input_csv_path):
+                os.remove(input_csv_path)
+            get_csv_from_google_sheet(config)
     elif file_path.endswith('.xlsx') is True:
         input_csv_path = get_extracted_csv_file_path(config)
-        if os.path.exists(input_csv_path):
-            os.remove(input_csv_path)
-        get_csv_from_excel(config)
+        # Only extract the CSV data from the Excel file once per run.
+        if input_csv_path not in csv_file_content_hashes or not os.path.exists(input_csv_path):
+            if os.path.exists(input_csv_path):
+                os.remove(input_csv_path)
+            get_csv_from_excel(config)
     else:
         input_csv_path = os.path.join(config['input_dir'], file_path)
 
@@ -3897,6 +4870,16 @@ def get_csv_data(config, csv_file_target='node_fields', file_path=None):
         logging.error(message)
         sys.exit("Error: " + message)
 
+    # If the input CSV and the configuration settings that affect preprocessing haven't
+    # changed since we last preprocessed it during this run, reuse the preprocessed file.
+    preprocessed_csv_path = os.path.join(config['temp_dir'], os.path.basename(input_csv_path)) + '.preprocessed'
+    preprocessed_csv_cache_key = get_preprocessed_csv_cache_key(config, csv_file_target, input_csv_path)
+    if preprocessed_csv_path in preprocessed_csv_files and os.path.exists(preprocessed_csv_path):
+        preprocessed_csv_stat = os.stat(preprocessed_csv_path)
+        if preprocessed_csv_files[preprocessed_csv_path] == (preprocessed_csv_cache_key, preprocessed_csv_stat.st_size, preprocessed_csv_stat.st_mtime_ns):
+            preprocessed_csv_reader_file_handle = open(preprocessed_csv_path, 'r', encoding='utf-8')
+            return csv.DictReader(preprocessed_csv_reader_file_handle, delimiter=config['delimiter'], restval='stringtopopulateextrafields')
+
     try:
         # 'utf-8-sig' encoding skips Microsoft BOM (0xef, 0xbb, 0xbf) at the start of files,
         # e.g. exported from Excel and has no effect when reading standard UTF-8 encoded files.
@@ -3906,7 +4889,6 @@ def get_csv_data(config, csv_file_target='node_fields', file_path=None):
         logging.error(message)
         sys.exit(message)
 
-    preprocessed_csv_path = os.path.join(config['temp_dir'], os.path.basename(input_csv_path)) + '.preprocessed'
     csv_writer_file_handle = open(preprocessed_csv_path, 'w+', newline='', encoding='utf-8')
     # 'restval' is used to populate superfluous fields/labels.
     csv_reader = csv.DictReader(csv_reader_file_handle, delimiter=config['delimiter'], restval='stringtopopulateextrafields')
@@ -3992,7 +4974,7 @@ def get_csv_data(config, csv_file_target='node_fields', file_path=None):
                     logging.error(message)
                     print('Error: ' + message)
                     sys.exit(message)
-        repeats = set(([x for x in unique_identifiers if unique_identifiers.count(x) > 1]))
+        repeats = set([x for x, count in collections.Counter(unique_identifiers).items() if count > 1])
         if len(repeats) > 0:
             message = "Duplicate identifiers in column " + config['id_field'] + " found: " + ','.join(repeats) + "."
             logging.error(message)
@@ -4028,55 +5010,211 @@ def get_csv_data(config, csv_file_target='node_fields', file_path=None):
                     logging.error(message)
                     sys.exit('Error: ' + message)
 
+    csv_reader_file_handle.close()
     csv_writer_file_handle.close()
+    preprocessed_csv_stat = os.stat(preprocessed_csv_path)
+    preprocessed_csv_files[preprocessed_csv_path] = (preprocessed_csv_cache_key, preprocessed_csv_stat.st_size, preprocessed_csv_stat.st_mtime_ns)
     preprocessed_csv_reader_file_handle = open(preprocessed_csv_path, 'r', encoding='utf-8')
     preprocessed_csv_reader = csv.DictReader(preprocessed_csv_reader_file_handle, delimiter=config['delimiter'], restval='stringtopopulateextrafields')
     return preprocessed_csv_reader
 
 
-def find_term_in_vocab(config, vocab_id, term_name_to_find):
-    """Query the Term from term name View using the vocab_id to see if term_name_to_find is
-       is found in that vocabulary. If so, returns the term ID; if not returns False. If
-       more than one term found, returns the term ID of the first one. Also populates global
-       lists of terms (checked_terms and newly_created_terms) to reduce queries to Drupal.
+def get_csv_file_content_hash(file_path):
+    """Get the MD5 hash of a CSV file's content. The hash is only recomputed
+       if the file's size or modification time has changed during the run.
     """
     """Parameters
-    ----------
-    config : dict
-        The configuration settings defined by workbench_config.get_config().
-    vocab_id: string
-        The vocabulary ID to use in the query to find the term.
-    field_name: string
-        The field's machine name.
-    term_name_to_find: string
-        The term name from CSV.
-    Returns
-    -------
-    int|boolean
-        The term ID, existing or newly created. Returns False if term name
-        is not found (or config['validate_terms_exist'] is False).
+        ----------
+        file_path : string
+            The path to the CSV file.
+        Returns
+        -------
+        string
+            The hash of the file's content.
     """
-    if 'check' in config.keys() and config['check'] is True:
-        if config['validate_terms_exist'] is False:
-            return False
+    file_stat = os.stat(file_path)
+    if file_path in csv_file_content_hashes:
+        if csv_file_content_hashes[file_path]['stat'] == (file_stat.st_size, file_stat.st_mtime_ns):
+            return csv_file_content_hashes[file_path]['hash']
 
-        # Attempt to detect term names (including typed relation taxonomy terms) that are namespaced. Some term names may
-        # contain a colon (which is used in the incoming CSV to seprate the vocab ID from the term name). If there is
-        # a ':', maybe it's part of the term name and it's not namespaced. To find out, split term_name_to_find
-        # and compare the first segment with the vocab_id.
-        if ':' in term_name_to_find:
-            original_term_name_to_find = copy.copy(term_name_to_find)
-            [tentative_vocab_id, tentative_term_name] = term_name_to_find.split(':', maxsplit=1)
-            if tentative_vocab_id.strip() == vocab_id.strip():
-                term_name_to_find = tentative_term_name
-            else:
-                term_name_to_find = original_term_name_to_find
+    hash_object = hashlib.md5()
+    with open(file_path, 'rb') as file:
+        while True:
+            chunk = file.read(1024 * 1024)
+            if not chunk:
+                break
+            hash_object.update(chunk)
 
-        '''
-        # Namespaced terms (inc. typed relation terms): if a vocabulary namespace is present, we need to split it out
-        # from the term name. This only applies in --check since namespaced terms are parsed in prepare_term_id().
-        # Assumptions: the term namespace always directly precedes the term name, and the term name may
-        # contain a colon. See https://github.com/mjordan/islandora_workbench/issues/361 for related logic.
+    csv_file_content_hashes[file_path] = {'stat': (file_stat.st_size, file_stat.st_mtime_ns), 'hash': hash_object.hexdigest()}
+    return csv_file_content_hashes[file_path]['hash']
+
+
+def get_preprocessed_csv_cache_key(config, csv_file_target, input_csv_path):
+    """Get a key that identifies the preprocessed version of a CSV file. It changes if either the
+       content of the input CSV file or the configuration settings used in get_csv_data() change.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        csv_file_target: string
+            Either 'node_fields' or 'taxonomy_fields'.
+        input_csv_path: string
+            The path to the input CSV file.
+        Returns
+        -------
+        string
+            The key.
+    """
+    relevant_config_keys = ['task', 'delimiter', 'subdelimiter', 'id_field', 'csv_start_row', 'csv_stop_row',
+                            'ignore_csv_columns', 'csv_field_templates', 'csv_value_templates', 'clean_csv_values_skip',
+                            'csv_headers', 'content_type', 'vocab_id']
+    relevant_config = {key: config[key] for key in relevant_config_keys if key in config}
+    relevant_config['csv_file_target'] = csv_file_target
+    relevant_config['input_csv_path'] = input_csv_path
+    relevant_config['input_csv_hash'] = get_csv_file_content_hash(input_csv_path)
+    return hashlib.md5(json.dumps(relevant_config, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def preload_vocabularies(config, field_definitions, csv_headers):
+    """Loads all of the terms in the vocabularies referenced by the taxonomy fields
+       in the CSV into the in-memory term index, so find_term_in_vocab(), get_term_vocab(),
+       get_term_name(), get_term_uri(), and get_term_id_from_uri() don't need to query
+       Drupal for each term. Used if the 'preload_vocabularies' config setting is true.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        field_definitions : dict
+            The field definitions object defined by get_field_definitions().
+        csv_headers : list
+            The CSV column headers.
+        Returns
+        -------
+        list
+            The IDs of the vocabularies that were loaded into the term index.
+    """
+    vocab_ids = []
+    for field_name in csv_headers:
+        if field_name in field_definitions:
+            vocabularies = get_field_vocabularies(config, field_definitions, field_name)
+            if isinstance(vocabularies, list):
+                for vocab_id in vocabularies:
+                    if vocab_id not in vocab_ids:
+                        vocab_ids.append(vocab_id)
+
+    loaded_vocab_ids = []
+    for vocab_id in vocab_ids:
+        if load_vocabulary_into_term_index(config, vocab_id) is True:
+            loaded_vocab_ids.append(vocab_id)
+    return loaded_vocab_ids
+
+
+def load_vocabulary_into_term_index(config, vocab_id):
+    """Pages through all of the terms in a vocabulary using Drupal's JSON:API and adds
+       them to the term index. If any page can't be retrieved, the vocabulary is not
+       flagged as loaded, and lookups of its terms that miss the index fall back to
+       querying Drupal.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        vocab_id : string
+            The vocabulary ID.
+        Returns
+        -------
+        boolean
+            True if all of the vocabulary's terms were loaded, False if not.
+    """
+    vocab_id = vocab_id.strip()
+    if vocab_id in term_index['vocabularies']:
+        return True
+
+    # 50 is the maximum page size allowed by JSON:API.
+    url = config['host'] + '/jsonapi/taxonomy_term/' + vocab_id + '?sort=drupal_internal__tid&page[limit]=50'
+    num_terms = 0
+    while url is not None:
+        response = issue_request(config, 'GET', url)
+        if response.status_code != 200:
+            message = f'Unable to preload the terms in vocabulary "{vocab_id}" (request to {url} returned a {response.status_code} status code).'
+            logging.warning(message + ' Terms in this vocabulary will be looked up individually.')
+            return False
+        page = json.loads(response.text)
+        for term in page['data']:
+            attributes = term['attributes']
+            uri = None
+            for uri_field in ['field_external_uri', 'field_authority_link']:
+                uri_values = attributes.get(uri_field)
+                if isinstance(uri_values, dict):
+                    uri_values = [uri_values]
+                if uri_values and uri_values[0].get('uri'):
+                    uri = uri_values[0]['uri']
+                    break
+            add_term_to_index(vocab_id, attributes['drupal_internal__tid'], attributes['name'], uri)
+            num_terms += 1
+        url = page.get('links', {}).get('next', {}).get('href')
+
+    term_index['vocabularies'].add(vocab_id)
+    logging.info('Loaded %s terms from vocabulary "%s" into the term index.', num_terms, vocab_id)
+    return True
+
+
+def add_term_to_index(vocab_id, tid, name, uri=None):
+    """Adds a term to the in-memory term index. If a vocabulary contains more
+       than one term with the same name, the first one added is used.
+    """
+    term_index['names'].setdefault((vocab_id, name.lower().strip()), tid)
+    term_index['tids'][str(tid).strip()] = {'vocab_id': vocab_id, 'name': name, 'uri': uri}
+    if uri is not None:
+        term_index['uris'].setdefault(uri, tid)
+
+
+def find_term_in_vocab(config, vocab_id, term_name_to_find):
+    """Query the Term from term name View using the vocab_id to see if term_name_to_find is
+       is found in that vocabulary. If so, returns the term ID; if not returns False. If
+       more than one term found, returns the term ID of the first one. Also populates global
+       registries of terms (checked_terms and newly_created_terms) to reduce queries to Drupal,
+       and uses the term index if the vocabulary has been loaded by preload_vocabularies().
+    """
+    """Parameters
+    ----------
+    config : dict
+        The configuration settings defined by workbench_config.get_config().
+    vocab_id: string
+        The vocabulary ID to use in the query to find the term.
+    field_name: string
+        The field's machine name.
+    term_name_to_find: string
+        The term name from CSV.
+    Returns
+    -------
+    int|boolean
+        The term ID, existing or newly created. Returns False if term name
+        is not found (or config['validate_terms_exist'] is False).
+    """
+    if 'check' in config.keys() and config['check'] is True:
+        if config['validate_terms_exist'] is False:
+            return False
+
+        # Attempt to detect term names (including typed relation taxonomy terms) that are namespaced. Some term names may
+        # contain a colon (which is used in the incoming CSV to seprate the vocab ID from the term name). If there is
+        # a ':', maybe it's part of the term name and it's not namespaced. To find out, split term_name_to_find
+        # and compare the first segment with the vocab_id.
+        if ':' in term_name_to_find:
+            original_term_name_to_find = copy.copy(term_name_to_find)
+            [tentative_vocab_id, tentative_term_name] = term_name_to_find.split(':', maxsplit=1)
+            if tentative_vocab_id.strip() == vocab_id.strip():
+                term_name_to_find = tentative_term_name
+            else:
+                term_name_to_find = original_term_name_to_find
+
+        '''
+        # Namespaced terms (inc. typed relation terms): if a vocabulary namespace is present, we need to split it out
+        # from the term name. This only applies in --check since namespaced terms are parsed in prepare_term_id().
+        # Assumptions: the term namespace always directly precedes the term name, and the term name may
+        # contain a colon. See https://github.com/mjordan/islandora_workbench/issues/361 for related logic.
         namespaced = re.search(':', term_name_to_find)
         if namespaced:
             namespaced_term_parts = term_name_to_find.split(':')
@@ -4086,16 +5224,23 @@ def find_term_in_vocab(config, vocab_id, term_name_to_find):
         '''
 
         term_name_for_check_matching = term_name_to_find.lower().strip()
-        for checked_term in checked_terms:
-            if checked_term['vocab_id'] == vocab_id and checked_term['name_for_matching'] == term_name_for_check_matching:
-                if value_is_numeric(checked_term['tid']):
-                    return checked_term['tid']
-                else:
-                    return False
+        checked_term = checked_terms.get((vocab_id, term_name_for_check_matching))
+        if checked_term is not None:
+            if value_is_numeric(checked_term['tid']):
+                return checked_term['tid']
+            else:
+                return False
 
-    for newly_created_term in newly_created_terms:
-        if newly_created_term['vocab_id'] == vocab_id and newly_created_term['name_for_matching'] == term_name_to_find.lower().strip():
-            return newly_created_term['tid']
+    newly_created_term = newly_created_terms.get((vocab_id, term_name_to_find.lower().strip()))
+    if newly_created_term is not None:
+        return newly_created_term['tid']
+
+    indexed_tid = term_index['names'].get((vocab_id.strip(), term_name_to_find.lower().strip()))
+    if indexed_tid is not None:
+        return indexed_tid
+    # All of the vocabulary's terms are in the index, so there's no need to ask Drupal.
+    if vocab_id.strip() in term_index['vocabularies']:
+        return False
 
     url = config['host'] + '/term_from_term_name?vocab=' + vocab_id.strip() + '&name=' + urllib.parse.quote_plus(term_name_to_find.strip()) + '&_format=json'
     response = issue_request(config, 'GET', url)
@@ -4105,8 +5250,7 @@ def find_term_in_vocab(config, vocab_id, term_name_to_find):
         if len(term_data) == 0:
             if 'check' in config.keys() and config['check'] is True:
                 checked_term_to_add = {'tid': None, 'vocab_id': vocab_id, 'name': term_name_to_find, 'name_for_matching': term_name_for_check_matching}
-                if checked_term_to_add not in checked_terms:
-                    checked_terms.append(checked_term_to_add)
+                checked_terms.setdefault((vocab_id, term_name_for_check_matching), checked_term_to_add)
             return False
         elif len(term_data) > 1:
             print("Warning: See log for important message about duplicate terms within the same vocabulary.")
@@ -4118,15 +5262,13 @@ def find_term_in_vocab(config, vocab_id, term_name_to_find):
                 term_data[0]['tid'][0]['value'])
             if 'check' in config.keys() and config['check'] is True:
                 checked_term_to_add = {'tid': term_data[0]['tid'][0]['value'], 'vocab_id': vocab_id, 'name': term_name_to_find, 'name_for_matching': term_name_for_check_matching}
-                if checked_term_to_add not in checked_terms:
-                    checked_terms.append(checked_term_to_add)
+                checked_terms.setdefault((vocab_id, term_name_for_check_matching), checked_term_to_add)
             return term_data[0]['tid'][0]['value']
         # Term name is found.
         else:
             if 'check' in config.keys() and config['check'] is True:
                 checked_term_to_add = {'tid': term_data[0]['tid'][0]['value'], 'vocab_id': vocab_id, 'name': term_name_to_find, 'name_for_matching': term_name_for_check_matching}
-                if checked_term_to_add not in checked_terms:
-                    checked_terms.append(checked_term_to_add)
+                checked_terms.setdefault((vocab_id, term_name_for_check_matching), checked_term_to_add)
             return term_data[0]['tid'][0]['value']
     else:
         logging.warning('Query for term "%s" in vocabulary "%s" returned a %s status code', term_name_to_find, vocab_id, response.status_code)
@@ -4137,49 +5279,160 @@ def get_term_vocab(config, term_id):
     """Get the term's parent vocabulary ID and return it. If the term doesn't
        exist, return False.
     """
-    url = config['host'] + '/taxonomy/term/' + str(term_id).strip() + '?_format=json'
-    response = issue_request(config, 'GET', url)
-    if response.status_code == 200:
-        term_data = json.loads(response.text)
-        return term_data['vid'][0]['target_id']
-    else:
-        logging.warning('Query for term ID "%s" returned a %s status code', term_id, response.status_code)
+    indexed_term = term_index['tids'].get(str(term_id).strip())
+    if indexed_term is not None:
+        return indexed_term['vocab_id']
+
+    term_record = get_term_record(config, term_id)
+    if term_record is False:
         return False
+    return term_record['vocab_id']
 
 
 def get_term_name(config, term_id):
     """Get the term's name and return it. If the term doesn't exist, return False.
     """
-    url = config['host'] + '/taxonomy/term/' + str(term_id).strip() + '?_format=json'
-    response = issue_request(config, 'GET', url)
-    if response.status_code == 200:
-        term_data = json.loads(response.text)
-        return term_data['name'][0]['value']
-    else:
-        logging.warning('Query for term ID "%s" returned a %s status code', term_id, response.status_code)
+    indexed_term = term_index['tids'].get(str(term_id).strip())
+    if indexed_term is not None:
+        return indexed_term['name']
+
+    term_record = get_term_record(config, term_id)
+    if term_record is False:
         return False
+    return term_record['name']
 
 
 def get_term_uri(config, term_id):
     """Get the term's URI and return it. If the term or URI doesn't exist, return False.
        If the term has no URI, return None.
     """
-    url = config['host'] + '/taxonomy/term/' + str(term_id).strip() + '?_format=json'
+    indexed_term = term_index['tids'].get(str(term_id).strip())
+    if indexed_term is not None:
+        return indexed_term['uri']
+
+    term_record = get_term_record(config, term_id)
+    if term_record is False:
+        return False
+    if term_record['uri'] is None:
+        logging.warning('Query for term ID "%s" does not have either a field_authority_link or field_exteral_uri field.', term_id)
+    return term_record['uri']
+
+
+def get_term_record(config, term_id):
+    """Get the vocabulary ID, name, and URI of a term, fetching the term from Drupal only
+       if it isn't in the term record cache. Used by get_term_vocab(), get_term_name(),
+       get_term_uri(), and ping_term() so that each term is requested once, no matter how
+       many of those functions are called for it. The cache holds up to
+       config['term_record_cache_size'] terms, discarding the least recently used ones.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        term_id : string|int
+            The term ID.
+        Returns
+        -------
+        dict|bool
+            A dictionary with the keys 'vocab_id', 'name', and 'uri' ('uri' is None if the
+            term has no URI field), or False if the term doesn't exist or isn't accessible.
+    """
+    term_id = str(term_id).strip()
+    with term_record_cache_lock:
+        if term_id in term_record_cache:
+            term_record_cache.move_to_end(term_id)
+            return term_record_cache[term_id]
+
+    url = config['host'] + '/taxonomy/term/' + term_id + '?_format=json'
     response = issue_request(config, 'GET', url)
     if response.status_code == 200:
         term_data = json.loads(response.text)
-        if 'field_external_uri' in term_data:
-            uri = term_data['field_external_uri'][0]['uri']
-            return uri
-        elif 'field_authority_link' in term_data:
-            uri = term_data['field_authority_link'][0]['uri']
-            return uri
-        else:
-            logging.warning('Query for term ID "%s" does not have either a field_authority_link or field_exteral_uri field.', term_id)
-            return None
+        term_record = {'vocab_id': term_data['vid'][0]['target_id'], 'name': term_data['name'][0]['value'], 'uri': None}
+        for uri_field in ['field_external_uri', 'field_authority_link']:
+            if uri_field in term_data and len(term_data[uri_field]) > 0:
+                term_record['uri'] = term_data[uri_field][0]['uri']
+                break
     else:
         logging.warning('Query for term ID "%s" returned a %s status code', term_id, response.status_code)
-        return False
+        term_record = False
+        # Don't hang on to server errors, which are often temporary.
+        if response.status_code >= 500:
+            return term_record
+
+    with term_record_cache_lock:
+        term_record_cache[term_id] = term_record
+        term_record_cache.move_to_end(term_id)
+        while len(term_record_cache) > int(config.get('term_record_cache_size', 10000)):
+            term_record_cache.popitem(last=False)
+    return term_record
+
+
+def prefetch_term_records(config, term_ids):
+    """Fetch the terms that aren't already in the term record cache concurrently, using
+       up to config['max_workers'] threads, so later calls to get_term_name(), etc.
+       for them don't need to wait on Drupal. The threads are shared by all calls; if
+       config['max_workers'] is 1, the terms are fetched in the calling thread.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        term_ids : iterable
+            The term IDs.
+        Returns
+        -------
+        None
+    """
+    with term_record_cache_lock:
+        term_ids_to_fetch = set()
+        for term_id in term_ids:
+            term_id = str(term_id).strip()
+            if term_id not in term_record_cache and term_id not in term_index['tids']:
+                term_ids_to_fetch.add(term_id)
+
+    if len(term_ids_to_fetch) == 0:
+        return
+    max_workers = int(config['max_workers'])
+    if max_workers < 2:
+        for term_id in term_ids_to_fetch:
+            get_term_record(config, term_id)
+        return
+
+    with term_prefetch_executor['lock']:
+        if term_prefetch_executor['executor'] is None:
+            term_prefetch_executor['executor'] = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        executor = term_prefetch_executor['executor']
+    futures = [executor.submit(get_term_record, config, term_id) for term_id in term_ids_to_fetch]
+    concurrent.futures.wait(futures)
+
+
+def get_term_ids_in_node(field_definitions, node, field_names):
+    """Get the IDs of the taxonomy terms referenced in a node's entity reference
+       and typed relation fields.
+    """
+    """Parameters
+        ----------
+        field_definitions : dict
+            The field definitions object defined by get_field_definitions().
+        node : dict
+            The node's JSON, as returned by Drupal.
+        field_names : list
+            The fields to get term IDs from.
+        Returns
+        -------
+        set
+            The term IDs.
+    """
+    term_ids = set()
+    for field_name in field_names:
+        if field_name not in node or field_name not in field_definitions:
+            continue
+        if field_definitions[field_name].get('field_type') not in ['entity_reference', 'typed_relation']:
+            continue
+        for value in node[field_name]:
+            if value.get('target_type') == 'taxonomy_term' or field_definitions[field_name]['field_type'] == 'typed_relation':
+                term_ids.add(str(value['target_id']))
+    return term_ids
 
 
 def get_term_id_from_uri(config, uri):
@@ -4188,6 +5441,10 @@ def get_term_id_from_uri(config, uri):
        taxonomy uses to store URIs (it's either field_external_uri or field_authority_link),
        we need to check both options in the "Term from URI" View.
     """
+    indexed_tid = term_index['uris'].get(uri)
+    if indexed_tid is not None:
+        return indexed_tid
+
     # Some vocabularies use this View.
     terms_with_uri = []
     term_from_uri_url = config['host'] + '/term_from_uri?_format=json&uri=' + uri.replace('#', '%23')
@@ -4295,64 +5552,76 @@ def create_term(config, vocab_id, term_name, term_csv_row=None):
             The term ID, or False term was not created.
     """
     # Check to see if term exists; if so, return its ID, if not, proceed to create it.
+    # Looking for the term doesn't require the lock, so lookups can run concurrently.
     tid = find_term_in_vocab(config, vocab_id, term_name)
-    if value_is_numeric(tid):
-        if (config['task'] == 'create' or config['task'] == 'update') and config['log_term_creation'] is True:
-            logging.info('Term "%s" (term ID %s) already exists in vocabulary "%s".', term_name, tid, vocab_id)
-        if config['task'] == 'create_terms':
-            logging.info('Term "%s" (term ID %s) already exists in vocabulary "%s".', term_name, tid, vocab_id)
-        return tid
-
-    if config['allow_adding_terms'] is False:
-        logging.warning('To create new taxonomy terms, you must add "allow_adding_terms: true" to your configuration file.')
-        return False
+    # Hold the lock while we create the term so that rows (or values) being processed
+    # concurrently don't create the same term more than once.
+    with term_creation_lock:
+        if not value_is_numeric(tid):
+            # Another thread may have created the term since we looked for it.
+            newly_created_term = newly_created_terms.get((vocab_id, term_name.lower().strip()))
+            if newly_created_term is not None:
+                tid = newly_created_term['tid']
+        if value_is_numeric(tid):
+            if (config['task'] == 'create' or config['task'] == 'update') and config['log_term_creation'] is True:
+                logging.info('Term "%s" (term ID %s) already exists in vocabulary "%s".', term_name, tid, vocab_id)
+            if config['task'] == 'create_terms':
+                logging.info('Term "%s" (term ID %s) already exists in vocabulary "%s".', term_name, tid, vocab_id)
+            return tid
 
-    if len(term_name) > 255:
-        truncated_term_name = term_name[:255]
-        message = 'Term "' + term_name + '"' + "provided in the CSV data exceeds Drupal's maximum length of 255 characters."
-        message_2 = ' It has been trucated to "' + truncated_term_name + '".'
-        logging.info(message + message_2)
-        term_name = truncated_term_name
-
-    term_field_data = get_term_field_data(config, vocab_id, term_name, term_csv_row)
-    if term_field_data is False:
-        # @todo: Failure details should be logged in get_term_field_data().
-        logging.warning('Unable to create term "' + term_name + '" because Workbench could not get term field data.')
-        return False
+        if config['allow_adding_terms'] is False:
+            logging.warning('To create new taxonomy terms, you must add "allow_adding_terms: true" to your configuration file.')
+            return False
 
-    # Common values for all terms, simple and complex.
-    term = {
-        "vid": [
-           {
-               "target_id": str(vocab_id),
-               "target_type": "taxonomy_vocabulary"
-           }
-        ],
-        "name": [
-            {
-                "value": term_name
-            }
-        ]
-    }
+        if len(term_name) > 255:
+            truncated_term_name = term_name[:255]
+            message = 'Term "' + term_name + '"' + "provided in the CSV data exceeds Drupal's maximum length of 255 characters."
+            message_2 = ' It has been trucated to "' + truncated_term_name + '".'
+            logging.info(message + message_2)
+            term_name = truncated_term_name
+
+        term_field_data = get_term_field_data(config, vocab_id, term_name, term_csv_row)
+        if term_field_data is False:
+            # @todo: Failure details should be logged in get_term_field_data().
+            logging.warning('Unable to create term "' + term_name + '" because Workbench could not get term field data.')
+            return False
+
+        # Common values for all terms, simple and complex.
+        term = {
+            "vid": [
+               {
+                   "target_id": str(vocab_id),
+                   "target_type": "taxonomy_vocabulary"
+               }
+            ],
+            "name": [
+                {
+                    "value": term_name
+                }
+            ]
+        }
 
-    term.update(term_field_data)
+        term.update(term_field_data)
 
-    term_endpoint = config['host'] + '/taxonomy/term?_format=json'
-    headers = {'Content-Type': 'application/json'}
-    response = issue_request(config, 'POST', term_endpoint, headers, term, None)
-    if response.status_code == 201:
-        term_response_body = json.loads(response.text)
-        tid = term_response_body['tid'][0]['value']
-        if (config['task'] == 'create' or config['task'] == 'update') and config['log_term_creation'] is True:
-            logging.info('Term %s ("%s") added to vocabulary "%s".', tid, term_name, vocab_id)
-        if config['task'] == 'create_terms':
-            logging.info('Term %s ("%s") added to vocabulary "%s".', tid, term_name, vocab_id)
-        newly_created_term_name_for_matching = term_name.lower().strip()
-        newly_created_terms.append({'tid': tid, 'vocab_id': vocab_id, 'name': term_name, 'name_for_matching': newly_created_term_name_for_matching})
-        return tid
-    else:
-        logging.warning("Term '%s' not created, HTTP response code was %s.", term_name, response.status_code)
-        return False
+        term_endpoint = config['host'] + '/taxonomy/term?_format=json'
+        headers = {'Content-Type': 'application/json'}
+        response = issue_request(config, 'POST', term_endpoint, headers, term, None)
+        if response.status_code == 201:
+            term_response_body = json.loads(response.text)
+            tid = term_response_body['tid'][0]['value']
+            if (config['task'] == 'create' or config['task'] == 'update') and config['log_term_creation'] is True:
+                logging.info('Term %s ("%s") added to vocabulary "%s".', tid, term_name, vocab_id)
+            if config['task'] == 'create_terms':
+                logging.info('Term %s ("%s") added to vocabulary "%s".', tid, term_name, vocab_id)
+            newly_created_term_name_for_matching = term_name.lower().strip()
+            newly_created_terms[(vocab_id, newly_created_term_name_for_matching)] = {
+                'tid': tid, 'vocab_id': vocab_id, 'name': term_name, 'name_for_matching': newly_created_term_name_for_matching}
+            if vocab_id.strip() in term_index['vocabularies']:
+                add_term_to_index(vocab_id.strip(), tid, term_name)
+            return tid
+        else:
+            logging.warning("Term '%s' not created, HTTP response code was %s.", term_name, response.status_code)
+            return False
 
 
 def get_term_field_data(config, vocab_id, term_name, term_csv_row):
@@ -4543,6 +5812,7 @@ def create_url_alias(config, node_id, url_alias):
             '/node/' +
             node_id,
             response.status_code)
+    return response.status_code
 
 
 def prepare_term_id(config, vocab_ids, field_name, term):
@@ -4575,6 +5845,9 @@ def prepare_term_id(config, vocab_ids, field_name, term):
         return term
     if vocab_ids is False:
         return None
+    resolved_term_id_key = (field_name, tuple(vocab_ids) if isinstance(vocab_ids, list) else vocab_ids, term)
+    if resolved_term_id_key in resolved_term_ids:
+        return resolved_term_ids[resolved_term_id_key]
     # Special case: if the term starts with 'http', assume it's a Linked Data URI
     # and get its term ID from the URI.
     elif term.startswith('http'):
@@ -4631,6 +5904,73 @@ def prepare_term_id(config, vocab_ids, field_name, term):
         return None
 
 
+def pre_resolve_term_ids(config, field_definitions, csv_data):
+    """Collects the distinct values in the CSV's taxonomy reference and typed relation
+       fields and resolves each one to a term ID (creating the term if necessary, as
+       prepare_term_id() always has) before any rows are processed, so prepare_term_id()
+       doesn't need to resolve the same value again for every row it appears in. Values
+       are resolved concurrently if 'max_workers' is greater than 1.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        field_definitions : dict
+            The field definitions object defined by get_field_definitions().
+        csv_data : csv.DictReader
+            The CSV data, e.g. as returned by get_csv_data().
+        Returns
+        -------
+        MappingProxyType
+            A read-only view of the resolved term IDs, keyed by field name, the field's
+            vocabulary IDs, and the CSV value.
+    """
+    reference_fields = dict()
+    for field_name in csv_data.fieldnames:
+        if field_name not in field_definitions:
+            continue
+        if field_definitions[field_name]['field_type'] not in ['entity_reference', 'typed_relation']:
+            continue
+        if field_definitions[field_name].get('target_type') != 'taxonomy_term':
+            continue
+        vocab_ids = get_field_vocabularies(config, field_definitions, field_name)
+        if isinstance(vocab_ids, list) and len(vocab_ids) > 0:
+            reference_fields[field_name] = vocab_ids
+
+    distinct_values = dict()
+    for row in csv_data:
+        for field_name, vocab_ids in reference_fields.items():
+            if row[field_name] is None or len(row[field_name].strip()) == 0:
+                continue
+            for subvalue in row[field_name].split(config['subdelimiter']):
+                if field_definitions[field_name]['field_type'] == 'typed_relation':
+                    # Strip off the relator (e.g. "relators:pht:"), leaving the (optionally namespaced) term.
+                    subvalue_parts = subvalue.split(':', 2)
+                    if len(subvalue_parts) < 3:
+                        continue
+                    subvalue = subvalue_parts[2]
+                subvalue = subvalue.strip()
+                if len(subvalue) == 0 or value_is_numeric(subvalue):
+                    continue
+                distinct_values[(field_name, tuple(vocab_ids), subvalue)] = vocab_ids
+
+    resolved = dict()
+    if config['max_workers'] > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=config['max_workers']) as executor:
+            futures = dict()
+            for key, vocab_ids in distinct_values.items():
+                futures[key] = executor.submit(prepare_term_id, config, vocab_ids, key[0], key[2])
+            for key, future in futures.items():
+                resolved[key] = future.result()
+    else:
+        for key, vocab_ids in distinct_values.items():
+            resolved[key] = prepare_term_id(config, vocab_ids, key[0], key[2])
+
+    resolved_term_ids.update(resolved)
+    logging.info('Resolved %s distinct taxonomy values in the CSV before processing rows.', len(resolved))
+    return MappingProxyType(resolved_term_ids)
+
+
 def get_field_vocabularies(config, field_definitions, field_name):
     """Gets IDs of vocabularies linked from the current field (could be more than one).
     """
@@ -4707,36 +6047,528 @@ def validate_input_dir(config):
         sys.exit('Error: ' + message)
 
 
-def validate_required_fields_have_values(config, required_drupal_fields, csv_data):
-    """Loop through all fields in CSV to ensure that required field have a value in the CSV.
+class CsvValidationRule():
+    """Base class for the rules that check_input() applies to the input CSV.
+       Rules are fed every row by run_csv_validation_rules() during a single pass
+       over the CSV data. Warnings and errors are printed and logged as each row
+       is checked, so they appear in row order, in the same format the standalone
+       validate_*() functions have always used; each rule's summary is reported
+       from report() once the pass is complete.
+
+       Rule code may call sys.exit() as soon as it finds a fatal problem. The
+       resulting SystemExit is held by the rule and raised again from report(),
+       so fatal errors are surfaced in the order the rules were registered.
     """
-    rows_with_missing_required_values = []
-    for row in csv_data:
-        for required_field in required_drupal_fields:
+    def __init__(self, config, field_definitions=None):
+        """Parameters
+           ----------
+            config : dict
+                The configuration settings defined by workbench_config.get_config().
+            field_definitions : dict
+                The field definitions object defined by get_field_definitions().
+        """
+        self.config = config
+        self.field_definitions = field_definitions
+        self.warnings = []
+        self.exit = None
+
+    def start(self, fieldnames):
+        """Called once, with the CSV column headers, before any rows are checked.
+        """
+        pass
+
+    def check_row(self, count, row):
+        """Called once for each row in the CSV. 'count' starts at 1.
+        """
+        pass
+
+    def summarize(self):
+        """Called from report() if the rule found no fatal errors.
+        """
+        pass
+
+    def warn(self, message):
+        self.warnings.append(message)
+        print('Warning: ' + message)
+        logging.warning(message)
+
+    def apply(self, method, *args):
+        """Calls one of the rule's methods, holding on to any SystemExit it raises.
+        """
+        if self.exit is not None:
+            return
+        try:
+            method(*args)
+        except SystemExit as e:
+            self.exit = e
+
+    def report(self):
+        if self.exit is not None:
+            raise self.exit
+        return self.summarize()
+
+
+def run_csv_validation_rules(config, csv_data, rules):
+    """Applies each of the rules in 'rules' to every row in 'csv_data', reading the
+       CSV data only once, then has each rule report its findings in turn.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        csv_data : csv.DictReader
+            The CSV data, e.g. as returned by get_csv_data().
+        rules : list
+            A list of CsvValidationRule objects, in the order their findings should be reported.
+        Returns
+        -------
+        list
+            The values returned by each rule's report() method.
+    """
+    # Once a rule has failed, none of the rules registered after it will get to
+    # report, so they don't need to see any more rows.
+    active_rules = []
+    for rule in rules:
+        rule.apply(rule.start, csv_data.fieldnames)
+        if rule.exit is not None:
+            break
+        active_rules.append(rule)
+
+    if len(active_rules) > 0:
+        for count, row in enumerate(csv_data, start=1):
+            for position, rule in enumerate(active_rules):
+                rule.apply(rule.check_row, count, row)
+                if rule.exit is not None:
+                    active_rules = active_rules[:position]
+                    break
+            if len(active_rules) == 0:
+                break
+
+    results = []
+    for rule in rules:
+        results.append(rule.report())
+    return results
+
+
+class CsvColumnCountRule(CsvValidationRule):
+    """Checks that each row contains the same number of columns as there are headers,
+       and that the CSV contains at least one row.
+    """
+    def __init__(self, config, num_headers):
+        super().__init__(config)
+        self.num_headers = num_headers
+        self.row_count = 0
+
+    def check_row(self, count, row):
+        config = self.config
+        self.row_count = count
+        extra_headers = False
+        field_count = 0
+        for field in row:
+            # 'stringtopopulateextrafields' is added by get_csv_data() if there are extra headers.
+            if row[field] == 'stringtopopulateextrafields':
+                extra_headers = True
+            else:
+                field_count += 1
+        if extra_headers is True:
+            message = "Row " + str(count) + " (ID " + row[config['id_field']] + ") of the CSV file has fewer columns " +  \
+                "than there are headers (" + str(self.num_headers) + ")."
+            logging.error(message)
+            sys.exit('Error: ' + message)
+        # Note: this message is also generated in get_csv_data() since CSV Writer thows an exception if the row has form fields than headers.
+        if self.num_headers < field_count:
+            message = "Row " + str(count) + " (ID " + row[config['id_field']] + ") of the CSV file has more columns (" +  \
+                str(field_count) + ") than there are headers (" + str(self.num_headers) + ")."
+            logging.error(message)
+            sys.exit('Error: ' + message)
+
+    def summarize(self):
+        if self.row_count == 0:
+            message = "Input CSV file " + self.config['input_csv'] + " has 0 rows."
+            logging.error(message)
+            sys.exit('Error: ' + message)
+        else:
+            message = "OK, all " + str(self.row_count) + " rows in the CSV file have the same number of columns as there are headers (" + str(self.num_headers) + ")."
+            print(message)
+            logging.info(message)
+
+
+class MediaUseTidsRule(CsvValidationRule):
+    """Validates 'media_use_tid' values in the CSV if they exist.
+    """
+    def start(self, fieldnames):
+        if self.config['task'] == 'add_media':
+            self.csv_id_field = 'node_id'
+        else:
+            self.csv_id_field = self.config['id_field']
+
+    def check_row(self, count, row):
+        if 'media_use_tid' in row:
+            delimited_field_values = row['media_use_tid'].split(self.config['subdelimiter'])
+            for field_value in delimited_field_values:
+                if len(field_value.strip()) > 0:
+                    validate_media_use_tid(self.config, field_value, row[self.csv_id_field])
+
+
+class MediaIdsRule(CsvValidationRule):
+    """Checks that the media IDs in 'update_media' CSV rows are valid.
+    """
+    def check_row(self, count, row):
+        media_id = extract_media_id(self.config, row)  # Extract the media ID from the CSV row.
+        if media_id is None:  # If the media ID is invalid, this is an error and we stop.
+            message = 'Error: Invalid media ID in row ' + str(count) + ' of the CSV file.'
+            logging.error(message)
+            sys.exit(message)
+
+
+class ChecksumsRule(CsvValidationRule):
+    """Compares the checksum of each local file named in the 'file' column with the
+       value in the row's 'checksum' column.
+    """
+    def start(self, fieldnames):
+        if self.config['task'] == 'add_media':
+            self.row_id = 'node_id'
+        else:
+            self.row_id = self.config['id_field']
+        self.checksum_validation_all_ok = True
+
+    def check_row(self, count, row):
+        config = self.config
+        file_path = row['file']
+        hash_from_local = get_file_hash_from_local(config, file_path, config['fixity_algorithm'])
+        if 'checksum' in row:
+            if hash_from_local == row['checksum'].strip():
+                logging.info('Local %s checksum and value in the CSV "checksum" field for file "%s" (%s) match.', config['fixity_algorithm'], file_path, hash_from_local)
+            else:
+                self.checksum_validation_all_ok = False
+                logging.warning('Local %s checksum and value in the CSV "checksum" field for file "%s" (named in CSV row "%s") do not match (local: %s, CSV: %s).',
+                                config['fixity_algorithm'], file_path, row[self.row_id], hash_from_local, row['checksum'])
+
+    def summarize(self):
+        if self.checksum_validation_all_ok is True:
+            checksum_validation_message = "OK, checksum validation during complete. All checks pass."
+            logging.info(checksum_validation_message)
+            print(checksum_validation_message + " See the log for more detail.")
+        else:
+            checksum_validation_message = "Not all checksum validation passed."
+            logging.warning(checksum_validation_message)
+            print("Warning: " + checksum_validation_message + " See the log for more detail.")
+
+
+class TermNameLengthRule(CsvValidationRule):
+    """Checks that values in the 'term_name' column do not exceed Drupal's maximum length.
+    """
+    def check_row(self, count, row):
+        if 'term_name' in row and len(row['term_name']) > 255:
+            message = "The 'term_name' column in row for term '" + row['term_name'] + "' of your CSV file exceeds Drupal's maximum length of 255 characters."
+            logging.error(message)
+            sys.exit('Error: ' + message)
+
+
+class FieldMemberOfRule(CsvValidationRule):
+    """Checks that the nodes identified in 'field_member_of' exist. This could be generalized
+       out to validate node IDs in other fields. See https://github.com/mjordan/islandora_workbench/issues/90.
+    """
+    def check_row(self, count, row):
+        if 'field_member_of' in row:
+            parent_nids = row['field_member_of'].split(self.config['subdelimiter'])
+            for parent_nid in parent_nids:
+                if len(parent_nid) > 0:
+                    parent_node_exists = ping_node(self.config, parent_nid)
+                    if parent_node_exists is False:
+                        message = "The 'field_member_of' field in row with ID '" + row[self.config['id_field']] + \
+                            "' of your CSV file contains a node ID (" + parent_nid + ") that " + \
+                            "doesn't exist or is not accessible. See the workbench log for more information."
+                        logging.error(message)
+                        sys.exit('Error: ' + message)
+
+
+class LangcodeRule(CsvValidationRule):
+    """Checks that values in the 'langcode' column are Drupal language codes.
+    """
+    def check_row(self, count, row):
+        langcode_valid = validate_language_code(row['langcode'])
+        if not langcode_valid:
+            message = "Row with ID " + row[self.config['id_field']] + " of your CSV file contains an invalid Drupal language code (" + row['langcode'] + ") in its 'langcode' column."
+            logging.error(message)
+            sys.exit('Error: ' + message)
+
+
+class FilesRule(CsvValidationRule):
+    """Checks that the files named in the 'file' column exist. IDs of rows with missing
+       files are added to 'rows_with_missing_files' if soft checks or missing files are allowed.
+    """
+    def __init__(self, config, rows_with_missing_files):
+        super().__init__(config)
+        self.rows_with_missing_files = rows_with_missing_files
+
+    def check_row(self, count, row):
+        config = self.config
+        rows_with_missing_files = self.rows_with_missing_files
+        file_value = row['file'].strip()
+        # Check for empty 'file' values.
+        if len(file_value) == 0:
+            message = 'CSV row with ID ' + row[config['id_field']] + ' contains an empty "file" value.'
+            if config['perform_soft_checks'] is False and config['allow_missing_files'] is False:
+                logging.error(message)
+                sys.exit('Error: ' + message)
+            else:
+                if row[config['id_field']] not in rows_with_missing_files:
+                    rows_with_missing_files.append(row[config['id_field']])
+                    logging.warning(message)
+        # Check for URLs.
+        elif file_value.startswith('http'):
+            http_response_code = ping_remote_file(config, file_value)
+            if http_response_code != 200:
+                message = 'Remote file "' + file_value + '" identified in CSV "file" column for record with ID "' \
+                    + row[config['id_field']] + '" not found or not accessible (HTTP response code ' + str(http_response_code) + ').'
+                if config['perform_soft_checks'] is False and config['allow_missing_files'] is False:
+                    logging.error(message)
+                    sys.exit('Error: ' + message)
+                else:
+                    if row[config['id_field']] not in rows_with_missing_files:
+                        rows_with_missing_files.append(row[config['id_field']])
+                        logging.error(message)
+        # Check for files that cannot be found.
+        else:
+            if os.path.isabs(file_value):
+                file_path = file_value
+            else:
+                file_path = os.path.join(config['input_dir'], file_value)
+            if not os.path.exists(file_path) or not os.path.isfile(file_path):
+                message = 'File "' + file_path + '" identified in CSV "file" column for record with ID field value "' \
+                    + row[config['id_field']] + '" not found.'
+                if config['perform_soft_checks'] is False:
+                    logging.error(message)
+                    sys.exit('Error: ' + message)
+                else:
+                    if row[config['id_field']] not in rows_with_missing_files:
+                        rows_with_missing_files.append(row[config['id_field']])
+                        logging.error(message)
+
+    def summarize(self):
+        # @todo for issue 268: All accumulator variables like 'rows_with_missing_files' should be checked at end of
+        # check_input() (to work with perform_soft_checks: True) in addition to at place of check (to work wit perform_soft_checks: False).
+        if len(self.rows_with_missing_files) > 0:
+            if self.config['allow_missing_files'] is True:
+                message = 'OK, missing or empty CSV "file" column values detected, but the "allow_missing_files" configuration setting is enabled.'
+                print(message + " See the log for more information.")
+                logging.info(message + " Details are logged above.")
+        else:
+            message = 'OK, files named in the CSV "file" column are all present.'
+            print(message)
+            logging.info(message)
+
+
+class MediaTypesRule(CsvValidationRule):
+    """Checks that the media type each file in the 'file' column will create exists, and
+       that the file's extension is allowed for that media type. Files added using the
+       'additional_files' setting are checked by AdditionalFilesMediaTypesRule.
+    """
+    def check_row(self, count, row):
+        config = self.config
+        filename_fields_to_check = ['file']
+        for filename_field in filename_fields_to_check:
+            if len(row[filename_field]) != 0:
+                media_type = set_media_type(config, row[filename_field], filename_field, row)
+                media_bundle_response_code = ping_media_bundle(config, media_type)
+                if media_bundle_response_code == 404:
+                    message = 'File "' + row[filename_field] + '" identified in CSV row ' + row[config['id_field']] + \
+                        ' will create a media of type (' + media_type + '), but that media type is not configured in the destination Drupal.' + \
+                        ' Please make sure your media type configuration matches your Drupal configuration.'
+                    logging.error(message)
+                    sys.exit('Error: ' + message)
+
+                # Check that each file's extension is allowed for the current media type.
+                if row['file'].startswith('http'):
+                    # First check to see if the file has an extension.
+                    extension = os.path.splitext(row['file'])[1]
+                    if len(extension) > 0:
+                        extension = extension.lstrip('.')
+                    else:
+                        extension = get_remote_file_extension(config, row['file'])
+                        extension = extension.lstrip('.')
+                else:
+                    extension = os.path.splitext(row['file'])[1]
+                    extension = extension.lstrip('.').lower()
+                media_type_file_field = config['media_type_file_fields'][media_type]
+                registered_extensions = get_registered_media_extensions(config, media_type, media_type_file_field)
+                if isinstance(extension, str) and isinstance(registered_extensions, dict) and extension not in registered_extensions[media_type_file_field]:
+                    message = 'File "' + row[filename_field] + '" in CSV row "' + row[config['id_field']] + \
+                        '" has an extension (' + str(extension) + ') that is not allowed in the "' + media_type_file_field + '" field of the "' + media_type + '" media type.'
+                    logging.error(message)
+                    if config['perform_soft_checks'] is False:
+                        sys.exit('Error: ' + message)
+
+
+class AdditionalFilesRule(CsvValidationRule):
+    """Checks that the files in the columns registered in the 'additional_files'
+       configuration setting exist.
+    """
+    def start(self, fieldnames):
+        self.additional_files_fields = get_additional_files_config(self.config).keys()
+        self.missing_additional_files = False
+
+    def check_row(self, count, row):
+        config = self.config
+        for additional_file_field in self.additional_files_fields:
+            file_value = row[additional_file_field].strip()
+            if len(file_value) == 0:
+                self.missing_additional_files = True
+                message = 'CVS row ' + row[config['id_field']] + ' contains an empty "' + additional_file_field + '" value.'
+                if config['allow_missing_files'] is False:
+                    logging.error(message)
+                    sys.exit('Error: ' + message)
+                else:
+                    logging.warning(message)
+
+            if file_value.startswith('http'):
+                http_response_code = ping_remote_file(config, file_value)
+                if http_response_code != 200:
+                    message = 'Remote file ' + file_value + ' identified in CSV "' + additional_file_field + '" column for record with ID ' \
+                        + row[config['id_field']] + ' not found or not accessible (HTTP response code ' + str(http_response_code) + ').'
+                    if config['allow_missing_files'] is False:
+                        logging.error(message)
+                        sys.exit('Error: ' + message)
+                    else:
+                        logging.warning(message)
+            else:
+                if len(file_value) > 0:
+                    if check_file_exists(config, file_value) is False:
+                        message = 'File "' + file_value + '" in column "' + additional_file_field + '" in CVS row ' + \
+                            row[config['id_field']] + ' not found.'
+                        logging.warning(message)
+
+    def summarize(self):
+        if self.missing_additional_files is True:
+            message = 'Some files in fields configured as "additional_file_fields" are missing. Please see the log for more information.'
+            print(message)
+            if self.config['allow_missing_files'] is False:
+                sys.exit('Error ' + message)
+        else:
+            message = 'OK, files in fields configured as "additional_file_fields" are all present.'
+            logging.info(message)
+            print(message)
+
+
+class AdditionalFilesMediaTypesRule(CsvValidationRule):
+    """Checks that the media type each file registered in the 'additional_files' configuration
+       setting will create exists, and that the file's extension is allowed for that media type.
+    """
+    def start(self, fieldnames):
+        self.additional_files_fields = get_additional_files_config(self.config).keys()
+
+    def check_row(self, count, row):
+        config = self.config
+        for additional_file_field in self.additional_files_fields:
+            if len(row[additional_file_field].strip()) > 0:
+                media_type = set_media_type(config, row[additional_file_field], additional_file_field, row)
+                media_bundle_response_code = ping_media_bundle(config, media_type)
+                if media_bundle_response_code == 404:
+                    message = 'File "' + row[additional_file_field] + '" identified in CSV row ' + row[config['id_field']] + \
+                        ' will create a media of type (' + media_type + '), but that media type is not configured in the destination Drupal.' + \
+                        ' Please make sure your media type configuration matches your Drupal configuration.'
+                    logging.error(message)
+                    sys.exit('Error: ' + message)
+
+                # Check that each file's extension is allowed for the current media type.
+                additional_filenames = row[additional_file_field].split(config['subdelimiter'])
+                media_type_file_field = config['media_type_file_fields'][media_type]
+                for additional_filename in additional_filenames:
+                    if additional_filename.startswith('http'):
+                        # First check to see if the file has an extension.
+                        extension = os.path.splitext(additional_filename)[1]
+                        if len(extension) > 0:
+                            extension = extension.lstrip('.')
+                        else:
+                            extension = get_remote_file_extension(config, additional_filename)
+                            extension = extension.lstrip('.')
+                    else:
+                        if check_file_exists(config, additional_filename):
+                            extension = os.path.splitext(additional_filename)
+                            extension = extension[1].lstrip('.').lower()
+                        else:
+                            additional_file_not_found_message = f'File "{additional_filename}" in column "{additional_file_field}" in CVS row "' + \
+                                row[config['id_field']] + '" not found.'
+                            logging.warning(additional_file_not_found_message)
+                            continue
+
+                    registered_extensions = get_registered_media_extensions(config, media_type, media_type_file_field)
+                    if extension not in registered_extensions[media_type_file_field]:
+                        message = 'File "' + additional_filename + '" in the "' + additional_file_field + '" field of row "' + row[config['id_field']] + \
+                            '" has an extension (' + str(extension) + ') that is allowed in the "' + media_type_file_field + '" field of the "' + media_type + '" media type.'
+                        logging.error(message)
+                        sys.exit('Error: ' + message)
+
+
+class PagedContentDirectoriesRule(CsvValidationRule):
+    """Checks that each row has a directory of page files, and that the page filenames
+       contain the sequence separator.
+    """
+    def check_row(self, count, row):
+        config = self.config
+        dir_path = os.path.join(config['input_dir'], row[config['id_field']])
+        if not os.path.exists(dir_path) or os.path.isfile(dir_path):
+            message = 'Page directory ' + dir_path + ' for CSV record with ID "' + row[config['id_field']] + '"" not found.'
+            logging.error(message)
+            sys.exit('Error: ' + message)
+        page_files = os.listdir(dir_path)
+        if len(page_files) == 0:
+            message = 'Page directory ' + dir_path + ' is empty.'
+            print("Warning: " + message)
+            logging.warning(message)
+        for page_file_name in page_files:
+            if config['paged_content_sequence_separator'] not in page_file_name:
+                message = 'Page file ' + os.path.join(dir_path, page_file_name) + ' does not contain a sequence separator (' + config['paged_content_sequence_separator'] + ').'
+                logging.error(message)
+                sys.exit('Error: ' + message)
+
+    def summarize(self):
+        print('OK, page directories are all present.')
+
+
+class RequiredFieldsHaveValuesRule(CsvValidationRule):
+    """Checks that required fields have a value in each CSV row.
+    """
+    def __init__(self, config, required_drupal_fields):
+        super().__init__(config)
+        self.required_drupal_fields = required_drupal_fields
+        self.rows_with_missing_required_values = []
+
+    def check_row(self, count, row):
+        for required_field in self.required_drupal_fields:
             if len(row[required_field].strip()) == 0:
-                rows_with_missing_required_values.append(required_field)
-                message = f"Required Drupal field \"{required_field}\" in row with ID \"{row[config['id_field']]}\" is empty."
+                self.rows_with_missing_required_values.append(required_field)
+                message = f"Required Drupal field \"{required_field}\" in row with ID \"{row[self.config['id_field']]}\" is empty."
                 logging.error(message)
 
-    if len(rows_with_missing_required_values) > 0:
-        sys.exit('Error: ' + "Some required Drupal fields in your CSV file are empty. See log for more information.")
+    def summarize(self):
+        if len(self.rows_with_missing_required_values) > 0:
+            sys.exit('Error: ' + "Some required Drupal fields in your CSV file are empty. See log for more information.")
 
 
-def validate_csv_field_cardinality(config, field_definitions, csv_data):
-    """Compare values in the CSV data with the fields' cardinality. Log CSV
-       fields that have more values than allowed, and warn user if
-       these fields exist in their CSV data.
+def validate_required_fields_have_values(config, required_drupal_fields, csv_data):
+    """Loop through all fields in CSV to ensure that required field have a value in the CSV.
     """
-    field_cardinalities = dict()
-    csv_headers = csv_data.fieldnames
-    for csv_header in csv_headers:
-        if csv_header in field_definitions.keys():
-            cardinality = field_definitions[csv_header]['cardinality']
-            # We don't care about cardinality of -1 (unlimited).
-            if int(cardinality) > 0:
-                field_cardinalities[csv_header] = cardinality
+    run_csv_validation_rules(config, csv_data, [RequiredFieldsHaveValuesRule(config, required_drupal_fields)])
 
-    for count, row in enumerate(csv_data, start=1):
+
+class FieldCardinalityRule(CsvValidationRule):
+    """Compares values in the CSV data with the fields' cardinality. Warns
+       about CSV fields that have more values than allowed.
+    """
+    def start(self, fieldnames):
+        self.field_cardinalities = dict()
+        for csv_header in fieldnames:
+            if csv_header in self.field_definitions.keys():
+                cardinality = self.field_definitions[csv_header]['cardinality']
+                # We don't care about cardinality of -1 (unlimited).
+                if int(cardinality) > 0:
+                    self.field_cardinalities[csv_header] = cardinality
+
+    def check_row(self, count, row):
+        config = self.config
+        field_cardinalities = self.field_cardinalities
         for field_name in field_cardinalities.keys():
             if field_name in row:
                 # Don't check for the subdelimiter in title.
@@ -4749,8 +6581,7 @@ def validate_csv_field_cardinality(config, field_definitions, csv_data):
                     if config['task'] == 'update':
                         message = 'CSV field "' + field_name + '" in record with node ID ' + row['node_id'] + ' contains more values than the number '
                     message_2 = 'allowed for that field (' + str(field_cardinalities[field_name]) + '). Workbench will add only the first value.'
-                    print('Warning: ' + message + message_2)
-                    logging.warning(message + message_2)
+                    self.warn(message + message_2)
                 if int(field_cardinalities[field_name]) > 1 and len(delimited_field_values) > field_cardinalities[field_name]:
                     if config['task'] == 'create':
                         message = 'CSV field "' + field_name + '" in record with ID ' + row[config['id_field']] + ' contains more values than the number '
@@ -4758,23 +6589,32 @@ def validate_csv_field_cardinality(config, field_definitions, csv_data):
                         message = 'CSV field "' + field_name + '" in record with node ID ' + row['node_id'] + ' contains more values than the number '
                     message_2 = 'allowed for that field (' + str(field_cardinalities[field_name]) + '). Workbench will add only the first ' + str(
                         field_cardinalities[field_name]) + ' values.'
-                    print('Warning: ' + message + message_2)
-                    logging.warning(message + message_2)
+                    self.warn(message + message_2)
 
 
-def validate_text_list_fields(config, field_definitions, csv_data):
-    """For fields that are of "list_string" field type, check that values
-       in CSV are in the field's "allowed_values" config setting.
+def validate_csv_field_cardinality(config, field_definitions, csv_data):
+    """Compare values in the CSV data with the fields' cardinality. Log CSV
+       fields that have more values than allowed, and warn user if
+       these fields exist in their CSV data.
     """
-    list_field_allowed_values = dict()
-    csv_headers = csv_data.fieldnames
-    for csv_header in csv_headers:
-        if csv_header in field_definitions.keys():
-            if 'allowed_values' in field_definitions[csv_header]:
-                if field_definitions[csv_header]['allowed_values'] is not None:
-                    list_field_allowed_values[csv_header] = field_definitions[csv_header]['allowed_values']
+    run_csv_validation_rules(config, csv_data, [FieldCardinalityRule(config, field_definitions)])
 
-    for count, row in enumerate(csv_data, start=1):
+
+class TextListFieldsRule(CsvValidationRule):
+    """For fields that are of "list_string" field type, checks that values
+       in CSV are in the field's "allowed_values" config setting.
+    """
+    def start(self, fieldnames):
+        self.list_field_allowed_values = dict()
+        for csv_header in fieldnames:
+            if csv_header in self.field_definitions.keys():
+                if 'allowed_values' in self.field_definitions[csv_header]:
+                    if self.field_definitions[csv_header]['allowed_values'] is not None:
+                        self.list_field_allowed_values[csv_header] = self.field_definitions[csv_header]['allowed_values']
+
+    def check_row(self, count, row):
+        config = self.config
+        list_field_allowed_values = self.list_field_allowed_values
         for field_name in list_field_allowed_values.keys():
             if field_name in row and len(row[field_name]) > 0:
                 delimited_field_values = row[field_name].split(config['subdelimiter'])
@@ -4786,31 +6626,37 @@ def validate_text_list_fields(config, field_definitions, csv_data):
                         if config['task'] == 'update':
                             message = 'CSV field "' + field_name + '" in record with node ID ' + \
                                 row[config['id_field']] + ' contains a value ("' + field_value + '") that is not in the fields\'s allowed values.'
-                        print('Warning: ' + message)
-                        logging.warning(message)
+                        self.warn(message)
 
 
-def validate_csv_field_length(config, field_definitions, csv_data):
-    """Compare values in the CSV data with the fields' max_length. Log CSV
-       fields that exceed their max_length, and warn user if
-       these fields exist in their CSV data.
+def validate_text_list_fields(config, field_definitions, csv_data):
+    """For fields that are of "list_string" field type, check that values
+       in CSV are in the field's "allowed_values" config setting.
     """
-    field_max_lengths = dict()
-    csv_headers = csv_data.fieldnames
-    for csv_header in csv_headers:
-        if csv_header in field_definitions.keys():
-            if 'max_length' in field_definitions[csv_header]:
-                max_length = field_definitions[csv_header]['max_length']
-                # We don't care about max_length of None (i.e., it's not applicable or unlimited).
-                if max_length is not None:
-                    field_max_lengths[csv_header] = max_length
+    run_csv_validation_rules(config, csv_data, [TextListFieldsRule(config, field_definitions)])
 
-    for count, row in enumerate(csv_data, start=1):
+
+class FieldLengthRule(CsvValidationRule):
+    """Compares values in the CSV data with the fields' max_length. Warns
+       about CSV fields that exceed their max_length.
+    """
+    def start(self, fieldnames):
+        self.field_max_lengths = dict()
+        for csv_header in fieldnames:
+            if csv_header in self.field_definitions.keys():
+                if 'max_length' in self.field_definitions[csv_header]:
+                    max_length = self.field_definitions[csv_header]['max_length']
+                    # We don't care about max_length of None (i.e., it's not applicable or unlimited).
+                    if max_length is not None:
+                        self.field_max_lengths[csv_header] = max_length
+
+    def check_row(self, count, row):
+        config = self.config
+        field_max_lengths = self.field_max_lengths
         for field_name in field_max_lengths.keys():
             if field_name in row:
                 delimited_field_values = row[field_name].split(config['subdelimiter'])
                 for field_value in delimited_field_values:
-                    field_value_length = len(field_value)
                     if field_name in field_max_lengths and len(field_value) > int(field_max_lengths[field_name]):
                         if config['task'] == 'create':
                             message = 'CSV field "' + field_name + '" in record with ID ' + \
@@ -4820,174 +6666,218 @@ def validate_csv_field_length(config, field_definitions, csv_data):
                                 row['node_id'] + ' contains a value that is longer (' + str(len(field_value)) + ' characters)'
                         message_2 = ' than allowed for that field (' + \
                             str(field_max_lengths[field_name]) + ' characters). Workbench will truncate this value prior to populating Drupal.'
-                        print('Warning: ' + message + message_2)
-                        logging.warning(message + message_2)
+                        self.warn(message + message_2)
+
+
+def validate_csv_field_length(config, field_definitions, csv_data):
+    """Compare values in the CSV data with the fields' max_length. Log CSV
+       fields that exceed their max_length, and warn user if
+       these fields exist in their CSV data.
+    """
+    run_csv_validation_rules(config, csv_data, [FieldLengthRule(config, field_definitions)])
+
+
+class GeolocationFieldsRule(CsvValidationRule):
+    """Validates lat,long values in fields that are of type 'geolocation'.
+    """
+    def start(self, fieldnames):
+        self.geolocation_fields_present = False
+        self.geolocation_fields = [field_name for field_name in self.field_definitions.keys() if self.field_definitions[field_name]['field_type'] == 'geolocation']
+
+    def check_row(self, count, row):
+        for field_name in self.geolocation_fields:
+            if field_name in row:
+                self.geolocation_fields_present = True
+                delimited_field_values = row[field_name].split(self.config['subdelimiter'])
+                for field_value in delimited_field_values:
+                    if len(field_value.strip()):
+                        if not validate_latlong_value(field_value.strip()):
+                            message = 'Value in field "' + field_name + '" in row with ID ' + row[self.config['id_field']] + ' (' + field_value + ') is not a valid lat,long pair.'
+                            logging.error(message)
+                            sys.exit('Error: ' + message)
+
+    def summarize(self):
+        if self.geolocation_fields_present is True:
+            message = "OK, geolocation field values in the CSV file validate."
+            print(message)
+            logging.info(message)
 
 
 def validate_geolocation_fields(config, field_definitions, csv_data):
     """Validate lat,long values in fields that are of type 'geolocation'.
     """
-    geolocation_fields_present = False
-    for count, row in enumerate(csv_data, start=1):
-        for field_name in field_definitions.keys():
-            if field_definitions[field_name]['field_type'] == 'geolocation':
-                if field_name in row:
-                    geolocation_fields_present = True
-                    delimited_field_values = row[field_name].split(config['subdelimiter'])
-                    for field_value in delimited_field_values:
-                        if len(field_value.strip()):
-                            if not validate_latlong_value(field_value.strip()):
-                                message = 'Value in field "' + field_name + '" in row with ID ' + row[config['id_field']] + ' (' + field_value + ') is not a valid lat,long pair.'
-                                logging.error(message)
-                                sys.exit('Error: ' + message)
+    run_csv_validation_rules(config, csv_data, [GeolocationFieldsRule(config, field_definitions)])
 
-    if geolocation_fields_present is True:
-        message = "OK, geolocation field values in the CSV file validate."
-        print(message)
-        logging.info(message)
 
+class LinkFieldsRule(CsvValidationRule):
+    """Validates values in fields that are of type 'link'.
+    """
+    def start(self, fieldnames):
+        self.link_fields_present = False
+        self.link_fields = [field_name for field_name in self.field_definitions.keys() if self.field_definitions[field_name]['field_type'] == 'link']
+
+    def check_row(self, count, row):
+        for field_name in self.link_fields:
+            if field_name in row:
+                self.link_fields_present = True
+                delimited_field_values = row[field_name].split(self.config['subdelimiter'])
+                for field_value in delimited_field_values:
+                    if len(field_value.strip()):
+                        if not validate_link_value(field_value.strip()):
+                            message = 'Value in field "' + field_name + '" in row with ID ' + row[self.config['id_field']] + ' (' + field_value + ') is not a valid link field value.'
+                            logging.error(message)
+                            sys.exit('Error: ' + message)
+
+    def summarize(self):
+        if self.link_fields_present is True:
+            message = "OK, link field values in the CSV file validate."
+            print(message)
+            logging.info(message)
+
+
+def validate_link_fields(config, field_definitions, csv_data):
+    """Validate values in fields that are of type 'link'.
+    """
+    run_csv_validation_rules(config, csv_data, [LinkFieldsRule(config, field_definitions)])
+
+
+class AuthorityLinkFieldsRule(CsvValidationRule):
+    """Validates values in fields that are of type 'authority_link'.
+    """
+    def start(self, fieldnames):
+        if self.config['task'] == 'create_terms':
+            self.config['id_field'] = 'term_name'
+
+        self.authority_link_fields_present = False
+        self.authority_link_fields = [field_name for field_name in self.field_definitions.keys() if self.field_definitions[field_name]['field_type'] == 'authority_link']
 
-def validate_link_fields(config, field_definitions, csv_data):
-    """Validate values in fields that are of type 'link'.
-    """
-    link_fields_present = False
-    for count, row in enumerate(csv_data, start=1):
-        for field_name in field_definitions.keys():
-            if field_definitions[field_name]['field_type'] == 'link':
-                if field_name in row:
-                    link_fields_present = True
-                    delimited_field_values = row[field_name].split(config['subdelimiter'])
-                    for field_value in delimited_field_values:
-                        if len(field_value.strip()):
-                            if not validate_link_value(field_value.strip()):
-                                message = 'Value in field "' + field_name + '" in row with ID ' + row[config['id_field']] + ' (' + field_value + ') is not a valid link field value.'
-                                logging.error(message)
-                                sys.exit('Error: ' + message)
+    def check_row(self, count, row):
+        for field_name in self.authority_link_fields:
+            if field_name in row:
+                self.authority_link_fields_present = True
+                delimited_field_values = row[field_name].split(self.config['subdelimiter'])
+                for field_value in delimited_field_values:
+                    if len(field_value.strip()):
+                        if not validate_authority_link_value(field_value.strip(), self.field_definitions[field_name]['authority_sources']):
+                            message = 'Value in field "' + field_name + '" in row with ID "' + \
+                                row[self.config['id_field']] + '" (' + field_value + ') is not a valid authority link field value.'
+                            logging.error(message)
+                            sys.exit('Error: ' + message)
 
-    if link_fields_present is True:
-        message = "OK, link field values in the CSV file validate."
-        print(message)
-        logging.info(message)
+    def summarize(self):
+        if self.authority_link_fields_present is True:
+            message = "OK, authority link field values in the CSV file validate."
+            print(message)
+            logging.info(message)
 
 
 def validate_authority_link_fields(config, field_definitions, csv_data):
     """Validate values in fields that are of type 'authority_link'.
     """
-    if config['task'] == 'create_terms':
-        config['id_field'] = 'term_name'
-
-    authority_link_fields_present = False
-    for count, row in enumerate(csv_data, start=1):
-        for field_name in field_definitions.keys():
-            if field_definitions[field_name]['field_type'] == 'authority_link':
-                if field_name in row:
-                    authority_link_fields_present = True
-                    delimited_field_values = row[field_name].split(config['subdelimiter'])
-                    for field_value in delimited_field_values:
-                        if len(field_value.strip()):
-                            if not validate_authority_link_value(field_value.strip(), field_definitions[field_name]['authority_sources']):
-                                message = 'Value in field "' + field_name + '" in row with ID "' + \
-                                    row[config['id_field']] + '" (' + field_value + ') is not a valid authority link field value.'
-                                logging.error(message)
-                                sys.exit('Error: ' + message)
-
-    if authority_link_fields_present is True:
-        message = "OK, authority link field values in the CSV file validate."
-        print(message)
-        logging.info(message)
+    run_csv_validation_rules(config, csv_data, [AuthorityLinkFieldsRule(config, field_definitions)])
 
 
-def validate_media_track_fields(config, csv_data):
-    """Validate values in fields that are of type 'media_track'.
+class MediaTrackFieldsRule(CsvValidationRule):
+    """Validates values in fields that are of type 'media_track'.
     """
-    media_track_fields_present = False
-    # Must accommodate multiple media track fields in the same CSV (e.g. audio and vidoe media in the
-    # same CSV, each with its own track column). Therefore, we'll need to get the field definitions
-    # for more than one media bundle.
-    media_track_field_definitions = dict()
-    csv_column_headers = copy.copy(csv_data.fieldnames)
-    for column_header in csv_column_headers:
-        if column_header.startswith('media:'):
-            # Assumes well-formed column headers.
-            media_bundle_name_parts = column_header.split(':')
-            media_bundle_name = media_bundle_name_parts[1]
-            if media_bundle_name not in config['media_track_file_fields']:
-                message = 'Media type "' + media_bundle_name + '" in the CSV column header "' + column_header + \
-                    '" is not registered in the "media_track_file_fields" configuration setting.'
-                logging.error(message)
-                sys.exit('Error: ' + message)
+    def start(self, fieldnames):
+        self.media_track_fields_present = False
+        # Must accommodate multiple media track fields in the same CSV (e.g. audio and vidoe media in the
+        # same CSV, each with its own track column). Therefore, we'll need to get the field definitions
+        # for more than one media bundle.
+        self.media_track_field_definitions = dict()
+        for column_header in fieldnames:
+            if column_header.startswith('media:'):
+                # Assumes well-formed column headers.
+                media_bundle_name_parts = column_header.split(':')
+                media_bundle_name = media_bundle_name_parts[1]
+                if media_bundle_name not in self.config['media_track_file_fields']:
+                    message = 'Media type "' + media_bundle_name + '" in the CSV column header "' + column_header + \
+                        '" is not registered in the "media_track_file_fields" configuration setting.'
+                    logging.error(message)
+                    sys.exit('Error: ' + message)
+                if media_bundle_name not in self.media_track_field_definitions:
+                    self.media_track_field_definitions[media_bundle_name] = get_field_definitions(self.config, 'media', media_bundle_name)
+
+    def check_row(self, count, row):
+        config = self.config
+        for media_bundle_name, media_bundle_field_definitions in self.media_track_field_definitions.items():
+            for field_name in media_bundle_field_definitions.keys():
+                if media_bundle_field_definitions[field_name]['field_type'] == 'media_track':
+                    fully_qualified_field_name = f"media:{media_bundle_name}:{field_name}"
+                    if fully_qualified_field_name in row:
+                        self.media_track_fields_present = True
+                        delimited_field_values = row[fully_qualified_field_name].split(config['subdelimiter'])
+                        for field_value in delimited_field_values:
+                            if len(field_value.strip()):
+                                if validate_media_track_value(field_value) is False:
+                                    message = 'Value in field "' + fully_qualified_field_name + '" in row with ID "' + \
+                                        row[config['id_field']] + '" (' + field_value + ') has a media type is not a valid media track field value.'
+                                    logging.error(message)
+                                    sys.exit('Error: ' + message)
 
-            media_track_field_definitions[media_bundle_name] = get_field_definitions(config, 'media', media_bundle_name)
-            for count, row in enumerate(csv_data, start=1):
-                for field_name in media_track_field_definitions[media_bundle_name].keys():
-                    if media_track_field_definitions[media_bundle_name][field_name]['field_type'] == 'media_track':
-                        fully_qualified_field_name = f"media:{media_bundle_name}:{field_name}"
-                        if fully_qualified_field_name in row:
-                            media_track_fields_present = True
-                            delimited_field_values = row[fully_qualified_field_name].split(config['subdelimiter'])
-                            for field_value in delimited_field_values:
-                                if len(field_value.strip()):
-                                    if validate_media_track_value(field_value) is False:
-                                        message = 'Value in field "' + fully_qualified_field_name + '" in row with ID "' + \
-                                            row[config['id_field']] + '" (' + field_value + ') has a media type is not a valid media track field value.'
-                                        logging.error(message)
-                                        sys.exit('Error: ' + message)
+                                # Confirm that the media bundle name in the column header matches the media type
+                                # of the file in the 'file' column.
+                                file_media_type = set_media_type(config, row['file'], 'file', row)
+                                if file_media_type != media_bundle_name:
+                                    message = 'File named in the "file" field in row with ID "' + \
+                                        row[config['id_field']] + '" (' + row['file'] + ') has a media type ' + \
+                                        '(' + file_media_type + ') that differs from the media type indicated in the column header "' + \
+                                        fully_qualified_field_name + '" (' + media_bundle_name + ').'
+                                    logging.error(message)
+                                    sys.exit('Error: ' + message)
 
-                                    # Confirm that the media bundle name in the column header matches the media type
-                                    # of the file in the 'file' column.
-                                    file_media_type = set_media_type(config, row['file'], 'file', row)
-                                    if file_media_type != media_bundle_name:
-                                        message = 'File named in the "file" field in row with ID "' + \
-                                            row[config['id_field']] + '" (' + row['file'] + ') has a media type ' + \
-                                            '(' + file_media_type + ') that differs from the media type indicated in the column header "' + \
-                                            fully_qualified_field_name + '" (' + media_bundle_name + ').'
+                            # Confirm that config['media_use_tid'] and row-level media_use_term is for Service File (http://pcdm.org/use#ServiceFile).
+                            if 'media_use_tid' in row:
+                                if row['media_use_tid'].startswith('http') and row['media_use_tid'] != 'http://pcdm.org/use#ServiceFile':
+                                    message = f"{row['media_use_tid']} cannot be used as a \"media_use_tid\" value in your CSV when creating media tracks."
+                                    logging.error(message)
+                                    sys.exit('Error: ' + message)
+                                elif value_is_numeric(row['media_use_tid']):
+                                    media_use_uri = get_term_uri(config, row['media_use_tid'])
+                                    if media_use_uri != 'http://pcdm.org/use#ServiceFile':
+                                        message = f"{row['media_use_tid']} cannot be used as a \"media_use_tid\" value in your CSV when creating media tracks."
                                         logging.error(message)
                                         sys.exit('Error: ' + message)
-
-                                # Confirm that config['media_use_tid'] and row-level media_use_term is for Service File (http://pcdm.org/use#ServiceFile).
-                                if 'media_use_tid' in row:
-                                    if row['media_use_tid'].startswith('http') and row['media_use_tid'] != 'http://pcdm.org/use#ServiceFile':
-                                        message = f"{row['media_use_tid']} cannot be used as a \"media_use_tid\" value in your CSV when creating media tracks."
+                                else:
+                                    # It's a term name.
+                                    media_use_term_data = get_all_representations_of_term(config, vocab_id='islandora_media_use', name=row['media_use_tid'])
+                                    if media_use_term_data['uri'] != 'http://pcdm.org/use#ServiceFile':
+                                        message = f"{row['media_use_tid']} cannot be used as a \"media_use_tid\" in your CSV value when creating media tracks."
                                         logging.error(message)
                                         sys.exit('Error: ' + message)
-                                    elif value_is_numeric(row['media_use_tid']):
-                                        media_use_uri = get_term_uri(config, row['media_use_tid'])
-                                        if media_use_uri != 'http://pcdm.org/use#ServiceFile':
-                                            message = f"{row['media_use_tid']} cannot be used as a \"media_use_tid\" value in your CSV when creating media tracks."
-                                            logging.error(message)
-                                            sys.exit('Error: ' + message)
+                            else:
+                                media_use_term_data = get_all_representations_of_term(config, uri='http://pcdm.org/use#ServiceFile')
+                                if config['media_use_tid'] not in media_use_term_data.values():
+                                    message = f"{config['media_use_tid']} cannot be used as a value in your configuaration's \"media_use_tid\" setting when creating media tracks."
+                                    logging.error(message)
+                                    sys.exit('Error: ' + message)
+
+                            if config['nodes_only'] is False:
+                                if len(field_value.strip()):
+                                    media_track_field_value_parts = field_value.split(':')
+                                    media_track_file_path_in_csv = media_track_field_value_parts[3]
+                                    if os.path.isabs(media_track_file_path_in_csv):
+                                        media_track_file_path = media_track_file_path_in_csv
                                     else:
-                                        # It's a term name.
-                                        media_use_term_data = get_all_representations_of_term(config, vocab_id='islandora_media_use', name=row['media_use_tid'])
-                                        if media_use_term_data['uri'] != 'http://pcdm.org/use#ServiceFile':
-                                            message = f"{row['media_use_tid']} cannot be used as a \"media_use_tid\" in your CSV value when creating media tracks."
-                                            logging.error(message)
-                                            sys.exit('Error: ' + message)
-                                else:
-                                    media_use_term_data = get_all_representations_of_term(config, uri='http://pcdm.org/use#ServiceFile')
-                                    if config['media_use_tid'] not in media_use_term_data.values():
-                                        message = f"{config['media_use_tid']} cannot be used as a value in your configuaration's \"media_use_tid\" setting when creating media tracks."
+                                        media_track_file_path = os.path.join(config['input_dir'], media_track_file_path_in_csv)
+                                    if not os.path.exists(media_track_file_path) or not os.path.isfile(media_track_file_path):
+                                        message = 'Media track file "' + media_track_file_path_in_csv + '" in row with ID "' + \
+                                            row[config['id_field']] + '" not found.'
                                         logging.error(message)
                                         sys.exit('Error: ' + message)
 
-                                if config['nodes_only'] is False:
-                                    if len(field_value.strip()):
-                                        media_track_field_value_parts = field_value.split(':')
-                                        media_track_file_path_in_csv = media_track_field_value_parts[3]
-                                        if os.path.isabs(media_track_file_path_in_csv):
-                                            media_track_file_path = media_track_file_path_in_csv
-                                        else:
-                                            media_track_file_path = os.path.join(config['input_dir'], media_track_file_path_in_csv)
-                                        if not os.path.exists(media_track_file_path) or not os.path.isfile(media_track_file_path):
-                                            message = 'Media track file "' + media_track_file_path_in_csv + '" in row with ID "' + \
-                                                row[config['id_field']] + '" not found.'
-                                            logging.error(message)
-                                            sys.exit('Error: ' + message)
-
-    if media_track_fields_present is True:
-        message = "OK, media track field values in the CSV file validate."
-        print(message)
-        logging.info(message)
+    def summarize(self):
+        if self.media_track_fields_present is True:
+            message = "OK, media track field values in the CSV file validate."
+            print(message)
+            logging.info(message)
+
+
+def validate_media_track_fields(config, csv_data):
+    """Validate values in fields that are of type 'media_track'.
+    """
+    run_csv_validation_rules(config, csv_data, [MediaTrackFieldsRule(config)])
 
 
 def validate_media_track_value(media_track_value):
@@ -5080,34 +6970,41 @@ def validate_term_name_length(term_name, row_number, column_name):
         sys.exit('Error: ' + message + ' See the Workbench log for more information.')
 
 
+class NodeCreatedDateRule(CsvValidationRule):
+    """Checks that values in the 'created' field are in the format used by Drupal's
+       'created' node property, e.g., 2020-11-15T23:49:22+00:00, and are not in the future.
+    """
+    def check_row(self, count, row):
+        field_value = row.get('created')
+        if field_value is not None and len(field_value) > 0:
+            if not validate_node_created_date_string(field_value):
+                message = 'CSV field "created" in record with ID ' + \
+                    row[self.config['id_field']] + ' contains a date "' + field_value + '" that is not formatted properly.'
+                logging.error(message)
+                sys.exit('Error: ' + message)
+
+            now = datetime.datetime.now()
+            # Remove the GMT differential at the end of the time string.
+            date_string_trimmed = re.sub(
+                r'[+-]\d\d:\d\d$', '', field_value)
+            created_date = datetime.datetime.strptime(date_string_trimmed, '%Y-%m-%dT%H:%M:%S')
+            if created_date > now:
+                message = 'CSV field "created" in record with ID ' + \
+                    row[self.config['id_field']] + ' contains a date "' + field_value + '" that is in the future.'
+                logging.error(message)
+                sys.exit('Error: ' + message)
+
+    def summarize(self):
+        message = 'OK, dates in the "created" CSV field are all formated correctly and in the future.'
+        print(message)
+        logging.info(message)
+
+
 def validate_node_created_date(config, csv_data):
     """Checks that date_string is in the format used by Drupal's 'created' node property,
        e.g., 2020-11-15T23:49:22+00:00. Also check to see if the date is in the future.
     """
-    for count, row in enumerate(csv_data, start=1):
-        for field_name, field_value in row.items():
-            if field_name == 'created' and len(field_value) > 0:
-                # matches = re.match(r'^\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d[+-]\d\d:\d\d$', field_value)
-                if not validate_node_created_date_string(field_value):
-                    message = 'CSV field "created" in record with ID ' + \
-                        row[config['id_field']] + ' contains a date "' + field_value + '" that is not formatted properly.'
-                    logging.error(message)
-                    sys.exit('Error: ' + message)
-
-                now = datetime.datetime.now()
-                # Remove the GMT differential at the end of the time string.
-                date_string_trimmed = re.sub(
-                    r'[+-]\d\d:\d\d$', '', field_value)
-                created_date = datetime.datetime.strptime(date_string_trimmed, '%Y-%m-%dT%H:%M:%S')
-                if created_date > now:
-                    message = 'CSV field "created" in record with ID ' + \
-                        row[config['id_field']] + ' contains a date "' + field_value + '" that is in the future.'
-                    logging.error(message)
-                    sys.exit('Error: ' + message)
-
-    message = 'OK, dates in the "created" CSV field are all formated correctly and in the future.'
-    print(message)
-    logging.info(message)
+    run_csv_validation_rules(config, csv_data, [NodeCreatedDateRule(config)])
 
 
 def validate_node_created_date_string(created_date_string):
@@ -5117,29 +7014,38 @@ def validate_node_created_date_string(created_date_string):
         return False
 
 
+class EdtfFieldsRule(CsvValidationRule):
+    """Validates values in fields that are of type 'edtf'.
+    """
+    def start(self, fieldnames):
+        self.edtf_fields_present = False
+        self.edtf_fields = [field_name for field_name in self.field_definitions.keys() if self.field_definitions[field_name]['field_type'] == 'edtf']
+
+    def check_row(self, count, row):
+        for field_name in self.edtf_fields:
+            if field_name in row:
+                self.edtf_fields_present = True
+                delimited_field_values = row[field_name].split(self.config['subdelimiter'])
+                for field_value in delimited_field_values:
+                    if len(field_value.strip()):
+                        valid = validate_edtf_date(field_value)
+                        if valid is False:
+                            message = 'Value in field "' + field_name + '" in row with ID ' + row[self.config['id_field']] + ' ("' + field_value + '") is not a valid EDTF date/time.'
+                            logging.error(message)
+                            if self.config['perform_soft_checks'] is False:
+                                sys.exit('Error: ' + message)
+
+    def summarize(self):
+        if self.edtf_fields_present is True:
+            message = "OK, EDTF field values in the CSV file validate."
+            print(message)
+            logging.info(message)
+
+
 def validate_edtf_fields(config, field_definitions, csv_data):
     """Validate values in fields that are of type 'edtf'.
     """
-    edtf_fields_present = False
-    for count, row in enumerate(csv_data, start=1):
-        for field_name in field_definitions.keys():
-            if field_definitions[field_name]['field_type'] == 'edtf':
-                if field_name in row:
-                    edtf_fields_present = True
-                    delimited_field_values = row[field_name].split(config['subdelimiter'])
-                    for field_value in delimited_field_values:
-                        if len(field_value.strip()):
-                            valid = validate_edtf_date(field_value)
-                            if valid is False:
-                                message = 'Value in field "' + field_name + '" in row with ID ' + row[config['id_field']] + ' ("' + field_value + '") is not a valid EDTF date/time.'
-                                logging.error(message)
-                                if config['perform_soft_checks'] is False:
-                                    sys.exit('Error: ' + message)
-
-    if edtf_fields_present is True:
-        message = "OK, EDTF field values in the CSV file validate."
-        print(message)
-        logging.info(message)
+    run_csv_validation_rules(config, csv_data, [EdtfFieldsRule(config, field_definitions)])
 
 
 def validate_edtf_date(date):
@@ -5186,51 +7092,96 @@ def validate_edtf_date(date):
         return False
 
 
+class UrlAliasesRule(CsvValidationRule):
+    """Checks that URL aliases don't already exist.
+    """
+    def check_row(self, count, row):
+        field_value = row.get('url_alias')
+        if field_value is not None and len(field_value) > 0:
+            if field_value.strip()[0] != '/':
+                message = 'CSV field "url_alias" in record with ID ' + \
+                    row[self.config['id_field']] + ' contains an alias "' + field_value + '" that is missing its leading /.'
+                logging.error(message)
+                sys.exit('Error: ' + message)
+
+            alias_ping = ping_url_alias(self.config, field_value)
+            # @todo: Add 301 and 302 as acceptable status codes?
+            if alias_ping == 200:
+                message = 'CSV field "url_alias" in record with ID ' + \
+                    row[self.config['id_field']] + ' contains an alias "' + field_value + '" that already exists.'
+                logging.error(message)
+                sys.exit('Error: ' + message)
+
+    def summarize(self):
+        message = 'OK, URL aliases do not already exist.'
+        print(message)
+        logging.info(message)
+
+
 def validate_url_aliases(config, csv_data):
     """Checks that URL aliases don't already exist.
     """
-    for count, row in enumerate(csv_data, start=1):
-        for field_name, field_value in row.items():
-            if field_name == 'url_alias' and len(field_value) > 0:
-                if field_value.strip()[0] != '/':
-                    message = 'CSV field "url_alias" in record with ID ' + \
-                        row[config['id_field']] + ' contains an alias "' + field_value + '" that is missing its leading /.'
-                    logging.error(message)
-                    sys.exit('Error: ' + message)
+    run_csv_validation_rules(config, csv_data, [UrlAliasesRule(config)])
 
-                alias_ping = ping_url_alias(config, field_value)
-                # @todo: Add 301 and 302 as acceptable status codes?
-                if alias_ping == 200:
-                    message = 'CSV field "url_alias" in record with ID ' + \
-                        row[config['id_field']] + ' contains an alias "' + field_value + '" that already exists.'
-                    logging.error(message)
-                    sys.exit('Error: ' + message)
 
-    message = 'OK, URL aliases do not already exist.'
-    print(message)
-    logging.info(message)
+class NodeUidRule(CsvValidationRule):
+    """Checks that the user identified in the 'uid' field exists in Drupal. Note that
+       this does not validate any permissions the user may have.
+    """
+    def check_row(self, count, row):
+        field_value = row.get('uid')
+        if field_value is not None and len(field_value) > 0:
+            # Request to /user/x?_format=json goes here; 200 means the user
+            # exists, 404 means they do no.
+            uid_url = self.config['host'] + '/user/' + str(field_value) + '?_format=json'
+            uid_response = issue_request(self.config, 'GET', uid_url)
+            if uid_response.status_code == 404:
+                message = 'CSV field "uid" in record with ID ' + \
+                    row[self.config['id_field']] + ' contains a user ID "' + field_value + '" that does not exist in the target Drupal.'
+                logging.error(message)
+                sys.exit('Error: ' + message)
+
+    def summarize(self):
+        message = 'OK, user IDs in the "uid" CSV field all exist.'
+        print(message)
+        logging.info(message)
 
 
 def validate_node_uid(config, csv_data):
     """Checks that the user identified in the 'uid' field exists in Drupal. Note that
        this does not validate any permissions the user may have.
     """
-    for count, row in enumerate(csv_data, start=1):
-        for field_name, field_value in row.items():
-            if field_name == 'uid' and len(field_value) > 0:
-                # Request to /user/x?_format=json goes here; 200 means the user
-                # exists, 404 means they do no.
-                uid_url = config['host'] + '/user/' + str(field_value) + '?_format=json'
-                uid_response = issue_request(config, 'GET', uid_url)
-                if uid_response.status_code == 404:
-                    message = 'CSV field "uid" in record with ID ' + \
-                        row[config['id_field']] + ' contains a user ID "' + field_value + '" that does not exist in the target Drupal.'
-                    logging.error(message)
-                    sys.exit('Error: ' + message)
+    run_csv_validation_rules(config, csv_data, [NodeUidRule(config)])
 
-    message = 'OK, user IDs in the "uid" CSV field all exist.'
-    print(message)
-    logging.info(message)
+
+class ParentIdsPrecedeChildrenRule(CsvValidationRule):
+    """In the page/child-level metadata method of creating compound content,
+       CSV rows for parent items must come before their children in the CSV file.
+       This rule checks for that. Note that this check only applies to one
+       level of parent/child hierarchy (i.e., parents and their immediate children).
+    """
+    def start(self, fieldnames):
+        self.positions = dict()
+
+    def check_row(self, count, row):
+        self.positions[row[self.config['id_field']]] = {'position': count, 'parent_id': row['parent_id']}
+
+    def summarize(self):
+        positions = self.positions
+        # Loop through position records and check to see if the "position" of each child row
+        # (i.e. a row with a value in its "parent_id" CSV column) is lower than the "position"
+        # of the row identified in its "parent_id" value. If it is lower, error out.
+        for row in positions.items():
+            # Only child items have a value in their "parent_id" field.
+            if row[1]['parent_id'] == '':
+                continue
+            parent_id = row[1]['parent_id']
+            if parent_id in positions:
+                if row[1]['position'] < positions[parent_id]['position']:
+                    message = f"Child item with CSV ID \"{row[0]}\" must come after its parent (CSV ID \"{row[1]['parent_id']}\") in the CSV file."
+                    logging.error(message)
+                    if self.config['perform_soft_checks'] is False:
+                        sys.exit('Error: ' + message)
 
 
 def validate_parent_ids_precede_children(config, csv_data):
@@ -5239,65 +7190,112 @@ def validate_parent_ids_precede_children(config, csv_data):
        This function checks for that. Note that this check only applies to one
        level of parent/child hierarchy (i.e., parents and their immediate children).
     """
-    positions = dict()
-    id_field = config['id_field']
-    row_num = 0
-    if 'parent_id' in csv_data.fieldnames:
-        for row in csv_data:
-            row_num += 1
-            positions[row[id_field]] = {'position': row_num, 'parent_id': row['parent_id']}
-    else:
+    if 'parent_id' not in csv_data.fieldnames:
         return False
+    run_csv_validation_rules(config, csv_data, [ParentIdsPrecedeChildrenRule(config)])
 
-    # Loop through position records and check to see if the "position" of each child row
-    # (i.e. a row with a value in its "parent_id" CSV column) is lower than the "position"
-    # of the row identified in its "parent_id" value. If it is lower, error out.
-    for row in positions.items():
-        # Only child items have a value in their "parent_id" field.
-        if row[1]['parent_id'] == '':
-            continue
-        parent_id = row[1]['parent_id']
-        if parent_id in positions:
-            if row[1]['position'] < positions[parent_id]['position']:
-                message = f"Child item with CSV ID \"{row[0]}\" must come after its parent (CSV ID \"{row[1]['parent_id']}\") in the CSV file."
+
+class ParentIdsInCsvIdToNodeIdMapRule(CsvValidationRule):
+    """Queries the CSV ID to node ID map to check for non-unique parent IDs.
+       If they exist, reports them but does not exit.
+    """
+    def start(self, fieldnames):
+        config = self.config
+        self.parents_from_id_map = []
+        message = "Validating parent IDs in the CSV ID to node ID map, please wait."
+        print(message)
+
+        # First, confirm the databae exists; if not, tell the user and exit.
+        if config['csv_id_to_node_id_map_path'] is not False:
+            if not os.path.exists(config['csv_id_to_node_id_map_path']):
+                message = f"Can't find CSV ID to node ID database path at {config['csv_id_to_node_id_map_path']}."
                 logging.error(message)
-                if config['perform_soft_checks'] is False:
-                    sys.exit('Error: ' + message)
+                sys.exit('Error: ' + message)
+
+    def check_row(self, count, row):
+        config = self.config
+        # If database exists, query it.
+        if config['csv_id_to_node_id_map_path'] is not False:
+            parents_from_id_map = self.parents_from_id_map
+            parent_in_id_map_result = get_node_ids_from_csv_id_to_node_id_map(
+                config, row[config['id_field']], column='parent_csv_id', latest_only=config['ignore_duplicate_parent_ids'])
+            for parent_in_id_map_node_id in parent_in_id_map_result:
+                parents_from_id_map.append(parent_in_id_map_node_id.strip())
+            if len(parents_from_id_map) > 1:
+                message = f'Query of ID map for parent ID "{row["parent_id"]}" returned multiple node IDs: ({", ".join(parents_from_id_map)}).'
+                self.warn(message)
 
 
 def validate_parent_ids_in_csv_id_to_node_id_map(config, csv_data):
     """Query the CSV ID to node ID map to check for non-unique parent IDs.
        If they exist, report out but do not exit.
     """
-    if config['query_csv_id_to_node_id_map_for_parents'] is True:
-        message = "Validating parent IDs in the CSV ID to node ID map, please wait."
-        print(message)
-    else:
+    if config['query_csv_id_to_node_id_map_for_parents'] is not True:
         return
+    run_csv_validation_rules(config, csv_data, [ParentIdsInCsvIdToNodeIdMapRule(config)])
+
+
+class TaxonomyFieldValuesRule(CsvValidationRule):
+    """For CSV fields that are taxonomy reference fields, validates their values
+       against the taxonomies referenced by the field. Does not validate Typed
+       Relation fields (see TypedRelationFieldValuesRule).
+    """
+    def start(self, fieldnames):
+        # Define a list to store names of CSV fields that reference vocabularies.
+        self.fields_with_vocabularies = list()
+        self.vocab_validation_issues = False
+        self.new_term_names_in_csv_results = []
+        # Get all the term IDs for vocabularies referenced in all fields in the CSV.
+        for column_name in fieldnames:
+            if column_name in self.field_definitions:
+                if self.field_definitions[column_name]['field_type'] == 'typed_relation':
+                    continue
+                if 'vocabularies' in self.field_definitions[column_name]:
+                    vocabularies = get_field_vocabularies(self.config, self.field_definitions, column_name)
+                    # If there are no vocabularies linked to the current field, 'vocabularies'
+                    # will be False and will throw a TypeError.
+                    try:
+                        num_vocabs = len(vocabularies)
+                        if num_vocabs > 0:
+                            self.fields_with_vocabularies.append(column_name)
+                    except BaseException:
+                        message = 'Workbench cannot get vocabularies linked to field "' + column_name + '". Please confirm that field has at least one vocabulary.'
+                        logging.error(message)
+                        sys.exit('Error: ' + message)
 
-    # First, confirm the databae exists; if not, tell the user and exit.
-    if config['csv_id_to_node_id_map_path'] is not False:
-        if not os.path.exists(config['csv_id_to_node_id_map_path']):
-            message = f"Can't find CSV ID to node ID database path at {config['csv_id_to_node_id_map_path']}."
-            logging.error(message)
-            sys.exit('Error: ' + message)
-
-    # If database exists, query it.
-    if config['query_csv_id_to_node_id_map_for_parents'] is True and config['csv_id_to_node_id_map_path'] is not False:
-        id_field = config['id_field']
-        parents_from_id_map = []
-        for row in csv_data:
-            if config['ignore_duplicate_parent_ids'] is True:
-                query = "select * from csv_id_to_node_id_map where parent_csv_id = ? order by timestamp desc limit 1"
+    def check_row(self, count, row):
+        # Validate each taxonomy fields's values.
+        for column_name in self.fields_with_vocabularies:
+            if len(row[column_name]):
+                new_term_names_in_csv = validate_taxonomy_reference_value(self.config, self.field_definitions, column_name, row[column_name], count)
+                self.new_term_names_in_csv_results.append(new_term_names_in_csv)
+
+    def summarize(self):
+        config = self.config
+        # If none of the CSV fields are taxonomy reference fields, return.
+        if len(self.fields_with_vocabularies) == 0:
+            return
+
+        if True in self.new_term_names_in_csv_results and config['allow_adding_terms'] is True:
+            if config['validate_terms_exist'] is True:
+                message = "OK, term IDs/names in CSV file exist in their respective taxonomies"
+                if config['log_term_creation'] is True:
+                    message = message + " (new terms will be created as noted in the Workbench log)."
+                else:
+                    message = message + ' (new terms will be created but not noted in the Workbench log since "log_term_creation" is set to false).'
+                print(message)
             else:
-                query = "select * from csv_id_to_node_id_map where parent_csv_id = ?"
-            parent_in_id_map_result = sqlite_manager(config, operation='select', query=query, values=(row[id_field],), db_file_path=config['csv_id_to_node_id_map_path'])
-            for parent_in_id_map_row in parent_in_id_map_result:
-                parents_from_id_map.append(parent_in_id_map_row['node_id'].strip())
-            if len(parents_from_id_map) > 1:
-                message = f'Query of ID map for parent ID "{row["parent_id"]}" returned multiple node IDs: ({", ".join(parents_from_id_map)}).'
-                logging.warning(message)
-                print("Warning: " + message)
+                if config['log_term_creation'] is True:
+                    print("Skipping check for existence of terms (new terms will be created as noted in the Workbench log).")
+                else:
+                    print('Skipping check for existence of terms (notee: terms will be created but not noted in the Workbench log - "log_term_creation" is set to false).')
+                logging.warning("Skipping check for existence of terms (but new terms will be created).")
+        else:
+            # All term IDs are in their field's vocabularies.
+            print("OK, term IDs/names in CSV file exist in their respective taxonomies.")
+            logging.info("OK, term IDs/names in CSV file exist in their respective taxonomies.")
+
+        return self.vocab_validation_issues
 
 
 def validate_taxonomy_field_values(config, field_definitions, csv_data):
@@ -5307,59 +7305,7 @@ def validate_taxonomy_field_values(config, field_definitions, csv_data):
        by the field. Does not validate Typed Relation fields
        (see validate_typed_relation_field_values()).
     """
-    # Define a list to store names of CSV fields that reference vocabularies.
-    fields_with_vocabularies = list()
-    vocab_validation_issues = False
-    # Get all the term IDs for vocabularies referenced in all fields in the CSV.
-    for column_name in csv_data.fieldnames:
-        if column_name in field_definitions:
-            if field_definitions[column_name]['field_type'] == 'typed_relation':
-                continue
-            if 'vocabularies' in field_definitions[column_name]:
-                vocabularies = get_field_vocabularies(config, field_definitions, column_name)
-                # If there are no vocabularies linked to the current field, 'vocabularies'
-                # will be False and will throw a TypeError.
-                try:
-                    num_vocabs = len(vocabularies)
-                    if num_vocabs > 0:
-                        fields_with_vocabularies.append(column_name)
-                except BaseException:
-                    message = 'Workbench cannot get vocabularies linked to field "' + column_name + '". Please confirm that field has at least one vocabulary.'
-                    logging.error(message)
-                    sys.exit('Error: ' + message)
-
-    # If none of the CSV fields are taxonomy reference fields, return.
-    if len(fields_with_vocabularies) == 0:
-        return
-
-    # Iterate through the CSV and validate each taxonomy fields's values.
-    new_term_names_in_csv_results = []
-    for count, row in enumerate(csv_data, start=1):
-        for column_name in fields_with_vocabularies:
-            if len(row[column_name]):
-                new_term_names_in_csv = validate_taxonomy_reference_value(config, field_definitions, column_name, row[column_name], count)
-                new_term_names_in_csv_results.append(new_term_names_in_csv)
-
-    if True in new_term_names_in_csv_results and config['allow_adding_terms'] is True:
-        if config['validate_terms_exist'] is True:
-            message = "OK, term IDs/names in CSV file exist in their respective taxonomies"
-            if config['log_term_creation'] is True:
-                message = message + " (new terms will be created as noted in the Workbench log)."
-            else:
-                message = message + ' (new terms will be created but not noted in the Workbench log since "log_term_creation" is set to false).'
-            print(message)
-        else:
-            if config['log_term_creation'] is True:
-                print("Skipping check for existence of terms (new terms will be created as noted in the Workbench log).")
-            else:
-                print('Skipping check for existence of terms (notee: terms will be created but not noted in the Workbench log - "log_term_creation" is set to false).')
-            logging.warning("Skipping check for existence of terms (but new terms will be created).")
-    else:
-        # All term IDs are in their field's vocabularies.
-        print("OK, term IDs/names in CSV file exist in their respective taxonomies.")
-        logging.info("OK, term IDs/names in CSV file exist in their respective taxonomies.")
-
-    return vocab_validation_issues
+    return run_csv_validation_rules(config, csv_data, [TaxonomyFieldValuesRule(config, field_definitions)])[0]
 
 
 def validate_vocabulary_fields_in_csv(config, vocabulary_id, vocab_csv_file_path):
@@ -5442,43 +7388,45 @@ def validate_vocabulary_fields_in_csv(config, vocabulary_id, vocab_csv_file_path
             sys.exit('Error: ' + message)
 
 
-def validate_typed_relation_field_values(config, field_definitions, csv_data):
-    """Validate values in fields that are of type 'typed_relation'. Each CSV
+class TypedRelationFieldValuesRule(CsvValidationRule):
+    """Validates values in fields that are of type 'typed_relation'. Each CSV
        value must have this pattern: "string:string:int" or "string:string:string".
        If the last segment is a string, it must be term name, a namespaced term name,
        or an http URI.
     """
-    # Define a list to store CSV field names that contain vocabularies.
-    fields_with_vocabularies = list()
-    # Get all the term IDs for vocabularies referenced in all fields in the CSV.
-    vocab_validation_issues = False
-    for column_name in csv_data.fieldnames:
-        if column_name in field_definitions:
-            if 'vocabularies' in field_definitions[column_name]:
-                vocabularies = get_field_vocabularies(config, field_definitions, column_name)
-                # If there are no vocabularies linked to the current field, 'vocabularies'
-                # will be False and will throw a TypeError.
-                try:
-                    num_vocabs = len(vocabularies)
-                    if num_vocabs > 0:
-                        fields_with_vocabularies.append(column_name)
-                except BaseException:
-                    message = 'Workbench cannot get vocabularies linked to field "' + column_name + '". Please confirm that field has at least one vocabulary.'
-                    logging.error(message)
-                    sys.exit('Error: ' + message)
-                all_tids_for_field = []
+    def start(self, fieldnames):
+        # Define a list to store CSV field names that contain vocabularies.
+        self.fields_with_vocabularies = list()
+        self.vocab_validation_issues = False
+        self.typed_relation_fields_present = False
+        self.new_term_names_in_csv_results = []
+        # Get all the term IDs for vocabularies referenced in all fields in the CSV.
+        for column_name in fieldnames:
+            if column_name in self.field_definitions:
+                if 'vocabularies' in self.field_definitions[column_name]:
+                    vocabularies = get_field_vocabularies(self.config, self.field_definitions, column_name)
+                    # If there are no vocabularies linked to the current field, 'vocabularies'
+                    # will be False and will throw a TypeError.
+                    try:
+                        num_vocabs = len(vocabularies)
+                        if num_vocabs > 0:
+                            self.fields_with_vocabularies.append(column_name)
+                    except BaseException:
+                        message = 'Workbench cannot get vocabularies linked to field "' + column_name + '". Please confirm that field has at least one vocabulary.'
+                        logging.error(message)
+                        sys.exit('Error: ' + message)
 
-    # If none of the CSV fields are taxonomy reference fields, return.
-    if len(fields_with_vocabularies) == 0:
-        return
+    def check_row(self, count, row):
+        # If none of the CSV fields are taxonomy reference fields, there is nothing to check.
+        if len(self.fields_with_vocabularies) == 0:
+            return
 
-    typed_relation_fields_present = False
-    new_term_names_in_csv_results = []
-    for count, row in enumerate(csv_data, start=1):
+        config = self.config
+        field_definitions = self.field_definitions
         for field_name in field_definitions.keys():
             if field_definitions[field_name]['field_type'] == 'typed_relation' and 'typed_relations' in field_definitions[field_name]:
                 if field_name in row:
-                    typed_relation_fields_present = True
+                    self.typed_relation_fields_present = True
                     delimited_field_values = row[field_name].split(config['subdelimiter'])
                     for field_value in delimited_field_values:
                         if len(field_value) == 0:
@@ -5500,8 +7448,8 @@ def validate_typed_relation_field_values(config, field_definitions, csv_data):
                             logging.error(message)
                             sys.exit('Error: ' + message)
 
-                    # Iterate through the CSV and validate the taxonomy term/name/URI in each field subvalue.
-                    for column_name in fields_with_vocabularies:
+                    # Validate the taxonomy term/name/URI in each field subvalue.
+                    for column_name in self.fields_with_vocabularies:
                         if len(row[column_name]):
                             delimited_field_values = row[column_name].split(config['subdelimiter'])
                             delimited_field_values_without_relator_strings = []
@@ -5512,22 +7460,36 @@ def validate_typed_relation_field_values(config, field_definitions, csv_data):
 
                             field_value_to_check = config['subdelimiter'].join(delimited_field_values_without_relator_strings)
                             new_term_names_in_csv = validate_taxonomy_reference_value(config, field_definitions, column_name, field_value_to_check, count)
-                            new_term_names_in_csv_results.append(new_term_names_in_csv)
+                            self.new_term_names_in_csv_results.append(new_term_names_in_csv)
+
+    def summarize(self):
+        config = self.config
+        if len(self.fields_with_vocabularies) == 0:
+            return
 
-    if typed_relation_fields_present is True and True in new_term_names_in_csv_results and config['allow_adding_terms'] is True:
-        message = "OK, term IDs/names used in typed relation fields in the CSV file exist in their respective taxonomies"
-        if config['log_term_creation'] is True:
-            message = message + " (new terms will be created as noted in the Workbench log)."
+        if self.typed_relation_fields_present is True and True in self.new_term_names_in_csv_results and config['allow_adding_terms'] is True:
+            message = "OK, term IDs/names used in typed relation fields in the CSV file exist in their respective taxonomies"
+            if config['log_term_creation'] is True:
+                message = message + " (new terms will be created as noted in the Workbench log)."
+            else:
+                message = message + ' (new terms will be created but not noted in the Workbench log since "log_term_creation" is set to false).'
+            print(message)
         else:
-            message = message + ' (new terms will be created but not noted in the Workbench log since "log_term_creation" is set to false).'
-        print(message)
-    else:
-        if typed_relation_fields_present is True:
-            # All term IDs are in their field's vocabularies.
-            print("OK, term IDs/names used in typed relation fields in the CSV file exist in their respective taxonomies.")
-            logging.info("OK, term IDs/names used in typed relation fields in the CSV file exist in their respective taxonomies.")
+            if self.typed_relation_fields_present is True:
+                # All term IDs are in their field's vocabularies.
+                print("OK, term IDs/names used in typed relation fields in the CSV file exist in their respective taxonomies.")
+                logging.info("OK, term IDs/names used in typed relation fields in the CSV file exist in their respective taxonomies.")
 
-    return vocab_validation_issues
+        return self.vocab_validation_issues
+
+
+def validate_typed_relation_field_values(config, field_definitions, csv_data):
+    """Validate values in fields that are of type 'typed_relation'. Each CSV
+       value must have this pattern: "string:string:int" or "string:string:string".
+       If the last segment is a string, it must be term name, a namespaced term name,
+       or an http URI.
+    """
+    return run_csv_validation_rules(config, csv_data, [TypedRelationFieldValuesRule(config, field_definitions)])[0]
 
 
 def validate_taxonomy_reference_value(config, field_definitions, csv_field_name, csv_field_value, record_number):
@@ -5692,8 +7654,6 @@ def write_to_output_csv(config, id, node_json, input_csv_row=None):
     for field_to_remove in fields_to_remove:
         node_field_names.remove(field_to_remove)
 
-    csvfile = open(config['output_csv'], 'a+', encoding='utf-8')
-
     if input_csv_row is not None and config['output_csv_include_input_csv'] is True:
         # Remove fields from the input CSV that would overwrite field data from the new node.
         input_csv_row_fieldnames = list(input_csv_row.keys())
@@ -5703,14 +7663,6 @@ def write_to_output_csv(config, id, node_json, input_csv_row=None):
             input_csv_row_fieldnames.remove('status')
         node_field_names.extend(input_csv_row_fieldnames)
 
-    writer = csv.DictWriter(csvfile, fieldnames=node_field_names, lineterminator="\n")
-
-    # Check for presence of header row, don't add it if it's already there.
-    with open(config['output_csv']) as f:
-        first_line = f.readline()
-    if not first_line.startswith(config['id_field']):
-        writer.writeheader()
-
     # Assemble the CSV record to write.
     row = dict()
     row[config['id_field']] = id
@@ -5726,8 +7678,19 @@ def write_to_output_csv(config, id, node_json, input_csv_row=None):
             del input_csv_row['status']
         # Then append the input row to the new node data.
         row.update(input_csv_row)
-    writer.writerow(row)
-    csvfile.close()
+
+    with output_lock:
+        csvfile = open(config['output_csv'], 'a+', encoding='utf-8')
+        writer = csv.DictWriter(csvfile, fieldnames=node_field_names, lineterminator="\n")
+
+        # Check for presence of header row, don't add it if it's already there.
+        with open(config['output_csv']) as f:
+            first_line = f.readline()
+        if not first_line.startswith(config['id_field']):
+            writer.writeheader()
+
+        writer.writerow(row)
+        csvfile.close()
 
 
 def create_children_from_directory(config, parent_csv_record, parent_node_id):
@@ -5742,7 +7705,7 @@ def create_children_from_directory(config, parent_csv_record, parent_node_id):
     page_dir_path = os.path.join(config['input_dir'], str(parent_id).strip())
     page_files = os.listdir(page_dir_path)
     page_file_return_dict = dict()
-    for page_file_name in page_files:
+    for page_file_name in time_rows(config, page_files):
         filename_without_extension = os.path.splitext(page_file_name)[0]
         filename_segments = filename_without_extension.split(config['paged_content_sequence_separator'])
         weight = filename_segments[-1]
@@ -5879,6 +7842,120 @@ def create_children_from_directory(config, parent_csv_record, parent_node_id):
                     logging.error("Post node create script " + command + " failed with exit code " + str(post_task_return_code) + ".")
 
 
+def execute_rows_in_dependency_order(config, rows, row_function):
+    """Process CSV rows concurrently, using up to config['max_workers'] threads, while making
+       sure that rows are processed after the row identified in their 'parent_id' column.
+       Rows whose parents are not in the CSV (or that have no parent) and rows in unrelated
+       subtrees are processed in parallel.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        rows : list
+            The CSV rows to process, in the order they appear in the input CSV.
+        row_function : function
+            The function that processes a single row. It is passed the row as its only argument.
+        Returns
+        -------
+        None
+    """
+    id_field = config['id_field']
+    csv_ids = collections.Counter([row[id_field] for row in rows])
+
+    # Children are keyed by their parent's CSV ID. Rows with no parent in the CSV are roots.
+    children = collections.defaultdict(list)
+    roots = list()
+    for row in rows:
+        parent_id = row.get('parent_id')
+        if parent_id is not None and len(parent_id.strip()) > 0 and parent_id in csv_ids and parent_id != row[id_field]:
+            children[parent_id].append(row)
+        else:
+            roots.append(row)
+
+    processed_row_count = 0
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=int(config['max_workers']))
+    pending = dict()
+    try:
+        for row in roots:
+            pending[executor.submit(row_function, row)] = row
+        while len(pending) > 0:
+            done, not_done = concurrent.futures.wait(pending.keys(), return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                row = pending.pop(future)
+                # Re-raises any exception (including SystemExit) raised while processing the row.
+                future.result()
+                processed_row_count += 1
+                # If a parent ID is used by more than one row, wait until all of them are done.
+                csv_ids[row[id_field]] -= 1
+                if csv_ids[row[id_field]] == 0:
+                    for child_row in children.pop(row[id_field], []):
+                        pending[executor.submit(row_function, child_row)] = child_row
+    except BaseException:
+        for future in pending.keys():
+            future.cancel()
+        raise
+    finally:
+        executor.shutdown(wait=True)
+
+    # Rows that are part of a parent/child cycle are never released above, so we
+    # process them sequentially, in CSV order.
+    if processed_row_count < len(rows):
+        row_positions = {id(row): position for position, row in enumerate(rows)}
+        remaining_rows = [row for child_rows in children.values() for row in child_rows]
+        remaining_rows.sort(key=lambda remaining_row: row_positions[id(remaining_row)])
+        remaining_ids = ', '.join([row[id_field] for row in remaining_rows])
+        logging.warning(f"Rows with these IDs have circular 'parent_id' values and were processed sequentially: {remaining_ids}.")
+        for row in remaining_rows:
+            row_function(row)
+
+
+def execute_rows_in_order(config, rows, row_function, result_function):
+    """Process CSV rows concurrently, using up to config['max_workers'] threads, and pass each
+       row's result to result_function, in this thread, in the order the rows appear in the input
+       CSV. At most twice config['max_workers'] rows are being processed or waiting for earlier
+       rows to finish at any time, so results don't accumulate in memory.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        rows : iterable
+            The CSV rows to process, in the order they appear in the input CSV.
+        row_function : function
+            The function that processes a single row. It is passed the row as its only argument.
+        result_function : function
+            The function that receives each row and the value returned by row_function for it.
+        Returns
+        -------
+        None
+    """
+    max_workers = int(config['max_workers'])
+    if max_workers < 2:
+        for row in rows:
+            result_function(row, row_function(row))
+        return
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    pending = collections.deque()
+    try:
+        for row in rows:
+            pending.append((row, executor.submit(row_function, row)))
+            if len(pending) >= max_workers * 2:
+                next_row, future = pending.popleft()
+                # Re-raises any exception (including SystemExit) raised while processing the row.
+                result_function(next_row, future.result())
+        while len(pending) > 0:
+            next_row, future = pending.popleft()
+            result_function(next_row, future.result())
+    except BaseException:
+        for row, future in pending:
+            future.cancel()
+        raise
+    finally:
+        executor.shutdown(wait=True)
+
+
 def get_rollback_csv_filepath(config):
     if config['timestamp_rollback'] is True:
         now_string = EXECUTION_START_TIME.strftime("%Y_%m_%d_%H_%M_%S")
@@ -5902,17 +7979,18 @@ def write_rollback_config(config, path_to_rollback_csv_file):
     else:
         rollback_config_filename = 'rollback.yml'
 
-    rollback_config_file = open(rollback_config_filename, "w")
+    with output_lock:
+        rollback_config_file = open(rollback_config_filename, "w")
 
-    yaml.dump(
-        {'task': 'delete',
-            'host': config['host'],
-            'username': config['username'],
-            'password': config['password'],
-            'input_dir': config['input_dir'],
-            'standalone_media_url': config['standalone_media_url'],
-            'input_csv': os.path.basename(path_to_rollback_csv_file)},
-        rollback_config_file)
+        yaml.dump(
+            {'task': 'delete',
+                'host': config['host'],
+                'username': config['username'],
+                'password': config['password'],
+                'input_dir': config['input_dir'],
+                'standalone_media_url': config['standalone_media_url'],
+                'input_csv': os.path.basename(path_to_rollback_csv_file)},
+            rollback_config_file)
 
 
 def prep_rollback_csv(config, path_to_rollback_csv_file):
@@ -5930,9 +8008,10 @@ def prep_rollback_csv(config, path_to_rollback_csv_file):
 
 def write_rollback_node_id(config, node_id, path_to_rollback_csv_file):
     path_to_rollback_csv_file = get_rollback_csv_filepath(config)
-    rollback_csv_file = open(path_to_rollback_csv_file, "a+")
-    rollback_csv_file.write(str(node_id) + "\n")
-    rollback_csv_file.close()
+    with output_lock:
+        rollback_csv_file = open(path_to_rollback_csv_file, "a+")
+        rollback_csv_file.write(str(node_id) + "\n")
+        rollback_csv_file.close()
 
 
 def get_csv_from_google_sheet(config):
@@ -6133,8 +8212,7 @@ def check_file_exists(config, filename):
     # It's a remote file.
     if filename.startswith('http'):
         try:
-            head_response = requests.head(filename, allow_redirects=True, verify=config['secure_ssl_only'])
-            if head_response.status_code == 200:
+            if get_remote_file_metadata(config, filename)['status_code'] == 200:
                 return True
             else:
                 return False
@@ -6304,31 +8382,345 @@ def get_node_media_ids(config, node_id, media_use_tids=None):
 
 
 def download_remote_file(config, url, file_fieldname, node_csv_row, node_id):
+    downloaded_file_path = get_preprocessed_file_path(config, file_fieldname, node_csv_row, node_id)
+
+    prefetched_file_path = claim_prefetched_remote_file(config, url, file_fieldname, node_csv_row)
+    if prefetched_file_path is not False:
+        shutil.move(prefetched_file_path, downloaded_file_path)
+        return downloaded_file_path
+
+    if stream_file_to_disk(config, url, downloaded_file_path) is False:
+        return False
+
+    return downloaded_file_path
+
+
+def stream_file_to_disk(config, url, file_path):
+    """Download a file in chunks of config['download_chunk_size'] bytes so that only one chunk
+       is held in memory at a time. The file is written to a temporary ".part" file next to
+       file_path and renamed to file_path once it is complete. If the connection drops partway
+       through, the download is resumed using an HTTP Range request (up to config['download_retries']
+       times). If the server reports the file's length, the size of the downloaded file is checked
+       against it. The download's throughput is logged.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        url : string
+            The URL of the file.
+        file_path : string
+            The path to save the file to.
+        Returns
+        -------
+        bool
+            True if the file was downloaded, False if not.
+    """
     sections = urllib.parse.urlparse(url)
-    try:
-        response = requests.get(url, allow_redirects=True, verify=config['secure_ssl_only'])
-    except requests.exceptions.Timeout as err_timeout:
-        message = 'Workbench timed out trying to reach ' + \
-            sections.netloc + ' while connecting to ' + url + '. Please verify that URL and check your network connection.'
-        logging.error(message)
-        logging.error(err_timeout)
-        print('Error: ' + message)
+    partial_file_path = file_path + '.part'
+    chunk_size = int(config.get('download_chunk_size', 1024 * 1024))
+    retries = int(config.get('download_retries', 3))
+    # "no-store" keeps requests_cache from holding the entire response in memory.
+    headers = {'Cache-Control': 'no-store'}
+    expected_length = None
+    bytes_written = 0
+    attempt = 0
+    start_time = time.perf_counter()
+
+    with open(partial_file_path, 'wb') as f:
+        while True:
+            if bytes_written > 0:
+                headers['Range'] = f'bytes={bytes_written}-'
+            else:
+                headers.pop('Range', None)
+            try:
+                session = get_http_session(config, url)
+                with session.get(url, allow_redirects=True, verify=config['secure_ssl_only'], headers=headers, stream=True) as response:
+                    if response.status_code == 206:
+                        # Content-Range looks like "bytes 1000-4999/5000".
+                        total_length = response.headers.get('Content-Range', '').rpartition('/')[2]
+                        if value_is_numeric(total_length):
+                            expected_length = int(total_length)
+                    elif response.status_code == 200:
+                        # The server sent the whole file, either because this is the first
+                        # attempt or because it doesn't support Range requests.
+                        f.seek(0)
+                        f.truncate()
+                        bytes_written = 0
+                        expected_length = None
+                        if response.headers.get('Content-Encoding', 'identity') == 'identity' and value_is_numeric(response.headers.get('Content-Length', '')):
+                            expected_length = int(response.headers['Content-Length'])
+                    else:
+                        message = f'Attempt to download file from {url} returned a {response.status_code} HTTP response.'
+                        logging.error(message)
+                        print('Error: ' + message)
+                        break
+
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        f.write(chunk)
+                        bytes_written += len(chunk)
+            except requests.exceptions.Timeout as err_timeout:
+                logging.warning(f'Download of {url} timed out after {bytes_written} bytes: {err_timeout}')
+                error_message = 'Workbench timed out trying to reach ' + \
+                    sections.netloc + ' while connecting to ' + url + '. Please verify that URL and check your network connection.'
+            except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError) as error_connection:
+                logging.warning(f'Download of {url} was interrupted after {bytes_written} bytes: {error_connection}')
+                error_message = 'Workbench cannot connect to ' + \
+                    sections.netloc + ' while connecting to ' + url + '. Please verify that URL and check your network connection.'
+            else:
+                if expected_length is None or bytes_written == expected_length:
+                    f.close()
+                    os.replace(partial_file_path, file_path)
+                    elapsed = max(time.perf_counter() - start_time, 0.000001)
+                    logging.info(f'Downloaded {url} to "{file_path}" ({bytes_written} bytes in {elapsed:.2f} seconds, ' +
+                                 f'{bytes_written / elapsed:.0f} bytes/sec).')
+                    return True
+                logging.warning(f'Download of {url} ended after {bytes_written} of {expected_length} bytes.')
+                error_message = f'File downloaded from {url} is incomplete ({bytes_written} of {expected_length} bytes).'
+
+            attempt += 1
+            if attempt > retries:
+                logging.error(error_message)
+                print('Error: ' + error_message)
+                break
+            logging.info(f'Resuming download of {url} from byte {bytes_written} (retry {attempt} of {retries}).')
+
+    if os.path.exists(partial_file_path):
+        os.remove(partial_file_path)
+    return False
+
+
+def start_remote_file_prefetch(config, csv_data):
+    """Start downloading the remote files named in the 'file' and 'additional_files' columns of
+       upcoming CSV rows in a background thread, so they are (ideally) already on disk when
+       create_file() needs them. Files are downloaded in CSV row order, at most
+       config['prefetch_remote_files'] files and config['prefetch_remote_files_max_bytes'] bytes
+       ahead of the rows being processed (files count against the byte limit from the start of
+       their download, using their Content-Length; a file that is larger than the limit is
+       downloaded on its own). Prefetched files are handed over to download_remote_file(),
+       which moves them to the same paths they would otherwise have been downloaded to.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        csv_data : csv.DictReader|list
+            The CSV rows that will be processed.
+        Returns
+        -------
+        bool
+            True if the prefetch was started, False if it is not enabled.
+    """
+    if not config.get('prefetch_remote_files') or config['nodes_only'] is True:
         return False
-    except requests.exceptions.ConnectionError as error_connection:
-        message = 'Workbench cannot connect to ' + \
-            sections.netloc + ' while connecting to ' + url + '. Please verify that URL and check your network connection.'
-        logging.error(message)
-        logging.error(error_connection)
-        print('Error: ' + message)
+
+    file_fieldnames = ['file']
+    if 'additional_files' in config:
+        file_fieldnames.extend(get_additional_files_config(config).keys())
+
+    # Work out each file's position in the CSV up front so rows that ask for their
+    # files can tell which prefetched files belong to rows that have been passed over.
+    files_to_prefetch = list()
+    positions = dict()
+    for position, row in enumerate(csv_data):
+        for file_fieldname in file_fieldnames:
+            url = (row.get(file_fieldname) or '').strip()
+            if not url.startswith('http') or get_oembed_url_media_type(config, url) is not None:
+                continue
+            key = get_remote_file_prefetch_key(config, file_fieldname, row, url)
+            if key not in positions:
+                positions[key] = position
+                files_to_prefetch.append((key, url))
+
+    with remote_file_prefetch['condition']:
+        remote_file_prefetch['entries'] = dict()
+        remote_file_prefetch['positions'] = positions
+        remote_file_prefetch['claimed_position'] = -1
+        remote_file_prefetch['unclaimed_count'] = 0
+        remote_file_prefetch['unclaimed_bytes'] = 0
+        remote_file_prefetch['stopped'] = False
+        remote_file_prefetch['directory'] = tempfile.mkdtemp(prefix='workbench_prefetch_', dir=config['temp_dir'])
+
+    remote_file_prefetch['thread'] = threading.Thread(target=prefetch_remote_files, args=(config, files_to_prefetch), daemon=True)
+    remote_file_prefetch['thread'].start()
+    logging.info(f"Prefetching up to {config['prefetch_remote_files']} remote files in the background.")
+    return True
+
+
+def prefetch_remote_files(config, files_to_prefetch):
+    """Body of the thread started by start_remote_file_prefetch().
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        files_to_prefetch : list
+            Tuples containing the prefetch key (see get_remote_file_prefetch_key()) and URL
+            of each remote file, in CSV row order.
+        Returns
+        -------
+        None
+    """
+    condition = remote_file_prefetch['condition']
+    max_count = int(config['prefetch_remote_files'])
+    max_bytes = int(config.get('prefetch_remote_files_max_bytes', 1024 * 1024 * 1024))
+    for key, url in files_to_prefetch:
+        position = remote_file_prefetch['positions'][key]
+        # Files count against max_bytes while they are downloading, so the limit
+        # covers the file in progress as well as the ones waiting to be claimed.
+        expected_size = get_prefetched_remote_file_expected_size(config, url)
+        with condition:
+            while remote_file_prefetch['stopped'] is False and (remote_file_prefetch['unclaimed_count'] >= max_count or
+                                                                 (remote_file_prefetch['unclaimed_count'] > 0 and remote_file_prefetch['unclaimed_bytes'] + expected_size > max_bytes)):
+                if prefetched_remote_file_is_unneeded(config, key, position):
+                    break
+                condition.wait()
+            if remote_file_prefetch['stopped'] is True:
+                return
+            if prefetched_remote_file_is_unneeded(config, key, position):
+                continue
+            path = os.path.join(remote_file_prefetch['directory'], hashlib.sha1(repr(key).encode()).hexdigest())
+            entry = {'position': position, 'status': 'downloading', 'path': path, 'size': expected_size}
+            remote_file_prefetch['entries'][key] = entry
+            remote_file_prefetch['unclaimed_count'] += 1
+            remote_file_prefetch['unclaimed_bytes'] += expected_size
+
+        try:
+            downloaded = stream_file_to_disk(config, url, path)
+        except Exception as e:
+            # E.g., the prefetch directory was removed by stop_remote_file_prefetch().
+            logging.warning(f'Prefetch of remote file {url} failed: {e}')
+            downloaded = False
+
+        with condition:
+            remote_file_prefetch['unclaimed_bytes'] -= entry['size']
+            if downloaded is True and entry['status'] == 'downloading':
+                entry['status'] = 'done'
+                entry['size'] = os.path.getsize(path)
+                remote_file_prefetch['unclaimed_bytes'] += entry['size']
+            else:
+                entry['status'] = 'failed'
+                entry['size'] = 0
+                remote_file_prefetch['unclaimed_count'] -= 1
+            condition.notify_all()
+
+
+def get_prefetched_remote_file_expected_size(config, url):
+    """Get the size of a remote file from its Content-Length header, or 0 if the server
+       doesn't report it. The HEAD request's results are cached by get_remote_file_metadata(),
+       so create_file() doesn't repeat it.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        url : string
+            The URL of the remote file.
+        Returns
+        -------
+        int
+            The file's expected size in bytes.
+    """
+    try:
+        metadata = get_remote_file_metadata(config, url)
+    except requests.exceptions.RequestException as e:
+        logging.warning(f'Could not get the size of remote file {url} before prefetching it: {e}')
+        return 0
+    if metadata['status_code'] != 200 or metadata['content_length'] is None:
+        return 0
+    return metadata['content_length']
+
+
+def prefetched_remote_file_is_unneeded(config, key, position):
+    """Skip files that rows have already asked for, and files for rows that have been passed
+       over. Must be called while holding remote_file_prefetch['condition'].
+    """
+    return key in remote_file_prefetch['entries'] or position < remote_file_prefetch['claimed_position'] - int(config['max_workers'])
+
+
+def get_remote_file_prefetch_key(config, file_fieldname, node_csv_row, url):
+    return (node_csv_row.get(config['id_field']), file_fieldname, url)
+
+
+def claim_prefetched_remote_file(config, url, file_fieldname, node_csv_row):
+    """Get the local path of a remote file downloaded by prefetch_remote_files(), waiting
+       for the download to finish if it is in progress. Prefetched files for rows that
+       are well behind this one (e.g. because their node could not be created) are deleted.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        url : string
+            The URL of the file.
+        file_fieldname: string
+            The name of the CSV column containing the URL.
+        node_csv_row : OrderedDict
+            The CSV row for the current item.
+        Returns
+        -------
+        string|bool
+            The path to the prefetched file, or False if the file was not prefetched.
+    """
+    if remote_file_prefetch['thread'] is None:
         return False
 
-    downloaded_file_path = get_preprocessed_file_path(config, file_fieldname, node_csv_row, node_id)
+    condition = remote_file_prefetch['condition']
+    key = get_remote_file_prefetch_key(config, file_fieldname, node_csv_row, url)
+    with condition:
+        position = remote_file_prefetch['positions'].get(key)
+        if position is None:
+            return False
 
-    f = open(downloaded_file_path, 'wb+')
-    f.write(response.content)
-    f.close()
+        remote_file_prefetch['claimed_position'] = max(remote_file_prefetch['claimed_position'], position)
+        for other_key, other_entry in remote_file_prefetch['entries'].items():
+            if other_key != key and other_entry['status'] == 'done' and other_entry['position'] < position - int(config['max_workers']):
+                discard_prefetched_remote_file(other_entry)
+        condition.notify_all()
+
+        entry = remote_file_prefetch['entries'].get(key)
+        if entry is None:
+            # The prefetch hasn't reached this file; make sure it skips it.
+            remote_file_prefetch['entries'][key] = {'position': position, 'status': 'claimed', 'path': None, 'size': 0}
+            return False
+        while entry['status'] == 'downloading':
+            condition.wait()
+        if entry['status'] != 'done':
+            return False
+
+        discard_prefetched_remote_file(entry, delete=False)
+        condition.notify_all()
+
+    return entry['path']
 
-    return downloaded_file_path
+
+def discard_prefetched_remote_file(entry, delete=True):
+    """Removes a prefetched file from the prefetch's lookahead. Must be called while
+       holding remote_file_prefetch['condition'].
+    """
+    entry['status'] = 'claimed'
+    remote_file_prefetch['unclaimed_count'] -= 1
+    remote_file_prefetch['unclaimed_bytes'] -= entry['size']
+    if delete is True and os.path.exists(entry['path']):
+        os.remove(entry['path'])
+
+
+def stop_remote_file_prefetch(timeout=60):
+    """Stops the background download of remote files and deletes any prefetched files
+       that were not used. Waits up to timeout seconds for a download that is in progress
+       to finish before deleting them.
+    """
+    if remote_file_prefetch['thread'] is None:
+        return
+
+    with remote_file_prefetch['condition']:
+        remote_file_prefetch['stopped'] = True
+        remote_file_prefetch['condition'].notify_all()
+    remote_file_prefetch['thread'].join(timeout)
+    if remote_file_prefetch['thread'].is_alive():
+        logging.warning(f'Remote file prefetch did not stop within {timeout} seconds; removing its directory anyway.')
+    remote_file_prefetch['thread'] = None
+    shutil.rmtree(remote_file_prefetch['directory'], ignore_errors=True)
 
 
 def get_remote_file_extension(config, file_url):
@@ -6341,28 +8733,18 @@ def get_remote_file_extension(config, file_url):
     if len(extension) > 0:
         return '.' + extension
 
-    # If it doesn't have an extension, assign one based on its MIME type. Request's docs at
-    # https://requests.readthedocs.io/en/latest/user/quickstart/#response-headers say that
-    # headers can be accessed regardless of capitalization, but that's not the case (ha).
-    try:
-        head_response = requests.head(file_url, allow_redirects=True, verify=config['secure_ssl_only'])
-        mimetype = head_response.headers['Content-Type']
-        if mimetype is None:
-            mimetype = head_response.headers['content-type']
-            if mimetype is None:
-                message = f'Cannot reliably get MIME type of file "{file_url}" from remote server.'
-                logging.error(message)
-                sys.exit("Error: " + message)
-
-        # In case servers return stuff beside the MIME type in Content-Type header.
-        # Assumes they use ; to separate stuff and that what we're looking for is
-        # in the first position.
-        if ';' in mimetype:
-            mimetype_parts = mimetype.split(';')
-            mimetype = mimetype_parts[0].strip()
-    except KeyError:
+    # If it doesn't have an extension, assign one based on its MIME type.
+    mimetype = get_remote_file_metadata(config, file_url)['content_type']
+    if mimetype is None:
         mimetype = 'application/octet-stream'
 
+    # In case servers return stuff beside the MIME type in Content-Type header.
+    # Assumes they use ; to separate stuff and that what we're looking for is
+    # in the first position.
+    if ';' in mimetype:
+        mimetype_parts = mimetype.split(';')
+        mimetype = mimetype_parts[0].strip()
+
     extension_with_dot = get_extension_from_mimetype(config, mimetype)
 
     if extension_with_dot is None:
@@ -6394,6 +8776,9 @@ def download_file_from_drupal(config, node_id):
     if not os.path.exists(config['export_file_directory']):
         try:
             os.mkdir(config['export_file_directory'])
+        except FileExistsError:
+            # Another export_csv worker created it first.
+            pass
         except Exception as e:
             message = 'Path in configuration option "export_file_directory" ("' + config['export_file_directory'] + '") is not writable.'
             logging.error(message + ' ' + str(e))
@@ -6427,15 +8812,16 @@ def download_file_from_drupal(config, node_id):
                     if len(media[file_field_name]) and media['field_media_use'][0]['target_id'] == config['export_file_media_use_term_id']:
                         url_filename = os.path.basename(media[file_field_name][0]['url'])
                         downloaded_file_path = os.path.join(config['export_file_directory'], url_filename)
-                        if os.path.exists(downloaded_file_path):
-                            downloaded_file_path = get_deduped_file_path(downloaded_file_path)
-                        f = open(downloaded_file_path, 'wb+')
+                        # Claim the path by creating an empty file so concurrent workers don't pick the same one.
+                        while True:
+                            try:
+                                open(downloaded_file_path, 'x').close()
+                                break
+                            except FileExistsError:
+                                downloaded_file_path = get_deduped_file_path(downloaded_file_path)
                         # User needs to be anonymous since authenticated users are getting 403 responses. Probably something in
                         # Drupal's FileAccessControlHandler code is doing this.
-                        file_download_response = requests.get(media[file_field_name][0]['url'], allow_redirects=True, verify=config['secure_ssl_only'])
-                        if file_download_response.status_code == 200:
-                            f.write(file_download_response.content)
-                            f.close()
+                        if stream_file_to_disk(config, media[file_field_name][0]['url'], downloaded_file_path) is True:
                             filename_for_logging = os.path.basename(downloaded_file_path)
                             logging.info(f'File "{filename_for_logging}" downloaded for node {node_id}.')
                             if os.path.isabs(config['export_file_directory']):
@@ -6443,8 +8829,10 @@ def download_file_from_drupal(config, node_id):
                             else:
                                 return filename_for_logging
                         else:
+                            if os.path.exists(downloaded_file_path):
+                                os.remove(downloaded_file_path)
                             message = f"File at {media[file_field_name][0]['url']} (part of media for node {node_id}) could " + \
-                                f"not be downloaded (HTTP response code {file_download_response.status_code})."
+                                "not be downloaded. See log for more detail."
                             logging.error(message)
                             return False
                     else:
@@ -6500,21 +8888,200 @@ def get_file_hash_from_local(config, file_path, algorithm):
         string
             The requested hash.
     """
-    if algorithm == 'md5':
-        hash_object = hashlib.md5()
-    if algorithm == 'sha1':
-        hash_object = hashlib.sha1()
-    if algorithm == 'sha256':
-        hash_object = hashlib.sha256()
+    return get_file_hashes(config, file_path, [algorithm])[algorithm]
 
-    with open(file_path, 'rb') as file:
-        while True:
-            chunk = file.read(hash_object.block_size)
-            if not chunk:
-                break
-            hash_object.update(chunk)
 
-    return hash_object.hexdigest()
+def get_file_hashes(config, file_path, algorithms):
+    """Get one or more hashes/checksums of a file, reading the file at most once. Hashes are
+       cached for the rest of the run, and, if config['cache_file_hashes'] is True, in the SQLite
+       database in config['temp_dir'] so they can be reused by later Workbench sessions (e.g., the
+       run that follows --check). Cached hashes are keyed by the file's path, size, and modification
+       time, so they are recomputed if the file changes.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        file_path : string
+            The file's path.
+        algorithms : list
+            Any of 'md5', 'sha1', or 'sha256'.
+        Returns
+        -------
+        dict
+            The requested hashes, keyed by algorithm.
+    """
+    file_path = os.path.abspath(file_path)
+    file_stat = os.stat(file_path)
+    file_key = (file_path, file_stat.st_size, file_stat.st_mtime_ns)
+
+    hashes = dict()
+    for algorithm in algorithms:
+        if file_key + (algorithm,) in file_hash_cache:
+            hashes[algorithm] = file_hash_cache[file_key + (algorithm,)]
+        elif config.get('cache_file_hashes') is True:
+            cached_hash = get_file_hash_from_cache(config, file_key, algorithm)
+            if cached_hash is not False:
+                hashes[algorithm] = file_hash_cache[file_key + (algorithm,)] = cached_hash
+
+    algorithms_to_compute = [algorithm for algorithm in algorithms if algorithm not in hashes]
+    if len(algorithms_to_compute) > 0:
+        hash_objects = [hashlib.new(algorithm) for algorithm in algorithms_to_compute]
+        buffer = bytearray(config.get('hash_read_buffer_size', 4 * 1024 * 1024))
+        buffer_view = memoryview(buffer)
+        with open(file_path, 'rb', buffering=0) as file:
+            while True:
+                num_bytes_read = file.readinto(buffer)
+                if not num_bytes_read:
+                    break
+                for hash_object in hash_objects:
+                    hash_object.update(buffer_view[:num_bytes_read])
+        for algorithm, hash_object in zip(algorithms_to_compute, hash_objects):
+            add_file_hash_to_cache(config, file_key, algorithm, hash_object.hexdigest())
+            hashes[algorithm] = hash_object.hexdigest()
+
+    return hashes
+
+
+def add_file_hash_to_cache(config, file_key, algorithm, file_hash):
+    """Cache a file's hash for the rest of the run and, if config['cache_file_hashes']
+       is True, for later Workbench sessions.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        file_key : tuple
+            The file's absolute path, size, and modification time (in nanoseconds).
+        algorithm : string
+            One of 'md5', 'sha1', or 'sha256'.
+        file_hash : string
+            The hash.
+        Returns
+        -------
+        None
+    """
+    file_hash_cache[file_key + (algorithm,)] = file_hash
+    if config.get('cache_file_hashes') is True:
+        prepare_file_hash_cache(config)
+        query = "INSERT OR REPLACE INTO file_hash_cache (path, size, mtime_ns, algorithm, hash) VALUES (?, ?, ?, ?, ?)"
+        sqlite_manager(config, operation='insert', query=query, values=file_key + (algorithm, file_hash), db_file_path=config['sqlite_db_filename'])
+
+
+def prepare_file_hash_cache(config):
+    """Creates the table in the SQLite database in config['temp_dir'] used to cache
+       file hashes across Workbench sessions.
+    """
+    create_table_sql = "CREATE TABLE file_hash_cache (timestamp TIMESTAMP DEFAULT (datetime('now','localtime')) NOT NULL, " + \
+        "path TEXT, size INTEGER, mtime_ns INTEGER, algorithm TEXT, hash TEXT, PRIMARY KEY (path, algorithm))"
+    sqlite_manager(config, operation='create_table', table_name='file_hash_cache', query=create_table_sql, db_file_path=config['sqlite_db_filename'])
+
+
+def get_file_hash_from_cache(config, file_key, algorithm):
+    """Get a file's hash cached in a previous Workbench session.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        file_key : tuple
+            The file's absolute path, size, and modification time (in nanoseconds).
+        algorithm : string
+            One of 'md5', 'sha1', or 'sha256'.
+        Returns
+        -------
+        string|bool
+            The cached hash, or False if the file's hash is not cached or the
+            file has changed since it was cached.
+    """
+    prepare_file_hash_cache(config)
+    query = "select size, mtime_ns, hash from file_hash_cache where path = ? and algorithm = ?"
+    res = sqlite_manager(config, operation='select', query=query, values=(file_key[0], algorithm), db_file_path=config['sqlite_db_filename'])
+    if len(res) == 0:
+        return False
+    if (res[0]['size'], res[0]['mtime_ns']) != file_key[1:]:
+        return False
+    return res[0]['hash']
+
+
+class HashingFileReader():
+    """Wraps a file opened in binary mode and hashes the bytes as they are read from it,
+       e.g. while Requests streams the file to Drupal, so the file doesn't need to be
+       read again to get its hash. Seeking back to the start of the file (as Requests
+       does before re-sending a body) starts the hashes over. Reads return at least
+       config['upload_chunk_size'] bytes (until the end of the file), rather than the
+       small blocks the HTTP client asks for, to reduce the number of reads and sends.
+    """
+    def __init__(self, config, file, algorithms):
+        """Parameters
+           ----------
+            config : dict
+                The configuration settings defined by workbench_config.get_config().
+            file : file object
+                A file opened with open(path, 'rb').
+            algorithms : list
+                Any of 'md5', 'sha1', or 'sha256'.
+        """
+        self.config = config
+        self.file = file
+        # Requests inspects these when working out the request's Content-Length.
+        self.name = file.name
+        self.mode = file.mode
+        self.algorithms = algorithms
+        self.chunk_size = int(config.get('upload_chunk_size', 1024 * 1024))
+        file_stat = os.fstat(file.fileno())
+        self.file_key = (os.path.abspath(file.name), file_stat.st_size, file_stat.st_mtime_ns)
+        self.reset()
+
+    def reset(self):
+        self.hash_objects = [hashlib.new(algorithm) for algorithm in self.algorithms]
+        self.position = 0
+
+    def read(self, size=-1):
+        if size is not None and size >= 0:
+            size = max(size, self.chunk_size)
+        chunk = self.file.read(size)
+        # Only bytes read sequentially from the start of the file are hashed.
+        if self.position is not None:
+            for hash_object in self.hash_objects:
+                hash_object.update(chunk)
+            self.position += len(chunk)
+        return chunk
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        position = self.file.seek(offset, whence)
+        if position == 0:
+            self.reset()
+        elif position != self.position:
+            self.position = None
+        return position
+
+    def tell(self):
+        return self.file.tell()
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_hashes(self):
+        """Returns the hashes, keyed by algorithm, if the whole file has been read,
+           and adds them to the file hash cache. Returns False if not.
+        """
+        if self.position != self.file_key[1]:
+            return False
+        hashes = dict()
+        for algorithm, hash_object in zip(self.algorithms, self.hash_objects):
+            hashes[algorithm] = hash_object.hexdigest()
+            add_file_hash_to_cache(self.config, self.file_key, algorithm, hashes[algorithm])
+        return hashes
 
 
 def create_temp_dir(config):
@@ -6890,10 +9457,7 @@ def calculate_response_time_trend(config, response_time):
             The average response time of the most recent 20 requests.
     """
     http_response_times.append(response_time)
-    if len(http_response_times) > 20:
-        sample = http_response_times[-20:]
-    else:
-        sample = http_response_times
+    sample = list(http_response_times)
     if config['log_response_time_sample'] is True:
         logging.info("Response time trend sample: %s", sample)
     if len(sample) > 0:
@@ -7384,31 +9948,322 @@ def sqlite_manager(config, operation='select', table_name=None, query=None, valu
             sys.exit(f'Error executing SQLite query against database at {db_path}: {e}')
 
 
+def get_csv_id_to_node_id_map_connection(config):
+    """Returns the long-lived connection to the SQLite database used to map CSV row IDs
+       to newly created node IDs, opening it (in WAL mode) the first time it is needed.
+       Callers that use the connection must hold output_lock.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        Returns
+        -------
+        sqlite3.Connection|None
+            The connection, or None if config['csv_id_to_node_id_map_path'] is False.
+    """
+    if config['csv_id_to_node_id_map_path'] is False:
+        return None
+    if os.path.isabs(config['csv_id_to_node_id_map_path']):
+        db_path = config['csv_id_to_node_id_map_path']
+    else:
+        db_path = os.path.join(config['temp_dir'], config['csv_id_to_node_id_map_path'])
+
+    with output_lock:
+        store = csv_id_to_node_id_map_store
+        if store['connection'] is None or store['path'] != db_path:
+            close_csv_id_to_node_id_map()
+            connection = sqlite3.connect(db_path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            store['path'] = db_path
+            store['connection'] = connection
+            store['pending'] = []
+            store['last_flush'] = time.time()
+            store['view'] = None
+        return store['connection']
+
+
 def prepare_csv_id_to_node_id_map(config):
-    """Creates the SQLite database used to map CSV row IDs to newly create node IDs.
+    """Creates the SQLite database used to map CSV row IDs to newly create node IDs,
+       and the indexes used to look up entries in it.
     """
     if config['csv_id_to_node_id_map_path'] is False:
         return None
-    create_table_sql = "CREATE TABLE csv_id_to_node_id_map (timestamp TIMESTAMP DEFAULT (datetime('now','localtime')) NOT NULL, " + \
+    create_table_sql = "CREATE TABLE IF NOT EXISTS csv_id_to_node_id_map (timestamp TIMESTAMP DEFAULT (datetime('now','localtime')) NOT NULL, " + \
         " config_file TEXT, parent_csv_id TEXT, parent_node_id, csv_id TEXT, node_id TEXT)"
-    sqlite_manager(config, operation='create_table', table_name='csv_id_to_node_id_map', query=create_table_sql, db_file_path=config['csv_id_to_node_id_map_path'])
+    with output_lock:
+        connection = get_csv_id_to_node_id_map_connection(config)
+        try:
+            connection.execute(create_table_sql)
+            for column in ['csv_id', 'parent_csv_id', 'config_file']:
+                connection.execute(f"CREATE INDEX IF NOT EXISTS csv_id_to_node_id_map_{column} ON csv_id_to_node_id_map ({column})")
+            connection.commit()
+        except sqlite3.OperationalError as e:
+            logging.error(f"Error preparing CSV ID to node ID map at {config['csv_id_to_node_id_map_path']}: {e}")
+            sys.exit(f"Error preparing CSV ID to node ID map at {config['csv_id_to_node_id_map_path']}: {e}")
 
 
 def populate_csv_id_to_node_id_map(config, parent_csv_row_id, parent_node_id, csv_row_id, node_id):
-    """Inserts a row into the SQLite database used to map CSV row IDs to newly create node IDs.
+    """Adds a row to the SQLite database used to map CSV row IDs to newly create node IDs.
+       Rows are written in batches, once 'csv_id_to_node_id_map_batch_size' rows are waiting
+       or 'csv_id_to_node_id_map_flush_interval' seconds have passed since the last write,
+       and when Workbench exits. They are visible to get_node_ids_from_csv_id_to_node_id_map()
+       immediately.
+    """
+    if config['csv_id_to_node_id_map_path'] is False:
+        return None
+    # The timestamp is recorded now rather than when the row is written to the database.
+    timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    entry = (timestamp, config['config_file'], str(parent_csv_row_id), str(parent_node_id), str(csv_row_id), str(node_id))
+    with output_lock:
+        store = csv_id_to_node_id_map_store
+        get_csv_id_to_node_id_map_connection(config)
+        store['pending'].append(entry)
+        if store['view'] is not None:
+            store['view']['csv_id'].setdefault(entry[4], []).append(entry[5])
+            store['view']['parent_csv_id'].setdefault(entry[2], []).append(entry[5])
+        if len(store['pending']) >= config['csv_id_to_node_id_map_batch_size'] or \
+                time.time() - store['last_flush'] >= config['csv_id_to_node_id_map_flush_interval']:
+            flush_csv_id_to_node_id_map()
+
+
+def flush_csv_id_to_node_id_map():
+    """Writes rows added by populate_csv_id_to_node_id_map() that are waiting to be
+       written to the CSV ID to node ID map database.
+    """
+    with output_lock:
+        store = csv_id_to_node_id_map_store
+        if store['connection'] is None or len(store['pending']) == 0:
+            return
+        sql_query = "INSERT INTO csv_id_to_node_id_map (timestamp, config_file, parent_csv_id, parent_node_id, csv_id, node_id) VALUES (?, ?, ?, ?, ?, ?)"
+        try:
+            store['connection'].executemany(sql_query, store['pending'])
+            store['connection'].commit()
+        except sqlite3.OperationalError as e:
+            logging.error(f"Error writing {len(store['pending'])} entries to the CSV ID to node ID map at {store['path']}: {e}")
+            sys.exit(f"Error writing to the CSV ID to node ID map at {store['path']}: {e}")
+        store['pending'] = []
+        store['last_flush'] = time.time()
+
+
+def close_csv_id_to_node_id_map():
+    """Writes any waiting rows to the CSV ID to node ID map database and closes the connection to it.
+    """
+    with output_lock:
+        store = csv_id_to_node_id_map_store
+        if store['connection'] is None:
+            return
+        flush_csv_id_to_node_id_map()
+        store['connection'].close()
+        store['path'] = None
+        store['connection'] = None
+        store['view'] = None
+
+
+# Don't lose batched CSV ID to node ID map entries if Workbench exits early.
+atexit.register(close_csv_id_to_node_id_map)
+
+
+def get_node_ids_from_csv_id_to_node_id_map(config, csv_id, column='csv_id', latest_only=False):
+    """Looks up the node IDs in the CSV ID to node ID map that correspond to a CSV ID. The map
+       is read from the database the first time this function is called and kept in memory,
+       along with the rows added since then by populate_csv_id_to_node_id_map().
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        csv_id : string
+            The CSV ID to look up.
+        column : string
+            The map column to match the CSV ID against, either 'csv_id' or 'parent_csv_id'.
+        latest_only : boolean
+            If True, return only the most recently added node ID.
+        Returns
+        -------
+        list
+            The matching node IDs, oldest first.
     """
     if config['csv_id_to_node_id_map_path'] is False:
+        return []
+    with output_lock:
+        store = csv_id_to_node_id_map_store
+        connection = get_csv_id_to_node_id_map_connection(config)
+        if store['view'] is None:
+            flush_csv_id_to_node_id_map()
+            view = {'csv_id': dict(), 'parent_csv_id': dict()}
+            try:
+                query = "SELECT parent_csv_id, csv_id, node_id FROM csv_id_to_node_id_map ORDER BY timestamp, rowid"
+                for map_row in connection.execute(query):
+                    view['csv_id'].setdefault(map_row['csv_id'], []).append(map_row['node_id'])
+                    view['parent_csv_id'].setdefault(map_row['parent_csv_id'], []).append(map_row['node_id'])
+            except sqlite3.OperationalError as e:
+                logging.error(f"Error reading the CSV ID to node ID map at {store['path']}: {e}")
+                sys.exit(f"Error reading the CSV ID to node ID map at {store['path']}: {e}")
+            store['view'] = view
+        node_ids = store['view'][column].get(str(csv_id), [])
+        if latest_only is True:
+            return node_ids[-1:]
+        return list(node_ids)
+
+
+def get_resume_journal_path(config):
+    """Returns the path to the resume journal for the current configuration file and task. The
+       journal is in config['temp_dir'] and its name includes a hash of the configuration file's
+       path, so a later run using the same configuration file can find it.
+    """
+    config_file_path_hash = hashlib.md5(os.path.abspath(config['config_file']).encode()).hexdigest()[:8]
+    config_file_name = os.path.splitext(os.path.basename(config['config_file']))[0]
+    return os.path.join(config['temp_dir'], f"{config_file_name}.{config_file_path_hash}.{config['task']}.resume_journal.db")
+
+
+def prepare_resume_journal(config, resume=False):
+    """Opens the journal that records the stages (node created, file uploaded, media created,
+       etc.) completed for each CSV row. If 'resume' is True, the stages recorded by the previous
+       run using the same configuration file are loaded so they can be skipped; otherwise the
+       journal is emptied.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        resume : boolean
+            Whether the --resume option was used.
+        Returns
+        -------
+        None
+    """
+    if config['resume_journal'] is False:
+        if resume is True:
+            message = 'The --resume option has no effect because the "resume_journal" configuration setting is false.'
+            print('Warning: ' + message)
+            logging.warning(message)
+        return
+
+    db_path = get_resume_journal_path(config)
+    with output_lock:
+        close_resume_journal()
+        store = resume_journal_store
+        try:
+            connection = sqlite3.connect(db_path, check_same_thread=False)
+            # In WAL mode with synchronous=FULL, each commit (i.e., each batch of stages) is fsync'd once.
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=FULL')
+            connection.execute("CREATE TABLE IF NOT EXISTS resume_journal (timestamp TIMESTAMP DEFAULT (datetime('now','localtime')) NOT NULL, " +
+                               "row_key TEXT NOT NULL, stage TEXT NOT NULL, value TEXT, PRIMARY KEY (row_key, stage))")
+            store['stages'] = dict()
+            if resume is True:
+                for row_key, stage, value in connection.execute("SELECT row_key, stage, value FROM resume_journal"):
+                    store['stages'].setdefault(row_key, dict())[stage] = value
+            else:
+                connection.execute("DELETE FROM resume_journal")
+            connection.commit()
+        except sqlite3.OperationalError as e:
+            logging.error(f"Error preparing resume journal at {db_path}: {e}")
+            sys.exit(f"Error preparing resume journal at {db_path}: {e}")
+        store['path'] = db_path
+        store['connection'] = connection
+        store['pending'] = []
+        store['last_flush'] = time.time()
+
+    if resume is True:
+        message = f"Resuming previous run: the journal at {db_path} has completed stages for {len(store['stages'])} CSV rows, which will not be repeated."
+        print(message)
+        logging.info(message)
+    else:
+        logging.info(f"Recording completed work in resume journal at {db_path}.")
+
+
+def get_resume_journal_key(config, row):
+    """Returns the key used to identify a CSV row in the resume journal. In 'create' tasks, this is
+       the row's ID; in other tasks, the same node can appear in more than one row, so a hash of the
+       row's values is appended to the ID. Returns None if the resume journal isn't enabled.
+    """
+    if config['resume_journal'] is False:
+        return None
+    if config['task'] == 'create':
+        return str(row[config['id_field']])
+    return str(row[config['id_field']]) + ':' + get_csv_record_hash(copy.deepcopy(row))
+
+
+def record_resume_journal_stage(config, row_key, stage, value=''):
+    """Records that a stage of the work for a CSV row has been completed. Stages are written to
+       the journal in batches, once 'resume_journal_batch_size' stages are waiting or
+       'resume_journal_flush_interval' seconds have passed since the last write, and when
+       Workbench exits.
+    """
+    """Parameters
+        ----------
+        config : dict
+            The configuration settings defined by workbench_config.get_config().
+        row_key : string
+            The row's key, from get_resume_journal_key(). If None, nothing is recorded.
+        stage : string
+            The completed stage, e.g. 'node_created' or 'media_created:file'.
+        value : string
+            A value needed to finish the row's remaining stages, e.g. the new node's ID.
+        Returns
+        -------
+        None
+    """
+    if row_key is None:
+        return
+    with output_lock:
+        store = resume_journal_store
+        if store['connection'] is None:
+            return
+        store['stages'].setdefault(row_key, dict())[stage] = str(value)
+        store['pending'].append((row_key, stage, str(value)))
+        if len(store['pending']) >= config['resume_journal_batch_size'] or \
+                time.time() - store['last_flush'] >= config['resume_journal_flush_interval']:
+            flush_resume_journal()
+
+
+def get_resume_journal_stage(row_key, stage):
+    """Returns the value recorded when a stage of the work for a CSV row was completed,
+       or None if the stage has not been completed (or there is no resume journal).
+    """
+    if row_key is None:
         return None
-    sql_query = "INSERT INTO csv_id_to_node_id_map (config_file, parent_csv_id, parent_node_id, csv_id, node_id) VALUES (?, ?, ?, ?, ?)"
-    sqlite_manager(config,
-                   operation='insert',
-                   query=sql_query,
-                   values=(config['config_file'],
-                           str(parent_csv_row_id),
-                           str(parent_node_id),
-                           str(csv_row_id),
-                           str(node_id)), db_file_path=config['csv_id_to_node_id_map_path']
-                   )
+    with output_lock:
+        return resume_journal_store['stages'].get(row_key, dict()).get(stage)
+
+
+def flush_resume_journal():
+    """Writes stages recorded by record_resume_journal_stage() that are waiting to be written to the resume journal.
+    """
+    with output_lock:
+        store = resume_journal_store
+        if store['connection'] is None or len(store['pending']) == 0:
+            return
+        try:
+            store['connection'].executemany("INSERT OR REPLACE INTO resume_journal (row_key, stage, value) VALUES (?, ?, ?)", store['pending'])
+            store['connection'].commit()
+        except sqlite3.OperationalError as e:
+            logging.error(f"Error writing {len(store['pending'])} entries to the resume journal at {store['path']}: {e}")
+            sys.exit(f"Error writing to the resume journal at {store['path']}: {e}")
+        store['pending'] = []
+        store['last_flush'] = time.time()
+
+
+def close_resume_journal():
+    """Writes any waiting stages to the resume journal and closes the connection to it.
+    """
+    with output_lock:
+        store = resume_journal_store
+        if store['connection'] is None:
+            return
+        flush_resume_journal()
+        store['connection'].close()
+        store['path'] = None
+        store['connection'] = None
+        store['stages'] = dict()
+
+
+# Don't lose batched resume journal entries if Workbench exits early.
+atexit.register(close_resume_journal)
 
 
 def get_term_field_values(config, term_id):